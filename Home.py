@@ -1,6 +1,8 @@
 import streamlit as st       #Importiert Streamlit zur Erstellung einer Web-App (Grundvoraussetzung)
-import requests              #Wird für HTTP-Anfragen verwendet
-import urllib                #Wird zur URL-Verarbeitung verwendet
+import hashlib
+import io
+from sportfuel import perf, warmup    #Zeitmessung pro Rerun (nur mit SPORTFUEL_PERF aktiv), Vorwärmen der anderen Seiten
+from sportfuel.calories import fluessigkeit as fluid_need, grundumsatz as harris_benedict    #ohne numpy/pandas, Kader (sportfuel.roster) erst beim Upload
 
 
 # Seiteneinstellungen also Titel, Icon, Layoutbreite -> für eine ästhetische Ansicht
@@ -9,6 +11,7 @@ st.set_page_config(
     page_icon=None,
     layout="wide"
 )
+perf.start_rerun("Home")
 
 st.title("Sport Fuel Guide")                                                                            #Titel der Home-Seite
 st.info("Diese App hilft dir bei der Planung deiner Trainings- und Wettkampfernährung.")                #Infobox unterhalb des Titels
@@ -23,12 +26,9 @@ with st.expander("Gib deine Daten ein"):
         geschlecht = st.selectbox("Geschlecht", ["Männlich", "Weiblich"])
         
 # Grundumsatz & Flüssigkeitsbedarf Berechnungen
-if geschlecht == "Männlich":
-    grundumsatz = 66.47 + (13.7 * gewicht) + (5.0 * groesse) - (6.8 * alter)    #Grundumsatz Kcal abhängig von Geschlecht, Gewicht, Alter und Grösse
-else:                                                                           #Berechnung nach Harris-Benedict Formel. Quelle: Wikipedia, https://de.wikipedia.org/wiki/Grundumsatz
-    grundumsatz = 655.1 + (9.6 * gewicht) + (1.8 * groesse) - (4.7 * alter)
-
-fluessigkeit = gewicht * 0.035                                                  #Berechnung Flüssigkeitsbedarf. Quelle: Migros, https://impuls.migros.ch/de/ernaehrung/nahrungsmittel/getraenke/wasser-trinken
+with perf.stage("baseline"):
+    grundumsatz  = harris_benedict(gewicht, groesse, alter, geschlecht)         #Grundumsatz Kcal abhängig von Geschlecht, Gewicht, Alter und Grösse (Harris-Benedict, sportfuel/calories.py)
+    fluessigkeit = fluid_need(gewicht)                                          #Berechnung Flüssigkeitsbedarf: 0.035 L pro kg
 
 #Speichern der Werte im Session-State, damit sie anschliessend wieder abgerufen werden können.
 st.session_state['gewicht']    = gewicht
@@ -55,6 +55,57 @@ st.session_state.gewicht = gewicht
 st.session_state.grundumsatz = grundumsatz
 st.session_state.fluessigkeit = fluessigkeit
 
+# Kader für Trainer: ganze Teams aus CSV/Parquet, einmal pro Datei berechnet und im Session-State für die anderen Seiten
+# ---------------------
+@st.cache_data(max_entries=8)
+# Kader und verworfene Zeilen pro Datei-Inhalt; _data wird über file_hash identifiziert
+def roster_table(file_hash, _data, filename):
+    perf.mark_miss()
+    from sportfuel.roster import compute_roster, read_roster
+    return compute_roster(read_roster(io.BytesIO(_data), filename))
+
+@st.cache_data(max_entries=8)
+# Export als Bytes, damit der Download-Button nicht bei jedem Rerun die ganze CSV neu schreibt
+def roster_export(file_hash, _roster, fmt):
+    from sportfuel.roster import export_roster
+    return export_roster(_roster, fmt)
+
+with st.expander("Kader hochladen (für Trainer)"):
+    st.caption("CSV oder Parquet mit den Spalten gewicht, groesse, alter, geschlecht (m/w), optional athlet bzw. name. "
+               "Auf den weiteren Seiten kann dann in der Sidebar ein Athlet gewählt werden.")
+    roster_file = st.file_uploader("Kader-Datei", type=["csv", "parquet"])
+    if roster_file is not None:
+        data = roster_file.getvalue()
+        roster_hash = hashlib.sha1(data).hexdigest()
+        try:
+            with perf.stage("roster", cached=True, bytes=len(data)) as s:
+                roster, rejected = roster_table(roster_hash, data, roster_file.name)
+                s.set(rows=len(roster))
+        except Exception as e:
+            st.error(f"Fehler beim Lesen des Kaders: {e}")
+        else:
+            if st.session_state.get("roster_hash") != roster_hash:    #neue Datei: bisherige Auswahl gilt nicht mehr
+                st.session_state.update({"roster": roster, "roster_hash": roster_hash, "athlet_idx": None})
+            if len(rejected):
+                st.warning(f"{len(rejected):,} Zeilen verworfen (fehlende oder ungültige Werte).")
+                st.dataframe(rejected.head(100), hide_index=True)
+    if st.session_state.get("roster") is not None:
+        roster, roster_hash = st.session_state.roster, st.session_state.roster_hash
+        st.success(f"Kader mit {len(roster):,} Athleten geladen.")
+        st.dataframe(roster, hide_index=True)
+        d1, d2, d3 = st.columns(3)
+        d1.download_button("Als CSV herunterladen", roster_export(roster_hash, roster, "csv"),
+                           file_name="kader_grundumsatz.csv", mime="text/csv")
+        d2.download_button("Als Parquet herunterladen", roster_export(roster_hash, roster, "parquet"),
+                           file_name="kader_grundumsatz.parquet", mime="application/octet-stream")
+        if d3.button("Kader entfernen"):
+            for key in ("roster", "roster_hash", "athlet_idx"):
+                st.session_state.pop(key, None)
+            st.rerun()
+
+perf.finish()    #vor der Navigation, st.switch_page beendet den Rerun
+warmup.start()   #Karte, Diagramme und Modell im Hintergrund laden, während der Nutzer seine Daten eingibt
+
 # Navigation zur Vorbereitungsseite (Vor Workout)
 st.markdown("---")
 st.markdown("### Hast du ein Workout geplant?")
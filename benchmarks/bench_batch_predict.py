@@ -0,0 +1,66 @@
+#Durchsatz: Batch-Vorhersage (sportfuel.batch, ein predict pro Block, ohne Tabelle) vs. Einzelpfad der Vor_Workout Seite (ein predict pro Zeile)
+#und Spitzen-Speicher beim Streamen wachsender Dateien. Aufruf aus dem Repo-Root: python benchmarks/bench_batch_predict.py
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from sportfuel.batch import load_calorie_model, predict_file
+from sportfuel.calories import ACTIVITY_MAP
+
+
+def make_plan(path, n, seed=0):
+    rng = np.random.default_rng(seed)
+    dauer = rng.integers(20, 240, n)
+    pd.DataFrame({
+        "sportart": rng.choice(list(ACTIVITY_MAP), n),
+        "gewicht":  rng.integers(50, 100, n),
+        "dauer":    dauer,
+        "distanz":  np.round(dauer * rng.uniform(0.05, 0.3, n), 2),
+    }).to_csv(path, index=False)
+
+
+#So rechnet die Seite heute: ein DataFrame und ein predict pro Einheit
+def per_row(model, df):
+    out = []
+    for r in df.itertuples(index=False):
+        X = pd.DataFrame([{"Activity": ACTIVITY_MAP[r.sportart], "Sportart": r.sportart,
+                           "Gewicht": r.gewicht, "Dauer": r.dauer, "Distanz": r.distanz}])
+        out.append(model.predict(X)[0])
+    return np.asarray(out)
+
+
+def main():
+    model = load_calorie_model(os.path.join(ROOT, "models", "calorie_predictor.pkl"))
+    with tempfile.TemporaryDirectory() as tmp:
+        plan = os.path.join(tmp, "plan.csv")
+        make_plan(plan, 500)
+        df = pd.read_csv(plan)
+        t0 = time.perf_counter()
+        ref = per_row(model, df)
+        t_row = (time.perf_counter() - t0) / len(df)
+        out = os.path.join(tmp, "out.csv")
+        predict_file(plan, out, model)
+        assert np.allclose(pd.read_csv(out)["kcal"].to_numpy(), ref)
+        print(f"Einzelpfad:  {1 / t_row:>10,.0f} Zeilen/s  ({t_row * 1e3:.1f} ms pro Einheit)")
+
+        print(f"\n{'Zeilen':>10}{'Batch (s)':>11}{'Zeilen/s':>12}{'Speedup':>10}{'Peak-Speicher':>16}")
+        for n in [50_000, 200_000, 1_000_000]:
+            make_plan(plan, n)
+            t0 = time.perf_counter()
+            predict_file(plan, out, model)
+            dt = time.perf_counter() - t0
+            tracemalloc.start()
+            predict_file(plan, out, model)
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{n:>10,}{dt:>11.2f}{n / dt:>12,.0f}{t_row * n / dt:>9.0f}x{peak / 1e6:>13.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+#Genauigkeit und Latenz: Interpolation in der Kalorien-Tabelle vs. model.predict der sklearn-Pipeline. Die Genauigkeit
+#wird zusätzlich gegen unabhängige Referenzen gemessen: die Formel, aus der train_model.py die Trainingsdaten erzeugt
+#(Katalog kcal/kg x Aktivitätsfaktor, Distanz spielt keine Rolle), und die Fall-Back-Formel der Seite (Verhältnis).
+#Voraussetzung: python sport-fuel-ml/train_model.py wurde ausgeführt. Aufruf aus dem Repo-Root: python benchmarks/bench_calorie_lookup.py
+import os
+import sys
+import time
+import joblib
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "sport-fuel-ml"))
+from sportfuel.calories import ACTIVITY_MAP, FALLBACK_FAKTOREN, LOOKUP_PATH
+from sportfuel.lookup import LOOKUP_AXES, load_lookup
+from train_model import activity_factors, load_exercise_csv
+
+
+#Zielwert der Trainingsdaten für beliebige Punkte (wie build_training_set, aber Distanz unabhängig von der Dauer)
+def training_formula(acts, gewicht, dauer):
+    raw     = load_exercise_csv()
+    kcal_kg = dict(zip(raw["Activity"], raw["kcal_per_kg"]))
+    faktor, _ = activity_factors(acts)
+    return dauer * gewicht * np.array([kcal_kg.get(a, np.nan) for a in acts]) / 60 * faktor
+
+
+def print_errors(title, est, ref, acts):
+    err = np.abs(est - ref)
+    rel = err / np.maximum(ref, 1)
+    print(title)
+    print(f"  MAE {err.mean():.1f} kcal   P95 {np.percentile(err, 95):.1f} kcal   max {err.max():.1f} kcal   "
+          f"mittlere rel. Abw. {rel.mean() * 100:.2f} %")
+    for sportart, act in ACTIVITY_MAP.items():
+        m = acts == act
+        print(f"  {sportart:<10} MAE {err[m].mean():6.1f} kcal   mittlerer Wert {ref[m].mean():7.0f} kcal")
+
+
+def per_call(fn, repeat=200):
+    fn()
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat
+
+
+def main(n=20000, seed=0):
+    model  = joblib.load(os.path.join(ROOT, "models", "calorie_predictor.pkl"))
+    lookup = load_lookup(os.path.join(ROOT, LOOKUP_PATH))
+    rng = np.random.default_rng(seed)
+
+    #Zufällige Punkte innerhalb des Rasters (Slider-Werte) für jede Sportart
+    acts = rng.choice(list(ACTIVITY_MAP.values()), n)
+    cols = {c: rng.uniform(lo, hi, n) for c, (lo, hi, _) in LOOKUP_AXES.items()}
+    cols["Gewicht"] = np.round(cols["Gewicht"])    #Home.py liefert ganze kg
+    cols["Dauer"]   = np.round(cols["Dauer"])      #Slider in ganzen Minuten
+    X = pd.DataFrame({"Activity": acts, **cols})
+
+    est = lookup.predict(X)
+    print_errors(f"Genauigkeit über {n:,} Zufallspunkte im Raster (Referenz: model.predict)", est, model.predict(X), acts)
+    print_errors("\nReferenz: Trainingsformel (Katalog kcal/kg x Faktor)", est,
+                 training_formula(acts, cols["Gewicht"], cols["Dauer"]), acts)
+
+    print("\nVerhältnis Tabelle / Fall-Back-Formel der Seite (min, Median, max)")
+    for sportart, act in ACTIVITY_MAP.items():
+        m = acts == act
+        ratio = est[m] / (FALLBACK_FAKTOREN[sportart] * cols["Gewicht"][m] * cols["Dauer"][m] / 60)
+        print(f"  {sportart:<10} {ratio.min():6.2f} {np.median(ratio):6.2f} {ratio.max():6.2f}")
+    try:
+        lookup.check()
+        print("Plausibilitätsprüfung der Tabelle: bestanden")
+    except ValueError as e:
+        print(f"Plausibilitätsprüfung der Tabelle: {e}")
+
+    #Einzelabfrage wie auf der Seite: ein Rerun = eine Vorhersage
+    row = X.iloc[0]
+    t_model  = per_call(lambda: model.predict(pd.DataFrame([{"Activity": row.Activity, "Gewicht": row.Gewicht,
+                                                               "Dauer": row.Dauer, "Distanz": row.Distanz}])), 50)
+    t_lookup = per_call(lambda: lookup.predict_arrays(row.Activity, row.Gewicht, row.Dauer, row.Distanz))
+    t0 = time.perf_counter(); model.predict(X); t_model_b = time.perf_counter() - t0
+    t0 = time.perf_counter(); lookup.predict(X); t_lookup_b = time.perf_counter() - t0
+    print(f"\n{'Pfad':<16}{'Einzelabfrage':>16}{f'Batch {n:,}':>16}")
+    print(f"{'model.predict':<16}{t_model * 1e3:>13.2f} ms{t_model_b * 1e3:>13.1f} ms")
+    print(f"{'Tabelle':<16}{t_lookup * 1e6:>13.1f} µs{t_lookup_b * 1e3:>13.1f} ms")
+
+    outside = lookup.predict_arrays(ACTIVITY_MAP["Laufen"], [70, 200, 70], [60, 60, 400], [10, 10, 10])
+    print(f"\nAusserhalb des Rasters -> NaN (Rückfall auf model.predict): {outside}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#Einlesen eines 1000x vergrösserten exercise_dataset.csv: bisherige readlines()-Schleife vs. sportfuel.catalog
+#(blockweise mit pyarrow, ohne und mit Parquet-Cache). Der Katalog enthält zusätzlich quotierte Aktivitäten und kaputte Zeilen.
+#Aufruf aus dem Repo-Root: python benchmarks/bench_catalog_load.py [Faktor]
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+from sportfuel.catalog import load_catalog
+
+CSV_PATH = os.path.join(ROOT, "sport-fuel-ml", "exercise_dataset.csv")
+
+
+#Bisherige Implementierung aus train_model.py als Referenz
+def load_exercise_csv_loop(path):
+    with open(path, encoding="utf-8") as f:
+        lines = f.readlines()
+    data = []
+    for line in lines[1:]:
+        parts = line.strip().split(',')
+        if len(parts) > 6:
+            activity = ",".join(parts[:-5]).strip()
+            try:
+                vals = list(map(float, parts[-5:]))
+                data.append([activity] + vals)
+            except ValueError:
+                continue
+    return pd.DataFrame(data, columns=["Activity", "kcal_130lb", "kcal_155lb", "kcal_180lb", "kcal_205lb", "kcal_per_kg"])
+
+
+#Vervielfacht den Katalog; jede Kopie bekommt eindeutige Namen, jede 10. Kopie eine quotierte und eine kaputte Zeile
+def write_scaled(path, factor):
+    with open(CSV_PATH, encoding="utf-8") as f:
+        header, *rows = f.read().splitlines()
+    rows = [r.split(",")[:-5] and (",".join(r.split(",")[:-5]), ",".join(r.split(",")[-5:])) for r in rows]
+    with open(path, "w", encoding="utf-8") as out:
+        out.write(header + "\n")
+        for k in range(factor):
+            out.write("\n".join(f"{name} #{k},{nums}" for name, nums in rows) + "\n")
+            if k % 10 == 0:
+                out.write(f'"Rowing, stationary, ""light"" #{k}",236,281,327,372,0.82\n')
+                out.write(f"Kaputte Zeile #{k},1,2\n")
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def main():
+    factor = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "catalog.csv")
+        write_scaled(path, factor)
+        mb = os.path.getsize(path) / 1e6
+        cache_dir = os.path.join(tmp, "cache")
+
+        t_loop, df_loop = timed(lambda: load_exercise_csv_loop(path))
+        t_cold, (df_new, bad) = timed(lambda: load_catalog(path, cache_dir=cache_dir))
+        t_warm, (df_warm, _) = timed(lambda: load_catalog(path, cache_dir=cache_dir))
+
+        #Die Schleife liest nur Zeilen mit Komma in der Aktivität und lässt Anführungszeichen stehen;
+        #die übrigen Zeilen müssen in beiden Varianten gleich sein
+        acts = df_new["Activity"].astype(str)
+        same = df_new[acts.str.contains(",") & ~acts.str.contains('"')].reset_index(drop=True)
+        old  = df_loop[~df_loop["Activity"].str.contains('"')].reset_index(drop=True)
+        assert (same["Activity"].astype(str).to_numpy() == old["Activity"].astype(str).to_numpy()).all()
+        assert np.array_equal(same.iloc[:, 1:].to_numpy(), old.iloc[:, 1:].to_numpy())
+        assert df_warm.equals(df_new)
+
+        print(f"Katalog x{factor}: {mb:.1f} MB")
+        print(f"{'Variante':<30}{'Zeit (s)':>10}{'MB/s':>8}{'Zeilen':>11}{'gemeldet verworfen':>20}")
+        print(f"{'readlines-Schleife (bisher)':<30}{t_loop:>10.2f}{mb / t_loop:>8.0f}{len(df_loop):>11,}{'-':>20}")
+        print(f"{'pyarrow-Blöcke, ohne Cache':<30}{t_cold:>10.2f}{mb / t_cold:>8.0f}{len(df_new):>11,}{len(bad):>20,}")
+        print(f"{'Parquet-Cache':<30}{t_warm:>10.2f}{mb / t_warm:>8.0f}{len(df_warm):>11,}{len(bad):>20,}")
+
+
+if __name__ == "__main__":
+    main()
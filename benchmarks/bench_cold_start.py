@@ -0,0 +1,127 @@
+#Kaltstart eines Workers: Latenz des jeweils ersten Reruns pro Seite, Stand vor den verzögerten Imports (--baseline, per
+#git archive entpackt) vs. aktueller Arbeitsbaum ohne und mit Vorwärmen (SPORTFUEL_WARMUP). Jede Variante läuft in einem
+#frischen Prozess: Home, Bedenkzeit (--think-s, Nutzer gibt seine Daten ein), Vor_Workout ohne und mit GPX-Upload
+#(Karte), Warenkorb (Fueling-Chart), Meal Plan (Edamam-Stub, Makro-Diagramme). Dazu die Importkosten pro Modul aus
+#python -X importtime, je in einem eigenen Prozess nach "import streamlit" (importtime verrechnet parallele Imports
+#aus mehreren Threads falsch) und nach welchem Schritt das Modul geladen war.
+#Aufruf aus dem Repo-Root: python benchmarks/bench_cold_start.py [--baseline c6b7a4a] [--think-s 3]
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WATCH = ["streamlit", "pandas", "numpy", "pyarrow", "requests", "folium", "streamlit_folium", "altair",
+         "matplotlib.pyplot", "joblib", "sklearn", "sportfuel.roster", "sportfuel.fdc", "sportfuel.charts"]
+STEPS = ["Home", "Vor_Workout", "GPX-Upload (Karte)", "Warenkorb (Chart)", "Meal Plan"]
+
+
+#Im Kindprozess: eine Session vom ersten Aufruf an, gibt die Zeiten als JSON-Zeile aus
+def child(tree, think_s):
+    os.chdir(tree)
+    sys.path.insert(0, tree)
+    sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+    from stubs import start_edamam_stub
+    from synthetic import make_gpx_bytes
+    _, url = start_edamam_stub(0.05)
+    os.environ["EDAMAM_BASE_URL"] = url
+    gpx = make_gpx_bytes(10_000, seed=3)
+
+    t0 = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    times = {"import streamlit": time.perf_counter() - t0}
+    at = AppTest.from_file(os.path.join(tree, "Home.py"), default_timeout=300)
+
+    loaded = {}
+
+    def step(name):
+        t = time.perf_counter()
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        times[name] = time.perf_counter() - t
+        for m in WATCH:
+            if m in sys.modules:
+                loaded.setdefault(m, name)
+
+    step("Home")
+    time.sleep(think_s)
+    at.switch_page("pages/1_Vor_Workout.py")
+    step("Vor_Workout")
+    at.file_uploader[0].set_value(("route.gpx", gpx, "application/gpx+xml"))
+    step("GPX-Upload (Karte)")
+    at.session_state["cart"] = [{"fdc": 1, "description": "Gel", "grams": 40, "kcal": 100, "carbs": 25}]
+    step("Warenkorb (Chart)")
+    at.switch_page("pages/2_Meal_Plan.py")
+    step("Meal Plan")
+    print(json.dumps({"times": times, "loaded": loaded}))
+
+
+#Startet eine Variante in einem frischen Prozess; gibt (Zeiten pro Schritt, Modul -> Schritt, nach dem es geladen war) zurück
+def run_variant(tree, think_s, warm=True):
+    env = {**os.environ, "SPORTFUEL_CACHE_DB": os.path.join(tree, ".cache", "bench.sqlite"),
+           "SPORTFUEL_FOOD_DB": os.path.join(tree, "keine_food_db.sqlite"), "SPORTFUEL_WARMUP": "1" if warm else "0"}
+    proc = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", tree, "--think-s", str(think_s)],
+                          capture_output=True, text=True, env=env, cwd=tree)
+    if proc.returncode:
+        raise RuntimeError(proc.stderr[-2000:])
+    out = json.loads(proc.stdout.strip().splitlines()[-1])
+    return out["times"], out["loaded"]
+
+
+#Kumulative Importzeit (s) eines Moduls laut -X importtime, in einem frischen Prozess nach "import streamlit"
+def import_cost(name):
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import streamlit; import {name}"],
+                          capture_output=True, text=True, cwd=ROOT)
+    for line in reversed(proc.stderr.splitlines()):
+        if line.startswith("import time:") and line.split("|")[-1].strip() == name:
+            return int(line.split("|")[1]) / 1e6
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baseline", default="c6b7a4a", help="git-Revision vor den verzögerten Imports")
+    parser.add_argument("--think-s", type=float, default=3.0, help="Bedenkzeit auf Home vor dem Seitenwechsel")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.child:
+        return child(args.child, args.think_s)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        base = os.path.join(tmp, "baseline")
+        os.makedirs(base)
+        archive = subprocess.run(["git", "archive", args.baseline], cwd=ROOT, capture_output=True, check=True).stdout
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            tar.extractall(base)
+        os.symlink(os.path.join(ROOT, "models"), os.path.join(base, "models"))    #Modelle sind nicht eingecheckt
+        os.makedirs(os.path.join(base, ".cache"))
+        os.makedirs(os.path.join(ROOT, ".cache"), exist_ok=True)
+
+        variants = {
+            "bisher":              run_variant(base, args.think_s),
+            "verzögert":           run_variant(ROOT, args.think_s, warm=False),
+            "verzögert+vorwärmen": run_variant(ROOT, args.think_s),
+        }
+
+    print(f"Erster Rerun pro Schritt in ms (Bedenkzeit auf Home: {args.think_s:.0f} s)")
+    print(f"{'Schritt':<22}" + "".join(f"{v:>22}" for v in variants))
+    for name in ["import streamlit"] + STEPS:
+        print(f"{name:<22}" + "".join(f"{t[name] * 1e3:>22.0f}" for t, _ in variants.values()))
+    print(f"{'Summe Seiten':<22}" + "".join(f"{sum(t[s] for s in STEPS) * 1e3:>22.0f}" for t, _ in variants.values()))
+
+    print("\nImportkosten pro Modul (-X importtime, nach streamlit) und Schritt, nach dem es geladen war")
+    print(f"{'Modul':<20}{'ms':>6}" + "".join(f"{v:>22}" for v in variants))
+    for name in WATCH:
+        cost = import_cost(name)
+        print(f"{name:<20}{'-' if cost is None else f'{cost * 1e3:.0f}':>6}"
+              + "".join(f"{loaded.get(name, '-'):>22}" for _, loaded in variants.values()))
+
+
+if __name__ == "__main__":
+    main()
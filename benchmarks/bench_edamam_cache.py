@@ -0,0 +1,74 @@
+#Meal Plan gegen einen lokalen Edamam-Stub (300 ms Latenz pro Anfrage): bisher drei Aufrufe nacheinander pro neuer
+#Session (Seed im Cache-Schlüssel), jetzt parallel und danach aus dem gemeinsamen SQLite-Cache, auch nach einem Neustart.
+#Aufruf: python benchmarks/bench_edamam_cache.py
+import os
+import random
+import sys
+import tempfile
+import time
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+from sportfuel.disk_cache import DiskCache
+from sportfuel.edamam import EdamamClient, pick_recipes
+from stubs import start_edamam_stub
+
+MEALS = ["Breakfast", "Lunch", "Dinner"]
+SESSIONS = 5
+
+
+#Bisheriger Weg: requests.get pro Mahlzeittyp nacheinander, Mischen vor dem Cache (jede Session verfehlt ihn)
+def meal_plan_old(base, seed, diets, healths):
+    out = {}
+    for m in MEALS:
+        params = {"type": "public", "app_id": "x", "app_key": "x", "mealType": m, "diet": diets, "health": healths}
+        hits = [h["recipe"] for h in requests.get(base, params=params, timeout=5).json().get("hits", [])]
+        random.Random(seed).shuffle(hits)
+        out[m] = hits[:5]
+    return out
+
+
+def meal_plan(client, seed, diets, healths):
+    all_hits = client.fetch_all(MEALS, diets, healths)
+    return {m: pick_recipes(all_hits[m], seed) for m in MEALS}
+
+
+def sessions(fn, *args):
+    times = []
+    for s in range(SESSIONS):
+        seed = int(time.time() * 1000) + s
+        t0 = time.perf_counter()
+        plan = fn(*args, seed, ["balanced"], ["vegetarian"])
+        times.append(time.perf_counter() - t0)
+        assert all(len(plan[m]) == 5 for m in MEALS)
+    return times
+
+
+def main(delay=0.3):
+    server, base = start_edamam_stub(delay)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "cache.sqlite")
+        print(f"Meal Plan pro neuer Session ({SESSIONS} Sessions, {delay * 1e3:.0f} ms Serverlatenz):")
+        before = server.requests
+        t = sessions(meal_plan_old, base)
+        print(f"  bisher (nacheinander, Seed im Schlüssel)  erste {t[0] * 1e3:7.1f} ms  weitere Ø {sum(t[1:]) / len(t[1:]) * 1e3:7.1f} ms  "
+              f"API-Aufrufe {server.requests - before}")
+        before = server.requests
+        t = sessions(meal_plan, EdamamClient("x", "x", "x", base_url=base, cache=DiskCache(db)))
+        print(f"  parallel + SQLite-Cache                   erste {t[0] * 1e3:7.1f} ms  weitere Ø {sum(t[1:]) / len(t[1:]) * 1e3:7.1f} ms  "
+              f"API-Aufrufe {server.requests - before}")
+        before = server.requests
+        restarted = EdamamClient("x", "x", "x", base_url=base, cache=DiskCache(db))    #neuer Worker-Prozess
+        t = sessions(meal_plan, restarted)
+        print(f"  nach Neustart (Cache warm)                erste {t[0] * 1e3:7.1f} ms  weitere Ø {sum(t[1:]) / len(t[1:]) * 1e3:7.1f} ms  "
+              f"API-Aufrufe {server.requests - before}   {restarted.stats()}")
+        a = meal_plan(restarted, 1, ["balanced"], ["vegetarian"])["Lunch"]
+        b = meal_plan(restarted, 2, ["balanced"], ["vegetarian"])["Lunch"]
+        print(f"  verschiedene Seeds -> verschiedene Auswahl aus denselben Treffern: {[r['label'] for r in a] != [r['label'] for r in b]}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
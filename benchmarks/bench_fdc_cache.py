@@ -0,0 +1,66 @@
+#USDA-Snack-Finder gegen einen lokalen FDC-Stub: neue Verbindung pro Aufruf (bisher) vs. gepoolte Session, sowie
+#Latenz und Trefferquote des SQLite-Caches über einen simulierten Neustart hinweg. Aufruf: python benchmarks/bench_fdc_cache.py
+import os
+import sys
+import tempfile
+import time
+import requests
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+from sportfuel.disk_cache import DiskCache
+from sportfuel.fdc import FdcClient
+from stubs import start_fdc_stub
+
+QUERIES = ["banana", "energy bar", "gel", "dates", "rice cake", "pretzel"]
+
+
+#Bisheriger Weg: requests.get ohne Session -> neue TCP-Verbindung pro Aufruf
+def snack_search_plain(base, q):
+    foods = requests.get(f"{base}/foods/search", params={"api_key": "x", "query": q, "pageSize": 5}).json()["foods"]
+    return [requests.get(f"{base}/food/{f['fdcId']}", params={"api_key": "x"}).json() for f in foods]
+
+
+def snack_search(client, q):
+    return [client.get_food_details(f["fdcId"]) for f in client.search_foods(q, 5)]
+
+
+def run(fn, *args):
+    t0 = time.perf_counter()
+    for q in QUERIES:
+        fn(*args, q)
+    return (time.perf_counter() - t0) / len(QUERIES)
+
+
+def main(delay=0.02):
+    server, base = start_fdc_stub(delay)
+    with tempfile.TemporaryDirectory() as tmp:
+        db = os.path.join(tmp, "cache.sqlite")
+        t_plain = run(snack_search_plain, base)
+        t_pool = run(snack_search, FdcClient("x", base_url=base))
+        cold = FdcClient("x", base_url=base, cache=DiskCache(db))
+        t_cold = run(snack_search, cold)
+        warm = FdcClient("x", base_url=base, cache=DiskCache(db))    #neuer Prozess/Worker: In-Process-Cache leer, SQLite voll
+        before = server.requests
+        t_warm = run(snack_search, warm)
+        print(f"Pro Suche (1 search + 5 details, {delay * 1e3:.0f} ms Serverlatenz):")
+        print(f"  requests.get ohne Session   {t_plain * 1e3:8.1f} ms")
+        print(f"  gepoolte Session            {t_pool * 1e3:8.1f} ms")
+        print(f"  SQLite-Cache kalt           {t_cold * 1e3:8.1f} ms   {cold.stats()}")
+        print(f"  SQLite-Cache warm (Neustart){t_warm * 1e3:8.1f} ms   HTTP-Aufrufe: {server.requests - before}   {warm.stats()}")
+
+        small = DiskCache(os.path.join(tmp, "small.sqlite"), max_bytes=4000)
+        for i in range(50):
+            small.set(f"k{i}", {"payload": "x" * 200}, ttl=60)
+        print(f"\nEviction bei max_bytes=4000: {small.stats()['entries']} von 50 Einträgen behalten, "
+              f"{small.stats()['bytes']} Bytes; ältester noch da: {small.get('k0') is not None}")
+        expired = DiskCache(os.path.join(tmp, "ttl.sqlite"))
+        expired.set("k", {"a": 1}, ttl=0.05)
+        time.sleep(0.1)
+        print(f"TTL abgelaufen -> {expired.get('k')}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#Snack-Finder Ende-zu-Ende (1 Suche + Details aller Treffer) gegen den lokalen FDC-Stub mit künstlicher Latenz:
+#Details nacheinander (bisher) vs. parallel im Thread-Pool vs. ein Aufruf des Bulk-Endpunkts /foods.
+#Aufruf: python benchmarks/bench_fdc_concurrency.py
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+from sportfuel.fdc import FdcClient
+from stubs import start_fdc_stub
+
+QUERIES = ["banana", "energy bar", "gel", "dates", "rice cake", "pretzel"]
+
+
+def sequential(client, q, limit):
+    return [client.get_food_details(f["fdcId"]) for f in client.search_foods(q, limit)]
+
+
+def batched(client, q, limit):
+    return client.get_foods_details([f["fdcId"] for f in client.search_foods(q, limit)])
+
+
+def run(server, fn, limit, bulk):
+    server.bulk = bulk
+    client = FdcClient("x", base_url=server.base)    #ohne DiskCache: jede Suche geht ans Netz
+    before = server.requests
+    t0 = time.perf_counter()
+    results = [fn(client, q, limit) for q in QUERIES]
+    per_query = (time.perf_counter() - t0) / len(QUERIES)
+    calls = (server.requests - before) / len(QUERIES)
+    for q, details in zip(QUERIES, results):
+        ids = [f["fdcId"] for f in client.search_foods(q, limit)]
+        assert [d["fdcId"] for d in details] == ids, "Reihenfolge der Suche verloren"
+    return per_query, calls
+
+
+def main():
+    for delay in (0.02, 0.1):
+        server, base = start_fdc_stub(delay)
+        server.base = base
+        print(f"Serverlatenz {delay * 1e3:.0f} ms (Zeit und HTTP-Aufrufe pro Suche; Thread-Pool inkl. abgelehntem Bulk-Versuch):")
+        for limit in (5, 20):
+            t_seq, r_seq = run(server, sequential, limit, True)
+            t_pool, r_pool = run(server, batched, limit, False)
+            t_bulk, r_bulk = run(server, batched, limit, True)
+            print(f"  {limit:2d} Treffer  nacheinander {t_seq * 1e3:7.1f} ms ({r_seq:4.1f})   "
+                  f"Thread-Pool {t_pool * 1e3:7.1f} ms ({r_pool:4.1f})   "
+                  f"Bulk /foods {t_bulk * 1e3:7.1f} ms ({r_bulk:4.1f})   "
+                  f"Speedup {t_seq / t_pool:4.1f}x / {t_seq / t_bulk:4.1f}x")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#Parse-Zeit: fitparse (ein Dict pro record-Nachricht) vs. spaltenweiser Parser (sportfuel.fit_stream) auf synthetischen
+#1-Hz-Aufzeichnungen. Aufruf aus dem Repo-Root: python benchmarks/bench_fit_parse.py
+import io
+import os
+import sys
+import time
+import tracemalloc
+import fitparse
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+from sportfuel.fit_stream import parse_fit
+from synthetic import make_fit_bytes
+
+
+def fitparse_path(data):
+    recs = [m.get_values() for m in fitparse.FitFile(io.BytesIO(data)).get_messages("record")]
+    return np.array([r.get("position_lat") for r in recs], dtype=float) * 180 / 2 ** 31
+
+
+def columnar_path(data):
+    return parse_fit(data)["lat"]
+
+
+def measure(fn, data):
+    t0 = time.perf_counter()
+    out = fn(data)
+    dt = time.perf_counter() - t0
+    tracemalloc.start()
+    fn(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return dt, peak, out
+
+
+def main(hours=(1, 6, 24), fitparse_max_h=6):
+    print(f"{'Dauer':>6}{'Records':>10}{'Datei':>9}{'fitparse':>11}{'Spalten':>10}{'Speedup':>9}{'Peak Spalten':>14}")
+    for h in hours:
+        n = h * 3600
+        data = make_fit_bytes(n, compressed=(h == 1))
+        t_new, m_new, lat_new = measure(columnar_path, data)
+        if h <= fitparse_max_h:
+            t0 = time.perf_counter()
+            lat_old = fitparse_path(data)
+            t_old = time.perf_counter() - t0
+            assert np.allclose(lat_old, lat_new)
+            old = f"{t_old:>9.2f}s"
+            speed = f"{t_old / t_new:>8.0f}x"
+        else:
+            old, speed = f"{'-':>10}", f"{'-':>9}"
+        print(f"{h:>5}h{n:>10,}{len(data) / 1e6:>7.1f}MB{old}{t_new:>9.3f}s{speed}{m_new / 1e6:>12.1f}MB")
+    track = parse_fit(make_fit_bytes(3600)).to_track()
+    print(f"\n1h-Datei -> dauer {track.duration / 60:.0f} min, distanz {track.length_3d / 1000:.2f} km, {len(track.coords):,} Koordinaten")
+
+
+if __name__ == "__main__":
+    main()
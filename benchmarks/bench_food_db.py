@@ -0,0 +1,70 @@
+#Lokale FDC-Datenbank: Import-Durchsatz aus einem synthetischen Bulk-Download (CSV) und Suchlatenz der FTS5-Suche im
+#Vergleich zu einem LIKE-Scan über die ganze Tabelle und zur Live-API (Stub mit 20 ms Latenz, Suche + Bulk-Details).
+#Aufruf: python benchmarks/bench_food_db.py [anzahl_lebensmittel]
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+from sportfuel.fdc import FdcClient, snack_nutrients
+from sportfuel.food_db import FoodDB, import_fdc
+from stubs import start_fdc_stub
+from synthetic import write_fdc_csv
+
+QUERIES = ["banana", "energy bar", "gel", "dates", "rice cake", "pretzel", "peanut butter", "choc", "oat honey", "mango chews"]
+
+
+def latencies(fn, repeat=5):
+    out = []
+    for _ in range(repeat):
+        for q in QUERIES:
+            t0 = time.perf_counter()
+            fn(q)
+            out.append(time.perf_counter() - t0)
+    return np.percentile(out, [50, 95]) * 1e3
+
+
+def main(n=200_000):
+    with tempfile.TemporaryDirectory() as tmp:
+        src = os.path.join(tmp, "csv")
+        write_fdc_csv(src, n)
+        mb = sum(os.path.getsize(os.path.join(src, f)) for f in os.listdir(src)) / 1e6
+        db_path = os.path.join(tmp, "foods.sqlite")
+        t0 = time.perf_counter()
+        kept = import_fdc(src, db_path)
+        dt = time.perf_counter() - t0
+        print(f"Import: {n:,} Lebensmittel ({mb:.0f} MB CSV) in {dt:.1f} s -> {n / dt:,.0f}/s, {mb / dt:.0f} MB/s; "
+              f"{kept:,} mit Energieangabe, DB {os.path.getsize(db_path) / 1e6:.0f} MB")
+
+        db = FoodDB(db_path)
+        print(f"Beispiel 'energy bar': {db.search('energy bar', 2)}")
+        con = sqlite3.connect(db_path)
+
+        def like_scan(q):    #ohne Index: jede Suche liest die ganze Tabelle (gleiche Sortierung wie FoodDB.search)
+            terms = q.split()
+            where = " AND ".join("description LIKE ?" for _ in terms)
+            return con.execute(f"SELECT fdc_id, description FROM foods WHERE {where} ORDER BY length(description) LIMIT 5",
+                               [f"%{t}%" for t in terms]).fetchall()
+
+        server, base = start_fdc_stub(0.02)
+        client = FdcClient("x", base_url=base)
+
+        def live_api(q):
+            foods = client.search_foods(q, 5)
+            return [snack_nutrients(d) for d in client.get_foods_details([f["fdcId"] for f in foods])]
+
+        print("\nSuchlatenz pro Anfrage (5 Treffer inkl. Nährwerte)    p50 ms    p95 ms")
+        for name, fn in (("FTS5 (lokal)", lambda q: db.search(q, 5)), ("LIKE-Scan (lokal)", like_scan),
+                         ("Live-API (20 ms Latenz)", live_api)):
+            p50, p95 = latencies(fn, 1 if fn is live_api else 5)
+            print(f"  {name:<28}{p50:18.2f}{p95:10.2f}")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
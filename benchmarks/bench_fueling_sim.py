@@ -0,0 +1,53 @@
+#Intake-Plan: bisherige set/range-Vereinigung mit Zeilen-Dicts vs. sportfuel.fueling (NumPy), für 1 h, 3 h und 24 h.
+#Dazu die minutengenaue Simulation und der Intervall-Vorschlag über alle 20 Kombinationen der Seite.
+#Aufruf aus dem Repo-Root: python benchmarks/bench_fueling_sim.py
+import os
+import sys
+import timeit
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sportfuel.fueling import Simulation, intake_amounts, intake_events, suggest_intervals
+
+
+#Bisherige Implementierung aus pages/1_Vor_Workout.py (ohne DataFrame) als Referenz
+def schedule_loop(dauer, cal_burn, fluid_loss, eat_int, drink_int):
+    events    = sorted(
+        set(range(eat_int,   int(dauer)+1, eat_int  )) |
+        set(range(drink_int, int(dauer)+1, drink_int))
+    )
+    eat_events = [t for t in events if t % eat_int == 0]
+    req_cal = cal_burn / len(eat_events) if eat_events else 0
+    req_fluid = fluid_loss / len(events) if events else 0
+    schedule = []
+    for t in events:
+        row = {"Minute": t}
+        if t % eat_int   == 0: row["Essen (kcal)"] = round(req_cal,   1)
+        if t % drink_int == 0: row["Trinken (L)"]  = round(req_fluid, 3)
+        schedule.append(row)
+    return schedule
+
+
+def us(fn, n):
+    return min(timeit.repeat(fn, number=n, repeat=5)) / n * 1e6
+
+
+def main():
+    print(f"{'Dauer':>7}{'Events':>8}{'Schleife µs':>13}{'NumPy µs':>10}{'Simulation µs':>15}{'Vorschlag (20) µs':>19}")
+    for dauer in (60, 180, 1440):
+        cal, fluid, gewicht = 10 * dauer, 0.7 * dauer / 60, 70
+        t, _, _ = intake_events(dauer, 15, 10)
+        assert [r["Minute"] for r in schedule_loop(dauer, cal, fluid, 15, 10)] == t.tolist()
+        n = 2000
+        print(f"{dauer:>5} m{len(t):>8}"
+              f"{us(lambda: schedule_loop(dauer, cal, fluid, 15, 10), n):>13.1f}"
+              f"{us(lambda: intake_amounts(dauer, cal, fluid, 15, 10), n):>10.1f}"
+              f"{us(lambda: Simulation(dauer, gewicht, 15, cal, fluid, 10, cart_carbs=120.0), n):>15.1f}"
+              f"{us(lambda: suggest_intervals(dauer, gewicht, fluid), n):>19.1f}")
+    eat, drink, table = suggest_intervals(300, 70, 3.5)
+    ok = np.asarray(table["ok"])
+    print(f"Vorschlag 5 h, 70 kg: Essen alle {eat} Min, Trinken alle {drink} Min ({ok.sum()}/{len(ok)} Kombinationen innerhalb der Toleranz)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,152 @@
+#GPX-Download auf pages/1_Vor_Workout.py mit grossen Tracks: bisherige Seite (--baseline, übergibt bei jedem Rerun die
+#hochgeladenen Bytes an st.download_button) vs. aktuelle Seite (Datei mit Intake-Wegpunkten erst beim Klick, gecacht).
+#Pro Variante und Trackgrösse ein eigener Prozess: Upload, dann Intervall-Änderungen; gemessen werden Median der Reruns
+#und maximaler RSS des Prozesses. Dazu der Export selbst: erster Klick (schreiben), weitere Klicks (Datei lesen),
+#Spitzenspeicher laut tracemalloc und Dateigrösse. AppTest zeigt den Download-Teil eines Reruns kaum; deshalb wird er
+#zusätzlich direkt gemessen: bisher kopiert jeder Rerun die Upload-Bytes (getvalue) und hasht sie im Media-Speicher des
+#Servers, der die Kopie pro Session behält; jetzt wird nur der Callable registriert.
+#Aufruf aus dem Repo-Root: python benchmarks/bench_gpx_export.py [--points 200000 500000] [--reps 6] [--baseline f51e6da]
+import argparse
+import multiprocessing
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+from synthetic import make_gpx_bytes
+
+PAGE       = "pages/1_Vor_Workout.py"
+INTERVAL_S = 0.05    #20 Hz: 200k-500k Punkte entsprechen 3-7 h, wie bei Aufzeichnungen mit hoher Rate
+
+
+def by_label(widgets, label):
+    return next(w for w in widgets if w.label == label)
+
+
+#Im Kindprozess: Upload und Intervall-Änderungen, gibt (Upload-Rerun s, Rerun-Zeiten s, maximaler RSS MB) zurück
+def session_job(args):
+    path, points, reps = args
+    from streamlit.testing.v1 import AppTest
+    gpx = make_gpx_bytes(points, seed=5, segments=3, interval=INTERVAL_S)
+    at = AppTest.from_file(path, default_timeout=600)
+    at.session_state["gewicht"] = 70
+
+    def rerun():
+        t0 = time.perf_counter()
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        return time.perf_counter() - t0
+
+    rerun()
+    at.file_uploader[0].set_value(("route.gpx", gpx, "application/gpx+xml"))
+    upload = rerun()
+    times = []
+    for i in range(reps):
+        by_label(at.select_slider, "Trinken alle (Min)").set_value([10, 15, 20, 30][i % 4])
+        times.append(rerun())
+    return upload, times, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_session(path, points, reps):
+    with multiprocessing.get_context("fork").Pool(1, maxtasksperchild=1) as pool:
+        return pool.apply(session_job, ((path, points, reps),))
+
+
+#Export ohne Seite: erster Klick schreibt die Datei, weitere lesen sie nur; gibt (s erster, s weitere, MB Spitze, MB Datei) zurück.
+#Die Spitze misst ein eigener Durchlauf mit tracemalloc (nur das Schreiben, ohne das Lesen der fertigen Datei).
+def measure_export(points, export_dir):
+    from sportfuel.gpx_export import cached_export, intake_waypoints, read_export
+    from sportfuel.gpx_stream import parse_gpx
+    track = parse_gpx(make_gpx_bytes(points, seed=5, segments=3, interval=INTERVAL_S))
+    dauer, cal_burn, fluid_loss = 240, 2800.0, 2.4
+    key = ("bench", points, 30, 15, "time", dauer, cal_burn, fluid_loss)
+
+    def export(directory):
+        return cached_export(key, track, lambda: intake_waypoints(track, dauer, cal_burn, fluid_loss, 30, 15, "time"),
+                             export_dir=directory)
+
+    def click():    #wie die Seite: ganze Datei als bytes
+        return read_export(key, track, lambda: intake_waypoints(track, dauer, cal_burn, fluid_loss, 30, 15, "time"),
+                           export_dir=export_dir)
+
+    t0 = time.perf_counter()
+    click()
+    first = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    data = click()
+    again = time.perf_counter() - t0
+    tracemalloc.start()
+    export(export_dir + "-traced")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    back = parse_gpx(data)    #Zeiten mit Millisekunden (20 Hz), Positionen unverändert
+    assert len(back) == len(track)
+    assert np.allclose(back.time, track.time, rtol=0, atol=1e-3)
+    assert np.allclose(back.coords, track.coords, rtol=0, atol=1e-7)
+    return first, again, peak / 1e6, len(data) / 1e6
+
+
+#Bisheriger Download-Teil eines Reruns auf dem Server: Kopie der Upload-Bytes und Eintrag im Media-Speicher (Hash)
+def measure_media(points, reps):
+    import io
+    from streamlit.runtime.media_file_storage import MediaFileKind
+    from streamlit.runtime.memory_media_file_storage import MemoryMediaFileStorage
+    uploaded = io.BytesIO(make_gpx_bytes(points, seed=5, segments=3, interval=INTERVAL_S))
+    storage = MemoryMediaFileStorage("/media")
+    times = []
+    for _ in range(reps):
+        t0 = time.perf_counter()
+        storage.load_and_get_id(uploaded.getvalue(), "application/gpx+xml", MediaFileKind.DOWNLOADABLE, "route_intake.gpx")
+        times.append(time.perf_counter() - t0)
+    return np.median(times), len(uploaded.getbuffer()) / 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, nargs="+", default=[200_000, 500_000])
+    parser.add_argument("--reps", type=int, default=6)
+    parser.add_argument("--baseline", default="f51e6da", help="git-Revision mit dem bisherigen Download")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="sportfuel-bench-")
+    os.environ.update({
+        "SPORTFUEL_CACHE_DB":   os.path.join(tmp, "cache.sqlite"),
+        "SPORTFUEL_FOOD_DB":    os.path.join(tmp, "keine_food_db.sqlite"),
+        "SPORTFUEL_EXPORT_DIR": os.path.join(tmp, "gpx"),
+        "SPORTFUEL_WARMUP":     "0",
+    })
+    os.chdir(ROOT)
+    old_path = os.path.join(tmp, "vor_workout_baseline.py")
+    with open(old_path, "wb") as f:
+        f.write(subprocess.check_output(["git", "show", f"{args.baseline}:{PAGE}"], cwd=ROOT))
+
+    print(f"Intervall-Änderung (Trinken alle), Median über {args.reps} Reruns; RSS = Maximum des Sitzungsprozesses")
+    print(f"{'Punkte':>9}{'Variante':>10}{'Upload ms':>11}{'Rerun ms':>10}{'RSS MB':>9}")
+    for n in args.points:
+        for name, path in (("bisher", old_path), ("aktuell", os.path.join(ROOT, PAGE))):
+            upload, times, rss = run_session(path, n, args.reps)
+            print(f"{n:>9,}{name:>10}{upload * 1e3:>11.0f}{np.median(times) * 1e3:>10.0f}{rss:>9.0f}")
+
+    print("\nDownload-Teil pro Rerun bisher (Kopie + Media-Speicher); aktuell nur ein registrierter Callable")
+    print(f"{'Punkte':>9}{'ms':>7}{'MB pro Session':>16}")
+    for n in args.points:
+        t, size = measure_media(n, args.reps)
+        print(f"{n:>9,}{t * 1e3:>7.1f}{size:>16.1f}")
+
+    print("\nExport beim Klick (mit Intake-Wegpunkten)")
+    print(f"{'Punkte':>9}{'erster ms':>11}{'weitere ms':>12}{'Spitze MB':>11}{'Datei MB':>10}")
+    for n in args.points:
+        first, again, peak, size = measure_export(n, os.path.join(tmp, "gpx"))
+        print(f"{n:>9,}{first * 1e3:>11.0f}{again * 1e3:>12.0f}{peak:>11.1f}{size:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
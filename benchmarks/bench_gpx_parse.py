@@ -0,0 +1,56 @@
+#Parse-Zeit und Spitzen-Speicher: bisheriger gpxpy-Pfad der Vor_Workout Seite vs. Streaming-Parser (sportfuel.gpx_stream)
+#auf synthetischen Tracks. Aufruf aus dem Repo-Root: python benchmarks/bench_gpx_parse.py
+import os
+import sys
+import time
+import tracemalloc
+import gpxpy
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+from sportfuel.gpx_stream import parse_gpx
+from synthetic import make_gpx_bytes
+
+
+#So hat die Seite bisher geparst
+def gpxpy_path(data):
+    gpx = gpxpy.parse(data.decode())
+    duration = gpx.get_duration() or 0
+    length = gpx.length_3d() or 0
+    coords = [(pt.latitude, pt.longitude) for tr in gpx.tracks for seg in tr.segments for pt in seg.points]
+    return duration, length, coords
+
+
+def stream_path(data):
+    track = parse_gpx(data)
+    return track.duration or 0, track.length_3d, track.coords
+
+
+def measure(fn, data):
+    t0 = time.perf_counter()
+    out = fn(data)
+    dt = time.perf_counter() - t0
+    del out
+    tracemalloc.start()
+    out = fn(data)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return dt, peak, out
+
+
+def main(sizes=(10_000, 100_000, 300_000)):
+    print(f"{'Punkte':>9}{'Datei':>10}{'gpxpy (s)':>11}{'Stream (s)':>12}{'Speedup':>9}{'Peak gpxpy':>13}{'Peak Stream':>13}")
+    for n in sizes:
+        data = make_gpx_bytes(n, segments=2)
+        t_old, m_old, (dur_a, len_a, coords_a) = measure(gpxpy_path, data)
+        t_new, m_new, (dur_b, len_b, coords_b) = measure(stream_path, data)
+        assert dur_a == dur_b and abs(len_a - len_b) < 1e-6 * len_a
+        assert np.array_equal(np.asarray(coords_a), coords_b)
+        print(f"{n:>9,}{len(data) / 1e6:>8.1f}MB{t_old:>11.2f}{t_new:>12.2f}{t_old / t_new:>8.1f}x"
+              f"{m_old / 1e6:>11.0f}MB{m_new / 1e6:>11.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#Rerun-Latenz von pages/1_Vor_Workout.py pro Interaktion: Seite vor der Aufteilung in gecachte Stufen (aus git, --baseline)
+#vs. aktuelle Seite. Pro Variante eine AppTest-Session mit GPX-Upload; danach wird jede Interaktion mehrmals ausgelöst
+#(Werte im Kreis, wie ein Nutzer, der hin und her schiebt) und die Dauer von at.run() gemessen.
+#AppTest führt auch bei Widgets in Fragmenten das ganze Skript aus; beim Marker-Umschalter ist der Gewinn im Browser grösser.
+#Aufruf aus dem Repo-Root: python benchmarks/bench_incremental.py [--points 50000] [--reps 8] [--baseline f2b783d]
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+from stubs import start_fdc_stub
+from synthetic import make_gpx_bytes
+
+PAGE = "pages/1_Vor_Workout.py"
+
+
+def by_label(widgets, label):
+    return next(w for w in widgets if w.label == label)
+
+
+#Interaktion -> Funktion(at, i), die das Widget für die i-te Wiederholung setzt
+INTERACTIONS = {
+    "Trinken-Intervall": lambda at, i: by_label(at.select_slider, "Trinken alle (Min)").set_value([10, 15, 20, 30][i % 4]),
+    "Essen-Intervall":   lambda at, i: by_label(at.select_slider, "Essen alle (Min)").set_value([15, 20, 30, 45, 60][i % 5]),
+    "Marker-Modus":      lambda at, i: by_label(at.radio, "Marker platzieren nach").set_value(["Distanz", "Zeit"][i % 2]),
+    "Snack-Suche":       lambda at, i: by_label(at.text_input, "Snack suchen (Schlagwort)").input(["banana", "gel", "oat bar"][i % 3]),
+    "Sportart":          lambda at, i: by_label(at.selectbox, "Sportart").set_value(["Radfahren", "Laufen"][i % 2]),
+}
+
+
+def measure(path, gpx, reps):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(path, default_timeout=300)
+    at.session_state["gewicht"] = 70
+
+    def rerun():
+        t0 = time.perf_counter()
+        at.run()
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+        return time.perf_counter() - t0
+
+    rerun()
+    at.file_uploader[0].set_value(("route.gpx", gpx, "application/gpx+xml"))
+    out = {"Upload": [rerun()]}
+    for name, action in INTERACTIONS.items():
+        out[name] = []
+        for i in range(reps):
+            action(at, i)
+            out[name].append(rerun())
+    return out
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--points", type=int, default=50_000, help="Trackpunkte der hochgeladenen GPX-Datei")
+    parser.add_argument("--reps", type=int, default=8)
+    parser.add_argument("--baseline", default="f2b783d", help="git-Revision mit der bisherigen Seite")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="sportfuel-bench-")
+    fdc, fdc_url = start_fdc_stub(0.05)
+    os.environ.update({
+        "FDC_BASE_URL":       fdc_url,
+        "SPORTFUEL_CACHE_DB": os.path.join(tmp, "cache.sqlite"),
+        "SPORTFUEL_FOOD_DB":  os.path.join(tmp, "keine_food_db.sqlite"),
+    })
+    os.chdir(ROOT)
+    old_path = os.path.join(tmp, "vor_workout_baseline.py")
+    with open(old_path, "wb") as f:
+        f.write(subprocess.check_output(["git", "show", f"{args.baseline}:{PAGE}"], cwd=ROOT))
+
+    gpx = make_gpx_bytes(args.points, seed=1)
+    measure(os.path.join(ROOT, PAGE), make_gpx_bytes(1_000, seed=2), 1)    #Importe und Modell laden
+    old = measure(old_path, gpx, args.reps)
+    new = measure(os.path.join(ROOT, PAGE), gpx, args.reps)
+    fdc.shutdown()
+
+    print(f"GPX mit {args.points:,} Punkten ({len(gpx) / 1e6:.1f} MB), {args.reps} Wiederholungen pro Interaktion, Median")
+    print(f"{'Interaktion':<20}{'bisher ms':>11}{'Stufen ms':>11}{'Faktor':>8}")
+    for name in old:
+        a, b = np.median(old[name]) * 1e3, np.median(new[name]) * 1e3
+        print(f"{name:<20}{a:>11.0f}{b:>11.0f}{a / b:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+#Platzierung der Intake-Marker: bisherige Index-Formel (gleichmässige Zeit pro Punkt) vs. Zeit-/Distanzindex mit
+#np.searchsorted (Track.positions_at). Gemessen auf Tracks mit Pausen und variabler Aufzeichnungsrate.
+#Aufruf aus dem Repo-Root: python benchmarks/bench_marker_placement.py
+import os
+import sys
+import time
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+from sportfuel.gpx_stream import parse_gpx
+from sportfuel.track import EARTH_RADIUS
+from synthetic import make_gpx_bytes
+
+
+def old_positions(coords, events, dauer):
+    out = []
+    for t in events:
+        idx = min(int(t / dauer * len(coords)), len(coords) - 1)
+        out.append(coords[idx])
+    return np.asarray(out)
+
+
+def error_m(a, b):
+    dlat = np.radians(a[:, 0] - b[:, 0])
+    dlon = np.radians(a[:, 1] - b[:, 1]) * np.cos(np.radians(a[:, 0]))
+    return np.hypot(dlat, dlon) * EARTH_RADIUS
+
+
+def main(n=200_000, eat_int=30, drink_int=15):
+    track = parse_gpx(make_gpx_bytes(n, pauses=True))
+    dauer = track.duration / 60
+    events = sorted(set(range(eat_int, int(dauer) + 1, eat_int)) | set(range(drink_int, int(dauer) + 1, drink_int)))
+
+    #Referenz: exakter Punkt zum Zeitpunkt (letzter Punkt mit Zeit <= t)
+    truth = track.coords[np.searchsorted(track.elapsed, np.asarray(events) * 60, side="right") - 1]
+
+    t0 = time.perf_counter()
+    old = old_positions(track.coords, events, dauer)
+    t_old = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    new = track.positions_at(events)
+    t_new = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    track.positions_at(events, by="distance", dauer_min=dauer)
+    t_dist = time.perf_counter() - t0
+
+    e_old, e_new = error_m(old, truth), error_m(new, truth)
+    print(f"Track: {n:,} Punkte, {dauer:.0f} min mit Pausen, {len(events)} Events")
+    print(f"{'Methode':<22}{'Zeit':>10}{'Fehler Median':>16}{'Fehler max':>13}")
+    print(f"{'Index-Formel (alt)':<22}{t_old * 1e3:>8.2f}ms{np.median(e_old):>14.0f} m{e_old.max():>11.0f} m")
+    print(f"{'searchsorted Zeit':<22}{t_new * 1e3:>8.2f}ms{np.median(e_new):>14.1f} m{e_new.max():>11.1f} m")
+    print(f"{'searchsorted Distanz':<22}{t_dist * 1e3:>8.2f}ms")
+
+    many = np.linspace(0, dauer, 100_000)
+    t0 = time.perf_counter()
+    track.positions_at(many)
+    print(f"\n100'000 Events in {(time.perf_counter() - t0) * 1e3:.1f} ms (O(log n) pro Event)")
+
+
+if __name__ == "__main__":
+    main()
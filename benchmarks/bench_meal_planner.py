@@ -0,0 +1,71 @@
+#Tagesplan-Optimierer: Laufzeit über Pool-Grössen (Rezepte pro Mahlzeit) und Qualität im Vergleich zur bisherigen
+#Zufallsauswahl (Portionen auf ~1/3 des Bedarfs) und, bei kleinen Pools, zur vollständigen Suche über alle Rezepte
+#und das ganze Portionsraster. Aufruf: python benchmarks/bench_meal_planner.py
+import os
+import sys
+import time
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+from sportfuel.meal_planner import (MEALS, PORTION_MAX, PORTION_MIN, PORTION_STEP, day_targets, nutrient_matrix,
+                                    optimize_day, plan_cost)
+from synthetic import make_recipes
+
+
+#Vollständige Suche: alle Rezeptkombinationen x alle Portionen auf dem Raster
+def brute_force(pools, target):
+    mats = [nutrient_matrix(pools[m])[0] for m in MEALS]
+    grid = np.arange(PORTION_MIN, PORTION_MAX + 1e-9, PORTION_STEP)
+    xs = np.stack(np.meshgrid(grid, grid, grid, indexing="ij"), axis=-1).reshape(-1, 3)
+    best = np.inf
+    for b in mats[0]:
+        for l in mats[1]:
+            per_serv = np.stack([np.broadcast_to(b, mats[2].shape), np.broadcast_to(l, mats[2].shape), mats[2]], axis=1)
+            best = min(best, plan_cost(xs[None, :, :], per_serv[:, None], target).min())
+    return best
+
+
+#Bisher: zufälliges Rezept, Portionen = per_meal / kcal pro Portion
+def random_pick_cost(pools, target, rng):
+    mats = [nutrient_matrix(pools[m])[0] for m in MEALS]
+    per_serv = np.stack([mat[rng.integers(len(mat))] for mat in mats])
+    x = target[0] / 3 / per_serv[:, 0]
+    return float(plan_cost(x, per_serv, target))
+
+
+def describe(plan):
+    t, g = plan["totals"], plan["target"]
+    return f"{t[0]:5.0f}/{g[0]:.0f} kcal  {t[1]:4.0f}/{g[1]:.0f} g KH  {t[2]:4.0f}/{g[2]:.0f} g Protein"
+
+
+def main():
+    target = day_targets(2600, 70, snack_carbs=60)
+    rng = np.random.default_rng(0)
+    print("Rezepte/Mahlzeit    Laufzeit ms   Kosten     Zufall (Median)   Plan")
+    for n in (20, 100, 500, 2000, 5000, 20000):
+        pools = {m: make_recipes(n, m, seed=n) for m in MEALS}
+        optimize_day(pools, target)    #Aufwärmen
+        times = []
+        for _ in range(3):
+            t0 = time.perf_counter()
+            plan = optimize_day(pools, target)
+            times.append(time.perf_counter() - t0)
+        rnd = np.median([random_pick_cost(pools, target, rng) for _ in range(200)])
+        print(f"{n:>16,}  {min(times) * 1e3:11.1f}   {plan['cost']:.5f}    {rnd:.5f}           {describe(plan)}")
+
+    pools = {m: make_recipes(20, m, seed=20) for m in MEALS}
+    t0 = time.perf_counter()
+    exact = brute_force(pools, target)
+    print(f"\nVollständige Suche (20 Rezepte/Mahlzeit, {len(np.arange(PORTION_MIN, PORTION_MAX + 1e-9, PORTION_STEP)) ** 3} "
+          f"Portionskombinationen): Kosten {exact:.5f} in {(time.perf_counter() - t0) * 1e3:.0f} ms, "
+          f"Optimierer {optimize_day(pools, target)['cost']:.5f}")
+
+    plan = optimize_day({m: make_recipes(500, m) for m in MEALS}, target, diets=["balanced"], healths=["vegetarian"])
+    print(f"Mit Labels balanced + vegetarian: {describe(plan)}; "
+          f"alle passend: {all('Vegetarian' in r['healthLabels'] and 'Balanced' in r['dietLabels'] for _, r, _ in plan['meals'])}")
+
+
+if __name__ == "__main__":
+    main()
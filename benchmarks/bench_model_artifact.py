@@ -0,0 +1,94 @@
+#Kaltstart, Speicher pro Worker und Vorhersage-Gleichheit: joblib-Pickle (sklearn) vs. kompakter .npz-Export (sportfuel.forest)
+#Voraussetzung: python sport-fuel-ml/train_model.py wurde ausgeführt. Aufruf aus dem Repo-Root: python benchmarks/bench_model_artifact.py
+import json
+import os
+import subprocess
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "sport-fuel-ml"))
+MODEL_PATH  = os.path.join(ROOT, "models", "calorie_predictor.pkl")
+COMPACT_PATH = os.path.join(ROOT, "models", "calorie_model.npz")
+
+#Jeder Kaltstart läuft in einem frischen Prozess: Import + Laden + erste Vorhersage, danach RSS aus /proc
+CHILD = r"""
+import json, sys, time
+t0 = time.perf_counter()
+import pandas as pd
+X = pd.DataFrame([{"Activity": "Running, 6 mph (10 min mile)", "Gewicht": 70, "Dauer": 60, "Distanz": 10.0}])
+t1 = time.perf_counter()
+if sys.argv[1] == "pickle":
+    import joblib
+    model = joblib.load(sys.argv[2])
+else:
+    sys.path.insert(0, sys.argv[3])
+    from sportfuel.compact import load_compact
+    model = load_compact(sys.argv[2])
+t2 = time.perf_counter()
+model.predict(X)
+t3 = time.perf_counter()
+rss = {}
+for line in open("/proc/self/status"):
+    if line.startswith(("VmRSS", "RssAnon", "RssFile", "VmHWM")):
+        k, v = line.split(":")
+        rss[k] = int(v.split()[0]) / 1024
+print(json.dumps({"load": t2 - t1, "first_predict": t3 - t2, "total": t3 - t0, "sklearn": "sklearn" in sys.modules, **rss}))
+"""
+
+
+def cold_start(kind, path, runs=5):
+    results = []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, "-c", CHILD, kind, path, ROOT], capture_output=True, text=True, check=True)
+        results.append(json.loads(out.stdout))
+    return {k: (np.median([r[k] for r in results]) if k != "sklearn" else results[0][k]) for k in results[0]}
+
+
+def main():
+    import joblib
+    import train_model as tm
+    from sportfuel.compact import load_compact
+
+    print(f"Artefakt-Grösse: Pickle {os.path.getsize(MODEL_PATH) / 1e6:.1f} MB (compress=3), "
+          f"npz {os.path.getsize(COMPACT_PATH) / 1e6:.1f} MB (unkomprimiert, memmap)")
+
+    print(f"\n{'Variante':<10}{'Laden (ms)':>12}{'1. Predict (ms)':>17}{'Gesamt (ms)':>13}{'RSS (MB)':>10}{'davon anon':>12}{'sklearn':>9}")
+    for kind, path in [("pickle", MODEL_PATH), ("npz", COMPACT_PATH)]:
+        r = cold_start(kind, path)
+        print(f"{kind:<10}{r['load'] * 1e3:>12.0f}{r['first_predict'] * 1e3:>17.1f}{r['total'] * 1e3:>13.0f}"
+              f"{r['VmRSS']:>10.0f}{r['RssAnon']:>12.0f}{str(r['sklearn']):>9}")
+    print("RssFile der npz-Variante sind gemappte Seiten aus dem Page-Cache, die sich alle Worker teilen.")
+
+    #Gleichheit auf dem kompletten Trainingsraster; eine unbekannte Aktivität muss in beiden Varianten abgelehnt werden
+    model  = joblib.load(MODEL_PATH)
+    forest = load_compact(COMPACT_PATH)
+    raw = tm.load_exercise_csv()
+    X = tm.build_training_set(raw["Activity"], raw["kcal_per_kg"])[["Activity", "Gewicht", "Dauer", "Distanz"]]
+    a, b = model.predict(X), forest.predict(X)
+    print(f"\nGleichheit über {len(X):,} Zeilen: max. Abweichung {np.abs(a - b).max():.2e} kcal")
+    unbekannt = pd.DataFrame([{"Activity": "Unbekannt", "Gewicht": 70, "Dauer": 60, "Distanz": 10.0}])
+    for name, m in [("pickle", model), ("npz", forest)]:
+        try:
+            m.predict(unbekannt)
+            print(f"{name:<10} unbekannte Aktivität: nicht abgelehnt")
+        except ValueError:
+            print(f"{name:<10} unbekannte Aktivität: abgelehnt (ValueError -> Formel)")
+
+    x1 = X.iloc[[0]]
+    for name, m in [("pickle", model), ("npz", forest)]:
+        t0 = time.perf_counter()
+        for _ in range(50):
+            m.predict(x1)
+        t_single = (time.perf_counter() - t0) / 50
+        t0 = time.perf_counter()
+        m.predict(X)
+        t_batch = time.perf_counter() - t0
+        print(f"{name:<10} Einzelzeile {t_single * 1e3:6.2f} ms   Batch {len(X):,} Zeilen {t_batch:6.2f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+#Modellfamilien für die Kalorienschätzung im Vergleich: CV-RMSE, RMSE und Plausibilität auf Prüfdaten mit unabhängiger
+#Distanz, Latenz einer Zeile, Durchsatz und Grösse des npz-Exports, dazu die Abweichung zwischen trainiertem Modell und
+#sklearn-freiem Export auf dem ganzen Trainingsraster.
+#Aufruf aus dem Repo-Root: python benchmarks/bench_model_family.py [--folds 3]
+import argparse
+import os
+import sys
+import tempfile
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "sport-fuel-ml"))
+import train_model as tm
+from sportfuel.compact import export_compact, load_compact
+
+TREES  = [10, 50, 100]
+DEPTHS = [6, 12, None]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--folds", type=int, default=3)
+    parser.add_argument("--budget-ms", type=float, default=5.0)
+    parser.add_argument("--max-rmse", type=float, default=50.0)
+    args = parser.parse_args()
+
+    os.chdir(ROOT)
+    raw = tm.load_exercise_csv()
+    df  = tm.build_training_set(raw["Activity"], raw["kcal_per_kg"])
+    X, y = df[["Activity", "Gewicht", "Dauer", "Distanz"]], df["kcal"]
+    holdout = tm.build_holdout_set(raw["Activity"], raw["kcal_per_kg"])
+
+    results = tm.sweep(X, y, tm.FAMILIES, TREES, DEPTHS, holdout, folds=args.folds)
+    best = tm.choose(results, args.budget_ms, args.max_rmse)
+    print(f"{len(X):,} Zeilen, {args.folds} Folds, Budget {args.budget_ms} ms (p95), Prüf-RMSE-Grenze {args.max_rmse} kcal\n")
+    tm.print_results(results, best)
+
+    print(f"\n{'Familie':<13}{'max. |Modell - npz|':>20}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for family in tm.FAMILIES:
+            model = tm.make_model(family, 25, 8, 42).fit(X, y)
+            path  = os.path.join(tmp, f"{family}.npz")
+            export_compact(model, path)
+            diff = np.abs(model.predict(X) - load_compact(path).predict(X)).max()
+            print(f"{family:<13}{diff:>20.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#Kosten der Zeitmessung (sportfuel.perf) pro Abschnitt: ohne Messung, ausgeschaltet (Standard) und eingeschaltet.
+#Aufruf aus dem Repo-Root: python benchmarks/bench_perf_overhead.py
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sportfuel import perf
+
+N = 200_000
+STAGES_PER_RERUN = 15    #etwa so viele Abschnitte misst die Vor_Workout Seite mit Upload und Snack-Suche
+
+
+def bare():
+    t0 = time.perf_counter()
+    for _ in range(N):
+        pass
+    return time.perf_counter() - t0
+
+
+def measured():
+    t0 = time.perf_counter()
+    for _ in range(N):
+        with perf.stage("x") as s:
+            s.set(items=1)
+    return time.perf_counter() - t0
+
+
+def main():
+    base = min(bare() for _ in range(5))
+
+    perf.OUTPUTS = ()    #wie ohne SPORTFUEL_PERF
+    perf.start_rerun("bench")
+    off = min(measured() for _ in range(5)) - base
+
+    perf.OUTPUTS = ("jsonl",)    #eingeschaltet; finish() wird nicht aufgerufen, gemessen wird nur das Erfassen
+    times = []
+    for _ in range(5):
+        perf.start_rerun("bench")
+        times.append(measured())
+    on = min(times) - base
+
+    print(f"{'Variante':<16}{'ns/Abschnitt':>14}{'µs/Rerun (' + str(STAGES_PER_RERUN) + ' Abschnitte)':>30}")
+    for name, t in (("ausgeschaltet", off), ("eingeschaltet", on)):
+        print(f"{name:<16}{t / N * 1e9:>14.0f}{t / N * STAGES_PER_RERUN * 1e6:>30.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+#Makro-Diagramme der Rezeptkarten über 1000 simulierte Reruns (3 Karten pro Rerun, Auswahl aus 15 Rezepten):
+#bisher neue Matplotlib-Figur pro Karte und Rerun (wie st.pyplot, nie geschlossen) vs. PNG pro Rezept-URI gecacht.
+#Jede Variante läuft in einem eigenen Prozess, damit das Speicherwachstum (RSS) vergleichbar ist.
+#Aufruf: python benchmarks/bench_recipe_charts.py [Reruns]  (Standard 1000; die alte Variante braucht dafür ~16 GB RAM)
+import functools
+import io
+import os
+import subprocess
+import sys
+import time
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+RERUNS = int(sys.argv[-1]) if sys.argv[-1].isdigit() else 1000
+
+
+def rss_mb():
+    with open("/proc/self/status") as f:
+        return next(int(l.split()[1]) for l in f if l.startswith("VmRSS")) / 1024
+
+
+def run(mode):
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from sportfuel.charts import macro_chart_png
+    from synthetic import make_recipes
+
+    pool = make_recipes(15, "Lunch")
+    macros = {r["uri"]: tuple(r["totalNutrients"][k]["quantity"] / r["yield"] for k in ("PROCNT", "FAT", "CHOCDF"))
+              for r in pool}
+
+    def old_card(uri):    #bisheriger Code in render_recipe_card; st.pyplot speichert die Figur als PNG (dpi 200)
+        fig, ax = plt.subplots()
+        ax.bar(["Protein","Fat","Carbs"], list(macros[uri]))
+        ax.set_ylabel("g pro Portion")
+        ax.set_title("Makros")
+        fig.savefig(io.BytesIO(), format="png", dpi=200)
+
+    @functools.lru_cache(maxsize=512)    #entspricht @st.cache_data(max_entries=512) auf der Seite
+    def new_card(uri):
+        return macro_chart_png(*macros[uri])
+
+    card = old_card if mode == "old" else new_card
+    rng = np.random.default_rng(0)
+    start = rss_mb()
+    times, rss = [], []
+    for i in range(RERUNS):
+        t0 = time.perf_counter()
+        for r in rng.choice(pool, 3, replace=False):    #Slider-Wechsel: meist andere Rezepte in den drei Spalten
+            card(r["uri"])
+        times.append(time.perf_counter() - t0)
+        if i + 1 in (RERUNS // 10, RERUNS // 2, RERUNS):
+            rss.append(rss_mb() - start)
+    print(f"{np.mean(times) * 1e3:.2f} {np.percentile(times, 95) * 1e3:.2f} {' '.join(f'{m:.1f}' for m in rss)} "
+          f"{len(plt.get_fignums())}")
+
+
+def main():
+    print(f"{RERUNS} Reruns x 3 Karten        Ø ms/Rerun   p95 ms   RSS-Zuwachs nach {RERUNS // 10} / {RERUNS // 2} / {RERUNS} Reruns"
+          f"   offene Figuren")
+    for mode, name in (("old", "neue Figur pro Karte (bisher)"), ("new", "PNG pro Rezept gecacht")):
+        out = subprocess.run([sys.executable, __file__, mode, str(RERUNS)], capture_output=True, text=True, check=True).stdout.split()
+        mean, p95, r100, r500, r1000, figs = out
+        print(f"  {name:<30}{float(mean):9.2f}{float(p95):9.2f}      {float(r100):7.1f} / {float(r500):7.1f} / {float(r1000):7.1f} MB"
+              f"{int(figs):16d}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] in ("old", "new"):
+        run(sys.argv[1])
+    else:
+        main()
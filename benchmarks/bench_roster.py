@@ -0,0 +1,76 @@
+#Kader mit 100k Athleten: bisherige Formel aus Home.py Zeile für Zeile vs. sportfuel.roster (vektorisiert), jeweils
+#inkl. Einlesen aus CSV bzw. Parquet und Export; 1 % der Zeilen sind ungültig und werden verworfen.
+#Aufruf aus dem Repo-Root: python benchmarks/bench_roster.py [Zeilen]
+import os
+import sys
+import tempfile
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from sportfuel.roster import compute_roster, export_roster, read_roster
+
+
+def make_roster(n, seed=0):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "name":   [f"Athlet {i}" for i in range(n)],
+        "weight": rng.normal(72, 12, n).clip(40, 150).round(1),
+        "height": rng.normal(176, 9, n).clip(140, 210).round(0),
+        "age":    rng.integers(14, 70, n),
+        "sex":    rng.choice(["m", "w"], n),
+    })
+    bad = rng.choice(n, n // 100, replace=False)
+    df.loc[bad[::2], "weight"] = np.nan
+    df.loc[bad[1::2], "sex"] = "?"
+    return df
+
+
+#Bisherige Berechnung aus Home.py, einmal pro Athlet (wie beim Eintippen über die Slider)
+def roster_loop(df):
+    rows = []
+    for r in df.itertuples(index=False):
+        if r.sex not in ("m", "w") or not r.weight > 0:
+            continue
+        if r.sex == "m":
+            grundumsatz = 66.47 + (13.7 * r.weight) + (5.0 * r.height) - (6.8 * r.age)
+        else:
+            grundumsatz = 655.1 + (9.6 * r.weight) + (1.8 * r.height) - (4.7 * r.age)
+        rows.append((r.name, grundumsatz, r.weight * 0.035))
+    return pd.DataFrame(rows, columns=["athlet", "grundumsatz", "fluessigkeit"])
+
+
+def timed(fn):
+    t0 = time.perf_counter()
+    out = fn()
+    return time.perf_counter() - t0, out
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    df = make_roster(n)
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path, pq_path = os.path.join(tmp, "kader.csv"), os.path.join(tmp, "kader.parquet")
+        df.to_csv(csv_path, index=False)
+        df.to_parquet(pq_path, index=False)
+
+        t_loop, old = timed(lambda: roster_loop(pd.read_csv(csv_path)))
+        t_csv, (roster, rejected) = timed(lambda: compute_roster(read_roster(csv_path)))
+        t_pq, (roster_pq, _) = timed(lambda: compute_roster(read_roster(pq_path)))
+        t_calc, _ = timed(lambda: compute_roster(df))
+        t_exp, buf = timed(lambda: export_roster(roster, "csv"))
+        t_exp_pq, buf_pq = timed(lambda: export_roster(roster, "parquet"))
+
+    assert np.allclose(old["grundumsatz"], roster["grundumsatz"]) and np.allclose(old["fluessigkeit"], roster["fluessigkeit"])
+    assert roster.equals(roster_pq)
+    print(f"Kader: {n:,} Zeilen, {len(roster):,} gültig, {len(rejected):,} verworfen")
+    print(f"{'Variante':<34}{'Zeit (ms)':>10}")
+    for name, t in (("Zeilen-Schleife (CSV lesen + Formel)", t_loop), ("vektorisiert, CSV lesen + rechnen", t_csv),
+                    ("vektorisiert, Parquet lesen + rechnen", t_pq), ("nur rechnen (DataFrame im Speicher)", t_calc),
+                    (f"Export CSV ({len(buf) / 1e6:.1f} MB)", t_exp), (f"Export Parquet ({len(buf_pq) / 1e6:.1f} MB)", t_exp_pq)):
+        print(f"{name:<34}{t * 1e3:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
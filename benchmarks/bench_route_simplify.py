@@ -0,0 +1,41 @@
+#Punktanzahl, HTML-Grösse und Renderzeit der Folium-Karte: voller Track vs. vereinfachte Linie (sportfuel.simplify)
+#Aufruf aus dem Repo-Root: python benchmarks/bench_route_simplify.py
+import os
+import sys
+import time
+import folium
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+from sportfuel.simplify import simplify_route
+from synthetic import make_track
+
+
+#Wie auf der Seite: Karte + PolyLine, gerendert zu dem HTML, das st_folium an den Browser schickt
+def render_map(coords):
+    t0 = time.perf_counter()
+    m = folium.Map(location=coords[0].tolist(), zoom_start=13)
+    folium.PolyLine(coords.tolist(), color="blue").add_to(m)
+    html = m.get_root().render()
+    return len(html.encode("utf-8")), time.perf_counter() - t0
+
+
+def main(sizes=(10_000, 100_000, 300_000), tolerance_m=5, max_points=2000):
+    print(f"{'Punkte':>9}{'Karte':>8}{'HTML voll':>11}{'HTML einf.':>12}{'Render voll':>13}{'Render einf.':>14}{'Vereinf.':>10}")
+    for n in sizes:
+        lat, lon, _, _ = make_track(n)
+        coords = np.column_stack([lat, lon])
+        size_full, t_full = render_map(coords)
+        t0 = time.perf_counter()
+        route = simplify_route(coords, tolerance_m, max_points)
+        t_simpl = time.perf_counter() - t0
+        size_s, t_s = render_map(route)
+        print(f"{n:>9,}{len(route):>8,}{size_full / 1e6:>9.2f}MB{size_s / 1e3:>10.0f}kB"
+              f"{t_full * 1e3:>11.0f}ms{t_s * 1e3:>12.0f}ms{t_simpl * 1e3:>8.0f}ms")
+    print("Die Vereinfachung läuft pro Datei nur einmal (st.cache_data, Schlüssel = Datei-Hash).")
+
+
+if __name__ == "__main__":
+    main()
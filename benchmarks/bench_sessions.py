@@ -0,0 +1,167 @@
+#Lasttest ohne Browser: spielt geskriptete Sessions über Streamlits AppTest gegen Home.py, 1_Vor_Workout.py und
+#2_Meal_Plan.py ab (Slider, GPX-Uploads verschiedener Grösse, Snack-Suche, Rezepte durchblättern, Tagesplan).
+#USDA und Edamam sind lokale Stubs (stubs.py), Cache und Food-DB liegen in einem Temp-Ordner. Gemessen werden
+#p50/p95 der Rerun-Latenz und der Speicher pro Session bei steigender Zahl gleichzeitiger Sessions.
+#AppTest hält die Streamlit-Runtime prozessweit, parallele Sessions laufen deshalb in geforkten Prozessen (nach dem
+#Aufwärmen, Caches sind also warm). Alle teilen sich einen CPU-Kern, wie die Session-Threads eines Streamlit-Workers
+#unter dem GIL. Die Kapazität pro Worker ist die höchste Stufe, deren p95 noch unter --slo-ms liegt.
+#Aufruf aus dem Repo-Root: python benchmarks/bench_sessions.py [--levels 1 2 4 8] [--sessions 2] [--slo-ms 1000]
+import argparse
+import multiprocessing
+import os
+import sys
+import tempfile
+import threading
+import time
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+from stubs import start_edamam_stub, start_fdc_stub
+from synthetic import make_gpx_bytes
+
+GPX_SIZES = [1_000, 10_000, 50_000]    #Punkte (1 Hz): ca. 17 min, 2.8 h, 14 h
+API_DELAY = 0.05                       #Latenz der Stubs in Sekunden
+
+
+def rss_mb():
+    with open("/proc/self/status") as f:
+        return next(int(l.split()[1]) for l in f if l.startswith("VmRSS")) / 1024
+
+
+def by_label(widgets, label):
+    return next(w for w in widgets if w.label == label)
+
+
+#Eine Session: Körperdaten, Workout mit GPX-Upload und Snack, danach Rezepte. Gibt die Rerun-Zeiten (s) zurück.
+def run_session(gpx, query):
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(os.path.join(ROOT, "Home.py"), default_timeout=120)
+    times = []
+
+    def rerun():
+        t0 = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - t0)
+        if at.exception:
+            raise RuntimeError(at.exception[0].message)
+
+    rerun()
+    for gewicht in (65, 72, 80):
+        by_label(at.slider, "Gewicht (kg)").set_value(gewicht)
+        rerun()
+
+    at.switch_page("pages/1_Vor_Workout.py")
+    rerun()
+    at.file_uploader[0].set_value(("route.gpx", gpx, "application/gpx+xml"))
+    rerun()
+    by_label(at.select_slider, "Essen alle (Min)").set_value(45)
+    rerun()
+    by_label(at.radio, "Marker platzieren nach").set_value("Distanz")
+    rerun()
+    by_label(at.text_input, "Snack suchen (Schlagwort)").input(query)
+    rerun()
+    by_label(at.button, "hinzufügen").click()
+    rerun()
+
+    at.switch_page("pages/2_Meal_Plan.py")
+    rerun()
+    for slider in [s for s in at.slider if s.label == "Wähle Rezept"]:
+        slider.set_value(min(3, slider.max))
+        rerun()
+    at.sidebar.checkbox[0].check()
+    rerun()
+    return times
+
+
+GPX_FILES = []    #wird vor dem Forken gefüllt
+_MAIN     = sys.modules[__name__]
+
+
+def pin(cpu):
+    os.sched_setaffinity(0, {cpu})
+
+
+#Eine Session im Worker-Prozess: Rerun-Zeiten und Zuwachs des RSS (Spitze während der Session)
+def session_job(i):
+    start = rss_mb()
+    peak  = [start]
+    stop  = threading.Event()
+
+    def sample():
+        while not stop.is_set():
+            peak[0] = max(peak[0], rss_mb())
+            time.sleep(0.02)
+
+    sampler = threading.Thread(target=sample, daemon=True)
+    sampler.start()
+    try:
+        times = run_session(GPX_FILES[i % len(GPX_FILES)], ["banana", "oat bar", "gel", "dates"][i % 4])
+    finally:
+        stop.set()
+        sampler.join()
+    return times, peak[0] - start
+
+
+#Startet `concurrency` Sessions gleichzeitig (insgesamt concurrency * per_worker) auf einem gemeinsamen Kern
+def run_level(concurrency, per_worker, cpu):
+    sys.modules["__main__"] = _MAIN    #AppTest ersetzt __main__ beim Ausführen der Seiten, pickle sucht session_job dort
+    ctx = multiprocessing.get_context("fork")
+    t0 = time.perf_counter()
+    with ctx.Pool(concurrency, initializer=pin, initargs=(cpu,), maxtasksperchild=1) as pool:
+        results = pool.map(session_job, range(concurrency * per_worker), chunksize=1)
+    wall  = time.perf_counter() - t0
+    times = [t for ts, _ in results for t in ts]
+    return {
+        "concurrency": concurrency,
+        "sessions":    len(results),
+        "reruns":      len(times),
+        "reruns_s":    len(times) / wall,
+        "p50":         np.percentile(times, 50) * 1e3,
+        "p95":         np.percentile(times, 95) * 1e3,
+        "mb_session":  np.median([mb for _, mb in results]),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--sessions", type=int, default=2, help="Sessions pro gleichzeitigem Nutzer")
+    parser.add_argument("--slo-ms", type=float, default=1000.0, help="Ziel für p95 der Rerun-Latenz")
+    args = parser.parse_args()
+
+    tmp = tempfile.mkdtemp(prefix="sportfuel-bench-")
+    fdc, fdc_url = start_fdc_stub(API_DELAY)
+    edamam, edamam_url = start_edamam_stub(API_DELAY)
+    os.environ.update({    #muss vor dem ersten Import der Seiten-Module gesetzt sein
+        "FDC_BASE_URL":      fdc_url,
+        "EDAMAM_BASE_URL":   edamam_url,
+        "SPORTFUEL_CACHE_DB": os.path.join(tmp, "cache.sqlite"),
+        "SPORTFUEL_FOOD_DB": os.path.join(tmp, "keine_food_db.sqlite"),    #Snack-Suche geht an den USDA-Stub
+    })
+    os.chdir(ROOT)
+    GPX_FILES[:] = [make_gpx_bytes(n, seed=i) for i, n in enumerate(GPX_SIZES)]
+    cpu = min(os.sched_getaffinity(0))
+
+    run_session(GPX_FILES[0], "warmup")    #Importe, Modell und Tabelle laden, Caches füllen
+    print(f"GPX-Uploads: {', '.join(f'{n:,} Punkte ({len(b) / 1e6:.1f} MB)' for n, b in zip(GPX_SIZES, GPX_FILES))}; "
+          f"API-Stubs mit {API_DELAY * 1e3:.0f} ms Latenz; alle Sessions auf CPU {cpu}")
+    print(f"{'gleichzeitig':>12}{'Sessions':>10}{'Reruns':>8}{'Reruns/s':>10}{'p50 ms':>9}{'p95 ms':>9}{'MB/Session':>12}")
+    capacity = 0
+    for level in args.levels:
+        r = run_level(level, args.sessions, cpu)
+        print(f"{r['concurrency']:>12}{r['sessions']:>10}{r['reruns']:>8}{r['reruns_s']:>10.1f}{r['p50']:>9.0f}"
+              f"{r['p95']:>9.0f}{r['mb_session']:>12.1f}")
+        if r["p95"] <= args.slo_ms:
+            capacity = level
+    print(f"Kapazität pro Worker bei p95 <= {args.slo_ms:.0f} ms: {capacity} gleichzeitige Sessions"
+          + (" (höchste getestete Stufe)" if capacity == args.levels[-1] else ""))
+    print(f"Stub-Anfragen: USDA {fdc.requests}, Edamam {edamam.requests}")
+    fdc.shutdown()
+    edamam.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+#Zeitvergleich: Trainingsdaten-Erzeugung mit verschachtelten Schleifen (alt) vs. Meshgrid/Broadcasting (neu)
+#Aufruf aus dem Repo-Root: python benchmarks/bench_training_set.py
+import os
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "sport-fuel-ml"))
+import train_model as tm
+
+
+#Bisherige Implementierung aus train_model.py als Referenz
+def build_training_set_loop(activities, kcal_per_kg, gewicht_list, dauer_list):
+    records = []
+    for act, kcal_kg in zip(activities, kcal_per_kg):
+        for g in gewicht_list:
+            for d in dauer_list:
+                if "Running" in act:
+                    faktor = 4.3
+                    distanz = d * 0.1
+                elif "Cycling" in act:
+                    faktor = 4.5
+                    distanz = d * 0.25
+                elif "Swimming" in act:
+                    faktor = 10.0
+                    distanz = d * 0.05
+                else:
+                    faktor = 1.0
+                    distanz = d * 0.1
+                kcal = d * g * kcal_kg / 60 * faktor
+                records.append({"Activity": act, "Gewicht": g, "Dauer": d, "Distanz": distanz, "kcal": kcal})
+    return pd.DataFrame(records)
+
+
+def best_of(fn, repeat=3):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        out = fn()
+        times.append(time.perf_counter() - t0)
+    return min(times), out
+
+
+def main():
+    raw = tm.load_exercise_csv()
+    acts, kcal_kg = raw["Activity"], raw["kcal_per_kg"]
+    grids = [
+        ("Standard (5 kg / 20 min)", tm.GEWICHT_RANGE, tm.DAUER_RANGE),
+        ("Fein (1 kg / 5 min)",      (55, 95, 1),      (30, 150, 5)),
+        ("Sehr fein (0.5 kg / 1 min)", (40, 120, 0.5), (15, 300, 1)),
+    ]
+    print(f"{'Raster':<28}{'Zeilen':>12}{'Schleife (s)':>15}{'Vektor (s)':>13}{'Speedup':>10}")
+    for name, gr, dr in grids:
+        g, d = tm.grid_values(*gr), tm.grid_values(*dr)
+        t_vec, df_vec = best_of(lambda: tm.build_training_set(acts, kcal_kg, g, d))
+        t_loop, df_loop = best_of(lambda: build_training_set_loop(acts, kcal_kg, g, d), repeat=1)
+        assert np.array_equal(df_loop["Activity"].to_numpy(), df_vec["Activity"].to_numpy())
+        for col in ["Gewicht", "Dauer", "Distanz", "kcal"]:
+            assert np.allclose(df_loop[col].to_numpy(float), df_vec[col].to_numpy(float), rtol=1e-12), col
+        print(f"{name:<28}{len(df_vec):>12,}{t_loop:>15.3f}{t_vec:>13.4f}{t_loop / t_vec:>9.0f}x")
+
+
+if __name__ == "__main__":
+    main()
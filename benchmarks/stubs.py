@@ -0,0 +1,131 @@
+#Lokale Stub-Server für die externen APIs (USDA FoodData Central, Edamam Recipe Search), damit Benchmarks ohne Netz und API-Key laufen.
+#Jede Antwort kann künstlich verzögert werden (`delay` in Sekunden), um echte Netzwerklatenz nachzubilden.
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+
+def fake_food(fid):
+    rnd = (fid * 7919) % 1000
+    return {
+        "fdcId": fid,
+        "description": f"Snack {fid}",
+        "foodNutrients": [
+            {"nutrient": {"name": "Energy"}, "amount": 300 + rnd % 200},
+            {"nutrient": {"name": "Carbohydrate, by difference"}, "amount": 40 + rnd % 40},
+            {"nutrientName": "Protein", "value": 5 + rnd % 10},
+        ],
+        "servings": {"serving": [{"metricServingUnit": "g", "metricServingAmount": 30 + rnd % 50}]},
+    }
+
+
+class _FdcHandler(BaseHTTPRequestHandler):
+    server_version = "FdcStub/1.0"
+    protocol_version = "HTTP/1.1"    #Keep-Alive, damit Connection-Pooling messbar ist
+    disable_nagle_algorithm = True   #Header und Body sonst mit Delayed-ACK-Pause (40 ms) bei Keep-Alive
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, payload):
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _foods(self, ids):
+        if not self.server.bulk:    #Bulk-Endpunkt abgeschaltet -> Client muss auf Einzelabfragen ausweichen
+            self.send_error(404)
+            return
+        self.server.calls += 1
+        time.sleep(self.server.delay)
+        self._send([fake_food(i) for i in reversed(ids)])    #FDC garantiert keine Reihenfolge
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        qs = parse_qs(url.query)
+        self.server.requests += 1
+        if url.path.endswith("/foods/search"):
+            time.sleep(self.server.delay)
+            q = qs.get("query", [""])[0]
+            size = int(qs.get("pageSize", ["5"])[0])
+            base = sum(map(ord, q)) * 100
+            self._send({"foods": [{"fdcId": base + i, "description": f"{q} {i}"} for i in range(size)]})
+        elif m := re.search(r"/food/(\d+)$", url.path):
+            time.sleep(self.server.delay)
+            self._send(fake_food(int(m.group(1))))
+        elif url.path.endswith("/foods"):
+            self._foods([int(x) for v in qs.get("fdcIds", []) for x in v.split(",")])
+        else:
+            self.send_error(404)
+
+    def do_POST(self):
+        url = urlparse(self.path)
+        self.server.requests += 1
+        length = int(self.headers.get("Content-Length", 0))
+        body = json.loads(self.rfile.read(length) or b"{}")
+        if url.path.endswith("/foods"):
+            self._foods(body.get("fdcIds", []))
+        else:
+            self.send_error(404)
+
+
+#Startet einen Stub in einem Hintergrund-Thread; gibt (server, base_url) zurück, beenden mit server.shutdown()
+def start_fdc_stub(delay=0.0):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FdcHandler)
+    server.daemon_threads = True
+    server.delay, server.requests, server.calls, server.bulk = delay, 0, 0, True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/fdc/v1"
+
+
+def fake_recipe(meal_type, i):
+    rnd = (sum(map(ord, meal_type)) * 31 + i * 7919) % 1000
+    servings = 2 + rnd % 4
+    return {
+        "uri": f"http://www.edamam.com/ontologies/edamam.owl#recipe_{meal_type.lower()}_{i}",
+        "label": f"{meal_type} Rezept {i}",
+        "image": "",
+        "yield": servings,
+        "ingredientLines": [f"{50 + rnd % 200} g Zutat {k}" for k in range(6)],
+        "calories": servings * (300 + rnd % 500),
+        "totalNutrients": {
+            "PROCNT": {"label": "Protein", "quantity": servings * (10 + rnd % 30), "unit": "g"},
+            "FAT":    {"label": "Fat", "quantity": servings * (5 + rnd % 25), "unit": "g"},
+            "CHOCDF": {"label": "Carbs", "quantity": servings * (30 + rnd % 60), "unit": "g"},
+        },
+        "instructions": [f"Schritt {k}" for k in range(4)],
+    }
+
+
+class _EdamamHandler(_FdcHandler):
+    server_version = "EdamamStub/1.0"
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        qs = parse_qs(url.query)
+        self.server.requests += 1
+        if not url.path.endswith("/api/recipes/v2"):
+            self.send_error(404)
+            return
+        time.sleep(self.server.delay)
+        meal_type = qs.get("mealType", [""])[0]
+        n = max(0, 20 - 3 * len(qs.get("diet", [])) - 2 * len(qs.get("health", [])))    #Filter -> weniger Treffer
+        self._send({"from": 1, "to": n, "count": n, "hits": [{"recipe": fake_recipe(meal_type, i)} for i in range(n)]})
+
+    def do_POST(self):
+        self.send_error(405)
+
+
+#Edamam-Stub wie start_fdc_stub; base_url zeigt direkt auf /api/recipes/v2
+def start_edamam_stub(delay=0.0):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _EdamamHandler)
+    server.daemon_threads = True
+    server.delay, server.requests = delay, 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}/api/recipes/v2"
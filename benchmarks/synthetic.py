@@ -0,0 +1,164 @@
+#Synthetische Testdaten für die Benchmarks (GPX-/FIT-Tracks in beliebiger Grösse, FDC-Bulk-Download)
+import numpy as np
+
+
+#Zufallsweg um Zürich: 1 Punkt pro `interval` Sekunden, optional mit Pausen und mehreren Segmenten
+def make_track(n, seed=0, interval=1.0, pauses=False):
+    rng = np.random.default_rng(seed)
+    heading = np.cumsum(rng.normal(0, 0.05, n))
+    step = rng.uniform(2, 4, n) * interval / 1.0 / 111_000    #ca. 2-4 m pro Sekunde in Grad
+    lat = 47.37 + np.cumsum(step * np.cos(heading))
+    lon = 8.54 + np.cumsum(step * np.sin(heading) / np.cos(np.radians(47.37)))
+    ele = 400 + np.cumsum(rng.normal(0, 0.3, n))
+    dt = np.full(n, interval)
+    if pauses:    #vereinzelte lange Pausen (z.B. Verpflegungsstopp) und variable Aufzeichnungsrate
+        dt = rng.choice([1.0, 1.0, 1.0, 5.0, 10.0], n)
+        dt[rng.random(n) < 0.001] = 600.0
+    t = 1_700_000_000 + np.concatenate([[0.0], np.cumsum(dt[1:])])
+    return lat, lon, ele, t
+
+
+def make_gpx_bytes(n, seed=0, segments=1, pauses=False, interval=1.0):
+    lat, lon, ele, t = make_track(n, seed, interval=interval, pauses=pauses)
+    if interval >= 1:
+        stamps = np.datetime_as_string(t.astype("datetime64[s]"), unit="s")
+    else:         #hohe Aufzeichnungsrate (z.B. 20 Hz), Zeitstempel mit Millisekunden
+        stamps = np.datetime_as_string(np.round(t * 1000).astype("datetime64[ms]"), unit="ms")
+    parts = ['<?xml version="1.0" encoding="UTF-8"?>\n'
+             '<gpx version="1.1" creator="sport-fuel-bench" xmlns="http://www.topografix.com/GPX/1/1">\n'
+             '<trk><name>Synthetisch</name>\n']
+    bounds = np.linspace(0, n, segments + 1).astype(int)
+    for s, e in zip(bounds[:-1], bounds[1:]):
+        parts.append("<trkseg>\n")
+        parts.extend(
+            f'<trkpt lat="{lat[i]:.7f}" lon="{lon[i]:.7f}"><ele>{ele[i]:.1f}</ele><time>{stamps[i]}Z</time></trkpt>\n'
+            for i in range(s, e)
+        )
+        parts.append("</trkseg>\n")
+    parts.append("</trk>\n</gpx>\n")
+    return "".join(parts).encode("utf-8")
+
+
+#FIT-CRC laut Garmin FIT SDK
+_CRC_TABLE = [0x0000, 0xCC01, 0xD801, 0x1400, 0xF001, 0x3C00, 0x2800, 0xE401,
+              0xA001, 0x6C00, 0x7800, 0xB401, 0x5000, 0x9C01, 0x8801, 0x4400]
+
+
+def fit_crc(data, crc=0):
+    for byte in data:
+        tmp = _CRC_TABLE[crc & 0xF]
+        crc = ((crc >> 4) & 0x0FFF) ^ tmp ^ _CRC_TABLE[byte & 0xF]
+        tmp = _CRC_TABLE[crc & 0xF]
+        crc = ((crc >> 4) & 0x0FFF) ^ tmp ^ _CRC_TABLE[(byte >> 4) & 0xF]
+    return crc
+
+
+#Aktivitäts-FIT mit n record-Nachrichten (1 Hz): Position, Höhe, Puls, Distanz, Leistung.
+#Alle `event_every` Punkte wird eine event-Nachricht eingestreut; mit compressed=True nutzt jeder zweite Punkt einen
+#komprimierten Zeitstempel-Kopf (eigene Definition ohne timestamp-Feld).
+def make_fit_bytes(n, seed=0, event_every=600, compressed=False):
+    import struct
+    lat, lon, ele, t = make_track(n, seed)
+    rng = np.random.default_rng(seed)
+    fit_t = (t - 631065600).astype(np.uint32)
+    dist = np.concatenate([[0.0], np.cumsum(np.hypot(np.diff(lat) * 111_000, np.diff(lon) * 75_000))])
+
+    rec = np.dtype([("h", "u1"), ("ts", "<u4"), ("lat", "<i4"), ("lon", "<i4"), ("alt", "<u4"),
+                    ("hr", "u1"), ("dist", "<u4"), ("pwr", "<u2")])
+    recs = np.zeros(n, rec)
+    recs["h"] = 1
+    recs["ts"] = fit_t
+    recs["lat"] = np.round(lat / (180.0 / 2 ** 31))
+    recs["lon"] = np.round(lon / (180.0 / 2 ** 31))
+    recs["alt"] = np.round((ele + 500) * 5)
+    recs["hr"] = rng.integers(110, 175, n)
+    recs["dist"] = np.round(dist * 100)
+    recs["pwr"] = rng.integers(150, 320, n)
+
+    def definition(local, global_num, fields):
+        return struct.pack("<BBBHB", 0x40 | local, 0, 0, global_num, len(fields)) + b"".join(struct.pack("BBB", *f) for f in fields)
+
+    body = [definition(0, 0, [(0, 1, 0x00), (1, 2, 0x84), (4, 4, 0x86)]), struct.pack("<BBHI", 0, 4, 1, int(fit_t[0])),
+            definition(1, 20, [(253, 4, 0x86), (0, 4, 0x85), (1, 4, 0x85), (78, 4, 0x86), (3, 1, 0x02), (5, 4, 0x86), (7, 2, 0x84)]),
+            definition(3, 21, [(253, 4, 0x86), (0, 1, 0x00), (1, 1, 0x00)])]
+    comp_rec = np.dtype([("h", "u1"), ("lat", "<i4"), ("lon", "<i4"), ("alt", "<u4"), ("hr", "u1"), ("dist", "<u4"), ("pwr", "<u2")])
+    if compressed:
+        body.append(definition(2, 20, [(0, 4, 0x85), (1, 4, 0x85), (78, 4, 0x86), (3, 1, 0x02), (5, 4, 0x86), (7, 2, 0x84)]))
+    for s in range(0, n, event_every):
+        chunk = recs[s:s + event_every]
+        if compressed:
+            parts = []
+            for i, r in enumerate(chunk):
+                if i % 2:
+                    c = np.zeros(1, comp_rec)
+                    for f in comp_rec.names[1:]:
+                        c[f] = r[f]
+                    c["h"] = 0x80 | (2 << 5) | (int(r["ts"]) & 0x1F)
+                    parts.append(c.tobytes())
+                else:
+                    parts.append(r.tobytes())
+            body.append(b"".join(parts))
+        else:
+            body.append(chunk.tobytes())
+        body.append(struct.pack("<BIBB", 3, int(chunk["ts"][-1]), 0, 4))    #event: timer
+    data = b"".join(body)
+    header = struct.pack("<BBHI4s", 14, 0x20, 2132, len(data), b".FIT")
+    header += struct.pack("<H", fit_crc(header))
+    out = header + data
+    return out + struct.pack("<H", fit_crc(out))
+
+
+#FDC-Bulk-Download im CSV-Format (food, food_nutrient, branded_food, food_portion) mit `n` Lebensmitteln.
+#Pro Lebensmittel ca. 12 Nährstoffzeilen, davon 2-3 relevant; Beschreibungen teils mit Kommas und Anführungszeichen.
+FDC_WORDS = ["banana", "energy", "bar", "gel", "dates", "rice", "cake", "pretzel", "oat", "honey", "chocolate",
+             "peanut", "butter", "almond", "raisin", "apple", "sports", "drink", "chews", "bread", "cereal", "mango"]
+
+
+def write_fdc_csv(directory, n, seed=0):
+    import os
+    import pandas as pd
+    rng = np.random.default_rng(seed)
+    os.makedirs(directory, exist_ok=True)
+    ids = 100_000 + np.arange(n)
+    words = np.array(FDC_WORDS)[rng.integers(0, len(FDC_WORDS), (n, 3))]
+    desc = pd.Series([" ".join(w) for w in words])
+    desc[rng.random(n) < 0.2] += ', "original", with salt'
+    branded = rng.random(n) < 0.6
+    pd.DataFrame({"fdc_id": ids, "data_type": np.where(branded, "branded_food", "sr_legacy_food"),
+                  "description": desc, "food_category_id": rng.integers(1, 30, n),
+                  "publication_date": "2024-04-18"}).to_csv(os.path.join(directory, "food.csv"), index=False)
+
+    k = 12
+    nut_ids = np.tile(np.array([1003, 1004, 1005, 1008, 1079, 1087, 1089, 1092, 1093, 1162, 2000, 2047]), n)
+    amount = rng.uniform(0, 500, n * k).round(2)
+    amount[rng.random(n * k) < 0.02] = np.nan
+    pd.DataFrame({"id": np.arange(n * k), "fdc_id": np.repeat(ids, k), "nutrient_id": nut_ids, "amount": amount,
+                  "data_points": "", "derivation_id": 71, "min": "", "max": "", "median": "", "footnote": "",
+                  "min_year_acquired": ""}).to_csv(os.path.join(directory, "food_nutrient.csv"), index=False)
+
+    b = ids[branded]
+    pd.DataFrame({"fdc_id": b, "brand_owner": "Acme", "gtin_upc": b * 7, "serving_size": rng.uniform(20, 80, len(b)).round(0),
+                  "serving_size_unit": rng.choice(["g", "GRM", "ml"], len(b), p=[0.6, 0.3, 0.1]),
+                  "household_serving_fulltext": "1 bar"}).to_csv(os.path.join(directory, "branded_food.csv"), index=False)
+    p = np.repeat(ids[~branded], 2)
+    pd.DataFrame({"id": np.arange(len(p)), "fdc_id": p, "seq_num": np.tile([1, 2], len(p) // 2), "amount": 1,
+                  "measure_unit_id": 9999, "portion_description": "", "modifier": "medium",
+                  "gram_weight": rng.uniform(10, 150, len(p)).round(1)}).to_csv(os.path.join(directory, "food_portion.csv"), index=False)
+
+
+#Rezept-Pool im Format der Edamam-Treffer: kcal pro Portion 250-1100, Makroanteile zufällig (Kohlenhydrate 20-70 %)
+def make_recipes(n, meal_type="Lunch", seed=0):
+    rng = np.random.default_rng([seed, sum(map(ord, meal_type))])
+    y = rng.integers(1, 7, n)
+    kcal = rng.uniform(250, 1100, n)
+    carb_share = rng.uniform(0.2, 0.7, n)
+    prot_share = rng.uniform(0.1, 0.35, n)
+    return [{
+        "uri": f"recipe_{meal_type.lower()}_{seed}_{i}", "label": f"{meal_type} {i}", "yield": int(y[i]),
+        "calories": float(kcal[i] * y[i]),
+        "totalNutrients": {"CHOCDF": {"quantity": float(kcal[i] * carb_share[i] / 4 * y[i])},
+                           "PROCNT": {"quantity": float(kcal[i] * prot_share[i] / 4 * y[i])},
+                           "FAT":    {"quantity": float(kcal[i] * max(1 - carb_share[i] - prot_share[i], 0.05) / 9 * y[i])}},
+        "dietLabels": ["Balanced"] if i % 3 else ["Low-Carb"],
+        "healthLabels": ["Vegetarian"] if i % 2 else [],
+    } for i in range(n)]
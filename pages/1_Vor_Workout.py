@@ -1,17 +1,26 @@
 import os                                           #-> siehe requirements.txt
+import hashlib
 import streamlit as st
 import pandas as pd
 import numpy as np
-import requests
-import gpxpy
-import folium
-from streamlit_folium import st_folium
-import altair as alt
-import joblib
+# folium/streamlit_folium (Karte), altair (Fueling-Chart) und requests (USDA-Client) werden erst dort importiert, wo sie
+# gebraucht werden; sportfuel.warmup lädt sie nach dem ersten Rerun im Hintergrund vor
+from sportfuel import perf, warmup
+from sportfuel.calories import ACTIVITY_MAP, fallback_kcal, load_calorie_lookup as load_lookup_file, load_calorie_model
+from sportfuel.disk_cache import DiskCache
+from sportfuel.food_db import DEFAULT_PATH as FOOD_DB_PATH, FoodDB
+from sportfuel.fueling import (CARB_TOLERANCE_G, DRINK_INTERVALS, EAT_INTERVALS, FLUID_TOLERANCE_L, Simulation,
+                               intake_amounts, suggest_intervals)
+from sportfuel.fit_stream import parse_fit
+from sportfuel.gpx_export import intake_waypoints, read_export
+from sportfuel.gpx_stream import parse_gpx
+from sportfuel.simplify import simplify_route
+from sportfuel.roster import select_athlete
 
 # Seitenkonfiguration
 # Legt den Titel und Layout der Streamlit-App fest
 st.set_page_config(page_title="Sport-Fuel Guide", layout="wide")
+perf.start_rerun("Vor_Workout")    #Zeitmessung pro Abschnitt, nur mit SPORTFUEL_PERF aktiv
 
 # Vor-Workout Planung
 # ----------------------------
@@ -21,41 +30,61 @@ st.set_page_config(page_title="Sport-Fuel Guide", layout="wide")
 if "gewicht" not in st.session_state:
     st.warning("Bitte gib zuerst deine Körperdaten auf der Startseite ein.")
     st.stop()
-# Liest das gespeicherte Gewicht aus dem Session-State
-gewicht = st.session_state.gewicht
+# Liest das gespeicherte Gewicht aus dem Session-State, bzw. das des gewählten Athleten, falls auf Home ein Kader geladen ist
+athlet  = select_athlete()
+gewicht = athlet["gewicht"] if athlet else st.session_state.gewicht
 
 # Auswahl der Sportart und Datenquelle
 sportart = st.selectbox("Sportart", ["Laufen", "Radfahren", "Schwimmen"])
-mode     = st.radio("Datenquelle wählen", ["GPX-Datei hochladen", "Manuelle Eingabe"])
-
-# Wenn der Nutzer eine GPX-Datei hochlädt, wird sie eingelesen und geparst
-if mode == "GPX-Datei hochladen":
-    uploaded = st.file_uploader("GPX-Datei hochladen", type="gpx")
+mode     = st.radio("Datenquelle wählen", ["GPX/FIT-Datei hochladen", "Manuelle Eingabe"])
+
+# Die Seite rechnet in Stufen: Track -> Kalorien -> Intake-Plan -> Karte bzw. Fueling-Chart. Jede Stufe ist auf ihre
+# tatsächlichen Eingaben gecacht (Datei-Hash, Skalare), ein Rerun berechnet also nur die Stufen neu, deren Eingaben sich
+# geändert haben. Die Karte ist ein Fragment: der Marker-Umschalter lädt nur die Karte neu, nicht die ganze Seite.
+
+# Inhalts-Hash der hochgeladenen Datei, einmal pro Upload (file_id) berechnet statt bei jedem Rerun
+def content_hash(uploaded):
+    cached = st.session_state.get("_track_hash")
+    if cached is None or cached[0] != uploaded.file_id:
+        cached = (uploaded.file_id, hashlib.sha1(uploaded.getbuffer()).hexdigest())
+        st.session_state["_track_hash"] = cached
+    return cached[1]
+
+@st.cache_resource(max_entries=16)
+# Geparster Track pro Datei-Inhalt; cache_resource, weil der Track nur gelesen wird und nicht kopiert werden muss
+def parsed_track(file_hash, _uploaded, is_fit):
+    perf.mark_miss()
+    _uploaded.seek(0)
+    return parse_fit(_uploaded).to_track() if is_fit else parse_gpx(_uploaded)    # FIT z.B. von Garmin-Geräten
+
+# Wenn der Nutzer eine GPX- oder FIT-Datei hochlädt, wird sie eingelesen und geparst
+if mode == "GPX/FIT-Datei hochladen":
+    uploaded = st.file_uploader("GPX- oder FIT-Datei hochladen", type=["gpx", "fit"])
     if not uploaded:
-        st.error("Bitte eine GPX-Datei hochladen.")
+        st.error("Bitte eine GPX- oder FIT-Datei hochladen.")
         st.stop()
+    is_fit = uploaded.name.lower().endswith(".fit")
     try:
-        # Parse die GPX-Datei und berechne Dauer und Distanz
-        gpx          = gpxpy.parse(uploaded.getvalue().decode())
-        duration_sec = gpx.get_duration() or 0
+        # Parse die Datei als Stream direkt aus dem Byte-Puffer und berechne Dauer und Distanz
+        track_hash   = content_hash(uploaded)    # Schlüssel für alle Stufen, die vom Track abhängen
+        with perf.stage("track_parse", cached=True, bytes=uploaded.size, format="fit" if is_fit else "gpx") as s:
+            track    = parsed_track(track_hash, uploaded, is_fit)
+            s.set(points=len(track.coords))
+        duration_sec = track.duration or 0
         dauer        = duration_sec / 60                  # Dauer in Minuten
-        distanz      = (gpx.length_3d() or 0) / 1000       # Distanz in Kilometern
-        # Extrahiere Koordinaten für die Karte
-        coords       = [
-            (pt.latitude, pt.longitude)
-            for tr in gpx.tracks
-            for seg in tr.segments
-            for pt in seg.points
-        ]
+        distanz      = track.length_3d / 1000              # Distanz in Kilometern
+        # Koordinaten für die Karte als (n, 2) NumPy-Array
+        coords       = track.coords
     except Exception as e:
-        st.error(f"Fehler beim Parsen der GPX-Datei: {e}")
+        st.error(f"Fehler beim Parsen der {'FIT' if is_fit else 'GPX'}-Datei: {e}")
         st.stop()
         
 # Manuelle Eingabe von Dauer und Distanz
 else:
     dauer   = st.slider("Dauer (Min)", 15, 300, 60)
     distanz = st.number_input("Distanz (km)", 0.0, 100.0, 10.0)
-    coords  = []
+    coords  = np.empty((0, 2))
+    track   = track_hash = None
 
 # Ausgabe der eingegebenen Werte
 st.markdown(f"**Dauer:** {dauer:.0f} Min • **Distanz:** {distanz:.2f} km")
@@ -63,37 +92,58 @@ st.markdown(f"**Dauer:** {dauer:.0f} Min • **Distanz:** {distanz:.2f} km")
 #Machine Learning Teil
 # -----------
 @st.cache_resource
-# Lädt das vortrainierte Modell nur einmal und cached es
+# Lädt das vortrainierte Modell nur einmal und cached es. Bevorzugt wird der kompakte Export aus train_model.py
+# (memmap, ohne sklearn); joblib/sklearn werden nur importiert, wenn es den Export nicht gibt. Gleicher Lader wie sportfuel.batch.
 def load_model():
-    return joblib.load("models/calorie_predictor.pkl")
-
-model = load_model()
-
-# Mapping der Sportart auf den ML-verständlichen Activity-String
-activity_map = {
-    "Laufen": "Running, 6 mph (10 min mile)",
-    "Radfahren": "Cycling, 14-15.9 mph",
-    "Schwimmen": "Swimming laps, freestyle, fast"
-}
-activity = activity_map[sportart]
-
-# Bereitet das DataFrame für das Modell vor
-X = pd.DataFrame([{  
-    "Activity": activity,
-    "Sportart": sportart,
-    "Gewicht": gewicht,
-    "Dauer": dauer,
-    "Distanz": distanz
-}])
-
-# Versucht die Vorhersage mit dem Modell, ansonsten Fall-Back-Formel. Die nächten 7 Codezeilen erstellt mit Hilfe von: OpenAI. (2025). ChatGPT 4O (Version vom 29.04.2025) [Large language model]. https://chat.openai.com/chat.
-try:
-    cal_burn = model.predict(X)[0]
+    perf.mark_miss()
+    return load_calorie_model()
+
+@st.cache_resource
+# Lädt die vorberechnete Kalorien-Tabelle aus train_model.py (None, falls sie fehlt oder unplausibel ist; dann rechnet
+# das Modell). Gleicher Lader wie sportfuel.batch, beide fragen zuerst die Tabelle und nur ausserhalb davon das Modell.
+def load_calorie_lookup():
+    perf.mark_miss()
+    return load_lookup_file()
+
+@st.cache_data(max_entries=256)
+# Kalorienschätzung für eine Kombination der Eingaben: (kcal, Quelle, Fehlermeldung des Modells oder None).
+# Schneller Weg: multilineare Interpolation in der Tabelle, NaN wenn die Eingaben ausserhalb des Rasters liegen
+def estimate_calories(sportart, gewicht, dauer, distanz):
+    perf.mark_miss()
+    activity = ACTIVITY_MAP[sportart]
+    with perf.stage("lookup_load", cached=True):
+        lookup = load_calorie_lookup()
+    with perf.stage("lookup_predict"):
+        cal_burn = lookup.predict_arrays(activity, gewicht, dauer, distanz)[0] if lookup else np.nan
+    if not np.isnan(cal_burn):
+        return float(cal_burn), "Tabelle", None
+
+    # Bereitet das DataFrame für das Modell vor
+    X = pd.DataFrame([{  
+        "Activity": activity,
+        "Sportart": sportart,
+        "Gewicht": gewicht,
+        "Dauer": dauer,
+        "Distanz": distanz
+    }])
+
+    # Versucht die Vorhersage mit dem Modell, ansonsten Fall-Back-Formel. Die nächten 7 Codezeilen erstellt mit Hilfe von: OpenAI. (2025). ChatGPT 4O (Version vom 29.04.2025) [Large language model]. https://chat.openai.com/chat.
+    try:
+        with perf.stage("model_load", cached=True):
+            model = load_model()
+        with perf.stage("model_predict"):
+            return max(float(model.predict(X)[0]), 0.0), "Modell", None    #nie negative kcal
+    except Exception as e:
+        return float(fallback_kcal(sportart, gewicht, dauer)), "Formel", str(e)
+
+with perf.stage("calorie_estimate", cached=True):
+    cal_burn, cal_source, model_error = estimate_calories(sportart, gewicht, dauer, distanz)
+if cal_source == "Tabelle":
+    st.success(f"✅ Modell verwendet (Tabelle): → {int(cal_burn)} kcal")
+elif cal_source == "Modell":
     st.success(f"✅ Modell verwendet: → {int(cal_burn)} kcal")
-except Exception as e:
-    st.warning(f"⚠️ Fehler beim Modell: {e}. Formel wird verwendet.")
-    faktoren = {"Laufen": 7, "Radfahren": 5, "Schwimmen": 6}
-    cal_burn = faktoren[sportart] * gewicht * (dauer / 60)
+else:
+    st.warning(f"⚠️ Fehler beim Modell: {model_error}. Formel wird verwendet.")
 
 # Berechnet den geschätzten Flüssigkeitsverlust (L pro Stunde). Quelle: Hirsladen: https://www.hirslanden.ch/de/hirslandenblog/medizin/trinken-beim-sport.html#:~:text=Hier%20sollten%20Sie%20auch%20w%C3%A4hrend,Schweissverlustes%20an%20Fl%C3%BCssigkeit%20wieder%20aufzunehmen.&text=Das%20American%20College%20of%20Sports
 fluid_loss = 0.7 * (dauer / 60)
@@ -111,31 +161,34 @@ st.write(
 
 # Intake-Plan erstellen: Essen und Trinken
 # ---------------------
-# Intervall-Auswahl für Essen und Trinken
-eat_int   = st.select_slider("Essen alle (Min)",   [15,20,30,45,60], 30)
-drink_int = st.select_slider("Trinken alle (Min)", [10,15,20,30],   15)
-
-# Ermittelt alle Zeitpunkte innerhalb der Trainingseinheit
-events    = sorted(
-    set(range(eat_int,   int(dauer)+1, eat_int  )) |
-    set(range(drink_int, int(dauer)+1, drink_int))
-)
-
-# Berechnet benötigte Kalorien und Flüssigkeit pro Event
-eat_events = [t for t in events if t % eat_int == 0]
-req_cal = cal_burn / len(eat_events) if eat_events else 0
-
-req_fluid = fluid_loss / len(events) if events else 0
-
-# Erstellt eine Tabelle mit Minuten und Empfehlung pro Event
-schedule = []
-for t in events:
-    row = {"Minute": t}
-    if t % eat_int   == 0: row["Essen (kcal)"] = round(req_cal,   1)
-    if t % drink_int == 0: row["Trinken (L)"]  = round(req_fluid, 3)
-    schedule.append(row)
-
-df_schedule = pd.DataFrame(schedule).set_index("Minute")  
+# Vorschlag: alle Intervall-Kombinationen auf einmal simuliert (sportfuel.fueling), wenigste Stopps ohne grossen Rückstand
+sug_eat, sug_drink, _ = suggest_intervals(dauer, gewicht, fluid_loss, EAT_INTERVALS, DRINK_INTERVALS)
+
+def apply_suggestion():
+    st.session_state.eat_int, st.session_state.drink_int = sug_eat, sug_drink
+
+# Intervall-Auswahl für Essen und Trinken; Startwerte über den Session-State, damit "übernehmen" sie setzen kann
+if "eat_int" not in st.session_state:
+    st.session_state.eat_int, st.session_state.drink_int = 30, 15
+eat_int   = st.select_slider("Essen alle (Min)",   list(EAT_INTERVALS),   key="eat_int")
+drink_int = st.select_slider("Trinken alle (Min)", list(DRINK_INTERVALS), key="drink_int")
+if (eat_int, drink_int) != (sug_eat, sug_drink):
+    c1, c2 = st.columns([5,1])
+    c1.caption(f"Vorschlag für {dauer:.0f} Min: Essen alle {sug_eat} Min, Trinken alle {sug_drink} Min "
+               f"(wenigste Stopps, Rückstand höchstens {CARB_TOLERANCE_G:.0f} g Carbs / {FLUID_TOLERANCE_L:.2f} L)")
+    c2.button("übernehmen", on_click=apply_suggestion)
+
+@st.cache_data(max_entries=256)
+# Zeitpunkte (Minuten) und Tabelle mit Empfehlung pro Event: Bedarf gleichmässig auf die Ess- bzw. Trink-Zeitpunkte verteilt
+def intake_schedule(dauer, cal_burn, fluid_loss, eat_int, drink_int):
+    perf.mark_miss()
+    events, kcal, fluid = intake_amounts(dauer, cal_burn, fluid_loss, eat_int, drink_int)
+    df = pd.DataFrame({"Minute": events, "Essen (kcal)": kcal.round(1), "Trinken (L)": fluid.round(3)})
+    return tuple(events.tolist()), df.set_index("Minute")
+
+with perf.stage("intake_schedule", cached=True) as s:
+    events, df_schedule = intake_schedule(dauer, cal_burn, fluid_loss, eat_int, drink_int)
+    s.set(events=len(events))
 st.subheader("Dein persönlicher Intake-Plan")
 st.table(df_schedule)
 
@@ -144,25 +197,34 @@ st.table(df_schedule)
 # -------
 FDC_API_KEY = "XDzSn37cJ5NRjskCXvg2lmlYUYptpq8tT68mPmPP"        #Eingabe der API. Quelle: U.S. Department of Agriculture, https://fdc.nal.usda.gov/api-guide
 
+@st.cache_resource
+# Ein FDC-Client pro Prozess: gepoolte HTTP-Verbindungen mit Timeouts/Retries und gemeinsamer SQLite-Cache für alle Worker
+def fdc_client():
+    from sportfuel.fdc import FdcClient
+    return FdcClient(FDC_API_KEY, cache=DiskCache())
+
+@st.cache_resource
+# Lokale Nährwert-Datenbank aus dem FDC-Bulk-Download (python -m sportfuel.food_db ...), None wenn nicht importiert
+def food_db():
+    return FoodDB() if os.path.exists(FOOD_DB_PATH) else None
+
+# Volltextsuche in der lokalen Datenbank, leer wenn sie fehlt oder nichts findet
+def search_local_foods(q, limit=5):
+    db = food_db()
+    return db.search(q, limit) if db is not None else []
+
 @st.cache_data
 # Sucht Snacks anhand eines Stichworts und limit Quelle: U.S. Department of Agriculture, https://fdc.nal.usda.gov/api-guide
 def search_foods(q, limit=5):
-    r = requests.get(
-        "https://api.nal.usda.gov/fdc/v1/foods/search",
-        params={"api_key":FDC_API_KEY,"query":q,"pageSize":limit}
-    )
-    r.raise_for_status()
-    return r.json().get("foods", [])
+    perf.mark_miss()
+    return fdc_client().search_foods(q, limit)
 
 @st.cache_data
-# Holt detaillierte Nährstoffdaten für ein Food-Item Quelle: U.S. Department of Agriculture, https://fdc.nal.usda.gov/api-guide
-def get_food_details(fid):
-    r = requests.get(
-        f"https://api.nal.usda.gov/fdc/v1/food/{fid}",
-        params={"api_key":FDC_API_KEY}
-    )
-    r.raise_for_status()
-    return r.json()
+# Holt detaillierte Nährstoffdaten für alle Food-Items einer Suche auf einmal (Bulk-Endpunkt bzw. parallel), Reihenfolge wie fids
+# Quelle: U.S. Department of Agriculture, https://fdc.nal.usda.gov/api-guide
+def get_foods_details(fids):
+    perf.mark_miss()
+    return fdc_client().get_foods_details(fids)
 
 # Initialisiert den Warenkorb im Session-State
 if "cart" not in st.session_state:
@@ -172,36 +234,29 @@ st.subheader("Snack-Empfehlungen (via USDA)")
 snack_query = st.text_input("Snack suchen (Schlagwort)", "")
 
 if snack_query:
-    foods = search_foods(snack_query, limit=5)        #Erscheinung von 5 Suchresultaten
+    with perf.stage("food_db_search") as s:
+        foods = search_local_foods(snack_query, limit=5)    #zuerst die lokale FDC-Datenbank (ohne Netz)
+        s.set(items=len(foods))
+    local = bool(foods)
+    if not local:
+        with perf.stage("fdc_search", cached=True) as s:
+            foods = search_foods(snack_query, limit=5)        #Erscheinung von 5 Suchresultaten
+            s.set(items=len(foods))
+        with perf.stage("fdc_details", cached=True, items=len(foods)):
+            details = get_foods_details(tuple(food.get("fdcId") for food in foods)) if foods else []
+        from sportfuel.fdc import snack_nutrients
+        foods = [{**snack_nutrients(d), "description": food.get("description","Unbekannt")} for food, d in zip(foods, details)]
     if not foods:
         st.warning("Keine Produkte gefunden – versuche ein anderes Stichwort.")     #Keine Resultate gefunden
     else:
         for food in foods:
-            desc    = food.get("description","Unbekannt")
-            fdc     = food.get("fdcId")
-            details = get_food_details(fdc)
-
-            # Robustes Nährstoff-Dictionary wird erstellt. Code erstellt mit Hilfe von: OpenAI. (2025). ChatGPT 4O (Version vom 29.04.2025) [Large language model]. https://chat.openai.com/chat.
-            nut = {}
-            for n in details.get("foodNutrients",[]):
-                if "nutrient" in n and isinstance(n["nutrient"], dict):
-                    k = n["nutrient"].get("name"); v = n.get("amount",0)
-                elif "nutrientName" in n:
-                    k = n.get("nutrientName");     v = n.get("value",0)
-                else:
-                    continue
-                if k:
-                    nut[k] = v or 0
-
-            # Nährwerte pro 100g Quelle: U.S. Department of Agriculture, https://fdc.nal.usda.gov/api-guide
-            cal100  = nut.get("Energy") or nut.get("Calories") or 0
-            carb100 = nut.get("Carbohydrate, by difference",0)
-
-            # Bestimme Portionsgröße in Gramm Quelle: U.S. Department of Agriculture, https://fdc.nal.usda.gov/api-guide
-            servs     = details.get("servings",{}).get("serving",[])
-            if isinstance(servs,dict): servs=[servs]
-            gs        = next((s for s in servs if s.get("metricServingUnit")=="g"), servs[0] if servs else {}).get("metricServingAmount",100)
-            gram_serv = float(gs)
+            desc    = food["description"]
+            fdc     = food["fdcId"]
+
+            # Nährwerte pro 100g und Portionsgröße in Gramm Quelle: U.S. Department of Agriculture, https://fdc.nal.usda.gov/api-guide
+            cal100    = food["kcal_100g"]
+            carb100   = food["carbs_100g"]
+            gram_serv = food["serving_g"]
 
             # Berechne Nährwerte pro Portion klassische 3 Satz Berechnung
             kcal_serv = cal100  * gram_serv/100.0
@@ -220,9 +275,28 @@ if snack_query:
                         "kcal":       kcal_serv,
                         "carbs":      carb_serv
                     })
+        # Herkunft der Treffer: lokale Datenbank oder Cache-Trefferquote und mittlere Latenz der USDA-Aufrufe
+        if local:
+            st.caption(f"Lokale FDC-Datenbank: {len(food_db()):,} Lebensmittel")
+        else:
+            fdc_stats = fdc_client().stats()
+            st.caption(f"USDA-Cache: {fdc_stats['hit_rate']:.0%} Treffer ({fdc_stats['hits']}/{fdc_stats['hits'] + fdc_stats['misses']}), "
+                       f"{fdc_stats['http_requests']} API-Aufrufe, Ø {fdc_stats['http_avg_ms']:.0f} ms")
 
 # Darstellung des Warenkorbs und Fueling-Chart
 # -------------------------
+@st.cache_data(max_entries=64)
+# Fueling: Bedarf vs. Zufuhr minutengenau als Plot-Tabelle. Die Carbs aus dem Warenkorb werden an den Ess-Zeitpunkten
+# gegessen; Bedarf 1.5 g pro kg und Stunde. Quelle: Hirsladen: https://www.hirslanden.ch/de/hirslandenblog/medizin/trinken-beim-sport.html#:~:text=Hier%20sollten%20Sie%20auch%20w%C3%A4hrend,Schweissverlustes%20an%20Fl%C3%BCssigkeit%20wieder%20aufzunehmen.&text=Das%20American%20College%20of%20Sports
+def fueling_frame(dauer, gewicht, total_carbs, eat_int):
+    sim   = Simulation(dauer, gewicht, eat_int, cart_carbs=total_carbs)    #nur Kohlenhydrate, ohne Trinkplan
+    hours = sim.t / 60
+    return pd.DataFrame({
+        "Hour":  np.concatenate([hours, hours]),
+        "Carbs": np.concatenate([sim.carbs_demand, sim.carbs_cart]).round(1),
+        "Type":  np.repeat(["Required", "Consumed"], len(hours)),
+    })
+
 cart = st.session_state.cart        #Warenkorb wieder abrufen
 if cart:
     df_cart = pd.DataFrame(cart)      #Umwandlung Liste von Snacks in DataFrame Tabelle
@@ -234,61 +308,91 @@ if cart:
                .rename(columns={"step":"#","description":"Snack","carbs":"Carbs (g)"}) #Umbennennung der Spaltenüberschriften zur besseren Lesbarkeit
     )
   
-    # Fueling: Bedarf vs. Zufuhr
-    hours      = np.arange(0, dauer/60 + 1, 1)    #Erstellung von Stundenmarken von 0 bis zur Dauer der Aktivität
-    req_hourly = gewicht * 1.5                      # Quelle: Hirsladen: https://www.hirslanden.ch/de/hirslandenblog/medizin/trinken-beim-sport.html#:~:text=Hier%20sollten%20Sie%20auch%20w%C3%A4hrend,Schweissverlustes%20an%20Fl%C3%BCssigkeit%20wieder%20aufzunehmen.&text=Das%20American%20College%20of%20Sports
-    req_cum    = hours * req_hourly                #Rechnet wie viele g Carbs man bis zu jeder Stunde komuliert benötigt wird
-
-    total_carbs = df_cart["carbs"].sum()        #Summe alles Kcal die durch Snacks aufgenommen werden
-
-    df_req = pd.DataFrame({"Hour": hours, "Carbs": req_cum, "Type":"Required"}) #Soll-Werte Kcal pro Stunde
-    df_act = pd.DataFrame({                            #Ist-Wert am Schluss des Workouts
-        "Hour":    [hours.max()],
-        "Carbs":   [total_carbs],
-        "Type":    ["Consumed"]
-    })
-
-    df_plot = pd.concat([df_req, df_act], ignore_index=True)    #Verbindet beide Tabellen also Bedarf + nötige Kcal Zufuhr in eine Plot Tabelle
+    df_plot = fueling_frame(dauer, gewicht, float(df_cart["carbs"].sum()), eat_int)
 
     st.subheader("Kumulative Kohlenhydrat-Zufuhr vs. Bedarf")    #Visualisierung mit alt->requirements.txt
-    chart = (
-        alt.Chart(df_plot)
-           .mark_line(point=True)
-           .encode(
-               x=alt.X("Hour:Q", title="Stunden seit Workout"),
-               y=alt.Y("Carbs:Q", title="Kohlenhydrate (g)"),
-               color="Type:N",
-               tooltip=["Type","Carbs"]
-           )
-           .properties(width=700, height=400)
-    )
-    st.altair_chart(chart, use_container_width=True)
+    with perf.stage("fueling_chart", points=len(df_plot)):
+        import altair as alt    #Visualisierung mit alt->requirements.txt, nur mit Warenkorb
+        chart = (
+            alt.Chart(df_plot)
+               .mark_line(interpolate="step-after")
+               .encode(
+                   x=alt.X("Hour:Q", title="Stunden seit Workout"),
+                   y=alt.Y("Carbs:Q", title="Kohlenhydrate (g)"),
+                   color="Type:N",
+                   tooltip=["Type","Carbs"]
+               )
+               .properties(width=700, height=400)
+        )
+        st.altair_chart(chart, use_container_width=True)
 
 # 3) Route-Map & GPX-Download
 # ----
-if coords:                #Sind Koordinatenpunkte da?
+ROUTE_TOLERANCE_M = 5       # erlaubte Abweichung der Kartenlinie vom Track in Metern
+ROUTE_MAX_POINTS  = 2000    # höchstens so viele Punkte werden an den Browser geschickt
+
+@st.cache_data(max_entries=16)
+# Vereinfachte Kartenlinie (Douglas-Peucker), gecacht pro Datei-Hash; _coords wird von Streamlit nicht gehasht
+def route_geometry(file_hash, _coords, tolerance_m, max_points):
+    perf.mark_miss()
+    return simplify_route(_coords, tolerance_m, max_points)
+
+@st.cache_data(max_entries=64)
+# Positionen der Ess-/Trink-Marker pro Track, Zeitpunkten und Modus; _track wird über file_hash identifiziert
+def marker_positions(file_hash, _track, events, by, dauer):
+    perf.mark_miss()
+    return _track.positions_at(np.asarray(events, dtype=float), by=by, dauer_min=dauer)
+
+@st.fragment
+# Karte mit Route und Markern als Fragment: der Marker-Umschalter rerunnt nur diesen Teil der Seite
+def route_map(track, track_hash, events, eat_int, drink_int, dauer, cal_burn, fluid_loss):
+    import folium                              #nur mit hochgeladenem Track
+    from streamlit_folium import st_folium
+    coords = track.coords
     # Erstelle Folium-Karte mit Track. Quelle: Folium: https://python-visualization.github.io/folium/latest/reference.html
-    m = folium.Map(location=coords[0], zoom_start=13)
-    folium.PolyLine(coords, color="blue").add_to(m)
-    # Markiere Essen-/Trinken-Zeitpunkte auf der Karte
-    for t in events:        #Zeitpunkte für Ess- und Trinkaufnahme markieren. Quelle: Folium: https://python-visualization.github.io/folium/latest/reference.html
-        idx = min(int(t/dauer*len(coords)), len(coords)-1)
-        lat, lon = coords[idx]
+    m = folium.Map(location=coords[0].tolist(), zoom_start=13)
+    with perf.stage("route_simplify", cached=True, points_in=len(coords)) as s:
+        route = route_geometry(track_hash, coords, ROUTE_TOLERANCE_M, ROUTE_MAX_POINTS)
+        s.set(points=len(route))
+    folium.PolyLine(route.tolist(), color="blue").add_to(m)
+    # Markiere Essen-/Trinken-Zeitpunkte auf der Karte: alle Positionen auf einmal über den Zeit-/Distanzindex des Tracks
+    marker_mode = st.radio("Marker platzieren nach", ["Zeit", "Distanz"], horizontal=True)
+    by = "time" if marker_mode == "Zeit" else "distance"
+    with perf.stage("marker_positions", cached=True, markers=len(events)):
+        positions = marker_positions(track_hash, track, events, by, dauer)
+    is_eat      = np.asarray(events) % eat_int == 0
+    for (lat, lon), eat in zip(positions.tolist(), is_eat):    #Zeitpunkte für Ess- und Trinkaufnahme markieren. Quelle: Folium: https://python-visualization.github.io/folium/latest/reference.html
         folium.CircleMarker(                #Setzt Punkt auf Karte
             (lat, lon),
             radius=5,
-            color="red" if t%eat_int==0 else "yellow",
+            color="red" if eat else "yellow",
             fill=True
         ).add_to(m)
     st.subheader("Route & Timing auf der Karte")        #Einfügen der Karte in Streamlit
-    st_folium(m, width=700, height=400)
-    # Bietet die Route als GPX zum Download an
+    with perf.stage("map_render", points=len(route), markers=len(positions)):
+        st_folium(m, width=700, height=400)
+    # Bietet die Route als GPX mit den Ess-/Trink-Zeitpunkten als Wegpunkte zum Download an (auch für FIT-Uploads).
+    # Die Datei entsteht erst beim Klick (Streamlit ruft gpx_file in einem eigenen Thread auf) und wird pro Inhalt
+    # auf der Festplatte gecacht; ein Rerun schickt also keine Track-Bytes mehr an den Browser. Beim Klick wird die
+    # fertige Datei ganz gelesen und als bytes übergeben (download_button nimmt keine Generatoren, Streamlit hält die
+    # Bytes ohnehin vollständig im Media-Speicher).
+    key = (track_hash, eat_int, drink_int, by, dauer, cal_burn, fluid_loss)
+
+    def gpx_file():
+        return read_export(key, track, lambda: intake_waypoints(track, dauer, cal_burn, fluid_loss, eat_int, drink_int, by))
+
     st.download_button(                                    #Mögliches Herunterladen der Karte in Form einer .gpx Datei für bspw. Garmin Edge
         "GPX herunterladen",
-        gpx.to_xml(),
+        gpx_file,
         file_name="route_intake.gpx",
         mime="application/gpx+xml"
-    )                                                  
+    )
+
+if len(coords):           #Sind Koordinatenpunkte da?
+    route_map(track, track_hash, events, eat_int, drink_int, dauer, cal_burn, fluid_loss)
+
+perf.finish()    #vor der Navigation, st.switch_page beendet den Rerun
+warmup.start()   #einmal pro Prozess, falls die Seite direkt aufgerufen wurde
 
 # Trennt den Abschnitt optisch
 st.markdown("---")
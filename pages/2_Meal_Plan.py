@@ -1,11 +1,15 @@
 import os #bindet Python "os"-Modul ein, mit dem wir das Betriebssystem-Funktionnen nutzen können
 import streamlit as st #lädt Stramlitrahmen und gibt ihm st als alias, damit Komponenten einfach auf App platziert werden können
-import requests #wird benötigt um requests an APIs zu senden und Antworten zu verarbeiten
-import matplotlib.pyplot as plt #Importiert marplotlibs Plot-API unter alias plt, um Grafiken zu erzeugen und in Stremlit einzubinden
 import random, time #random für Zufallzahlen (benötigt um Rezepte zufällig zu mischen unt time für Zeitstemptel zur Initailsierung stabiler Seeds
+from sportfuel import perf, warmup #Zeitmessung pro Rerun (nur mit SPORTFUEL_PERF aktiv), Vorwärmen von matplotlib im Hintergrund
+from sportfuel.disk_cache import DiskCache #gemeinsamer Cache auf der Festplatte für alle Sessions und Worker
+from sportfuel.edamam import EdamamClient, pick_recipes #Edamam-Client mit Connection-Pool und Cache
+from sportfuel.meal_planner import day_targets, optimize_day #Optimierer für den Tagesplan (kcal, Kohlenhydrate, Protein)
+from sportfuel.roster import select_athlete #Athlet aus dem Kader von Home.py (falls geladen)
 
 # Seitenkonfiguration
 st.set_page_config(page_title="Meal Plan", layout="wide") #legt Titel von Browser-Tab fest und Layout für volle Breite
+perf.start_rerun("Meal_Plan")
 
 #Seitentitel
 st.title("Dein persönlicher Essens-Plan")
@@ -17,9 +21,6 @@ APP_ID   = os.getenv("EDAMAM_APP_ID", "") #APP_ID von EDAMAM welche in Secret ab
 APP_KEY  = os.getenv("EDAMAM_APP_KEY", "") #APP_KEY von EDAMAM die in Secret abgespeichert ist (https://developer.edamam.com/admin/applications)
 USER_ID  = os.getenv("EDAMAM_ACCOUNT_USER", "") #USER_ID von EDAMAM die in Secret abgespeichert ist (https://developer.edamam.com/admin/applications)
 
-# Basis-URL für Edamam API Version 2
-V2_URL = "https://api.edamam.com/api/recipes/v2"
-
 # Sidebar: Allergien & Ernährungspräferenzen
 st.sidebar.markdown("## Diät- & Ernährungspräferenzen")
 # Mögliche Diät- und Ernährungspräferenzen laut Edamam
@@ -28,38 +29,22 @@ health_opts = ["alcohol-free","dairy-free","egg-free","gluten-free","paleo","veg
 # Auswahlfelder für Nutzerpräferenzen je nach Diät und Ernährungspräferenzen
 sel_diets  = st.sidebar.multiselect("Diät", diet_opts) # erzeugt Auswahlfelder für Diätpräferenz labels, die Nutzer anklicken kann (https://github.com/daniellewisdl/streamlit-cheat-sheet/blob/master/app.py)
 sel_health = st.sidebar.multiselect("Ernährungspräferenzen", health_opts) #same here für Ernährungspräferenzen 
-
-# Ordnet jedem Mahlzeittyp, die Edamam-API erwartet, eine Liste von Labels zu, damit verschiedene Ergebnisse kommen
-DISH_TYPES = {
-    "Breakfast": ["Cereals","Pancake","Bread","Main course"],
-    "Lunch":     ["Main course","Salad","Sandwiches","Side dish","Soup"],
-    "Dinner":    ["Main course","Side dish","Soup"]
-}
-
+optimize   = st.sidebar.checkbox("Tagesplan optimieren (kcal, Carbs, Protein)") #wählt Rezepte und Portionen so, dass der Tagesbedarf getroffen wird
 
 #Fetch-Hilfsfunktion: Rezepte aus Edamam laden
 #----
-@st.cache_data(ttl=3600) #speichert Kopien von Daten in Zwischenspeicher "chace" für 3600 Sekunden lang, um API-Calls zu reduzieren
-def fetch_recipes(meal_type, diets, healths, max_results=5, seed=0):  #Ruft Rezepte von Edamam basierend auf Mahlzeittyp, Diät- + Ernährungspräferenz Labels, seed dient als Initialisierung für Zufallsgenerator, um gefundene Rezeptliste vor Kürzen zu mischen
-    # Parameter für Anfrage aufbauen basierden auf ID, Key, Essenstyp ^oben definiert
-    params = {"type": "public", "app_id": APP_ID, "app_key": APP_KEY, "mealType": meal_type}
-    for d in diets: #nimmt die Diätpräferenz welche der Nutzer in der Sidebar auwählt in kauf
-        params.setdefault("diet", []).append(d)
-    for h in healths:    #same für Ernährungsprägerenzen^
-        params.setdefault("health", []).append(h)
-    for dt in DISH_TYPES.get(meal_type, []): #sagt API nach welchen Essenstypen es suchen soll
-        params.setdefault("dishType", []).append(dt)
-    params["field"] = ["uri", "label", "image", "yield","ingredientLines", "calories", "totalNutrients", "instructions"]
-    headers = {"Edamam-Account-User": USER_ID}
-
-    #Sendet die API-Anfrage mit Parametern und Headern (Timeout 5 s) und löst bei Fehlern eine Ausnahme aus.
-    r = requests.get(V2_URL, params=params, headers=headers, timeout=5)
-    r.raise_for_status()
-
-#Hits extrahieren, mischen, und auf maximale Resulate, hier 5 beschränken
-    hits = [h["recipe"] for h in r.json().get("hits", [])]
-    random.Random(seed).shuffle(hits)
-    return hits[:max_results]
+@st.cache_resource #ein Client pro Prozess: gepoolte Verbindungen und gemeinsamer SQLite-Cache (TTL 1 h, LRU) für alle Sessions
+def edamam_client():
+    return EdamamClient(APP_ID, APP_KEY, USER_ID, cache=DiskCache())
+
+@st.cache_data(ttl=3600) #speichert Kopien von Daten in Zwischenspeicher "chace" für 3600 Sekunden lang, um API-Calls zu reduzieren; ohne seed im Schlüssel, daher für alle Sessions gültig
+def fetch_all_recipes(meal_types, diets, healths): #Ruft ungemischte Rezepte aller Mahlzeittypen gleichzeitig von Edamam ab (bzw. aus dem Cache)
+    perf.mark_miss()
+    return edamam_client().fetch_all(meal_types, tuple(diets), tuple(healths))
+
+def fetch_recipes(all_hits, meal_type, max_results=5, seed=0): #seed dient als Initialisierung für Zufallsgenerator, um gefundene Rezeptliste vor Kürzen zu mischen
+    #Hits mischen, und auf maximale Resulate, hier 5 beschränken
+    return pick_recipes(all_hits.get(meal_type, []), seed, max_results)
 
 # Prüft, ob nötige Werte im vorherigen Seiten schon vorhanden sind, ansonsten Fehlermeldung dass diese noch ausgefüllt werden müssen
 # ----------------
@@ -68,8 +53,13 @@ if "grundumsatz" not in st.session_state or "workout_calories" not in st.session
     st.error("Bitte zuerst Home & Vor-Workout ausfüllen.")
     st.stop()
 
+# Grundumsatz und Gewicht des gewählten Athleten aus dem Kader, sonst die eigene Eingabe von Home
+athlet      = select_athlete()
+grundumsatz = athlet["grundumsatz"] if athlet else st.session_state.grundumsatz
+gewicht     = athlet["gewicht"] if athlet else st.session_state.get("gewicht", 70)
+
 # Berechnung der Gesamt- und pro Mahlzeit -Kalorien
-total_cal = st.session_state.grundumsatz + st.session_state.workout_calories
+total_cal = grundumsatz + st.session_state.workout_calories
 # Snack-Kalorien aus Pre-Workout-Seite abziehen (Session-State "cart" wird dort befüllt)
 snack_cal = sum(item["kcal"] for item in st.session_state.get("cart", []))
 # Angepasster Tagesbedarf minus bereits konsumierter Snack-Kalorien
@@ -86,7 +76,13 @@ st.markdown("---")
 
 # Funktion zur Ausgabe der Rezeptkarte
 # --------
-def render_recipe_card(r, key_prefix): #Zeigt Titel, Bild, Kalorien, Makronährstoffe und Zutaten/Anleitung im Expander an.
+@st.cache_data(max_entries=512) #ein PNG pro Rezept (uri) statt einer neuen Matplotlib-Figur bei jedem Rerun und jeder Karte
+def macro_chart(uri, prot, fat, carb):
+    perf.mark_miss()
+    from sportfuel.charts import macro_chart_png #Matplotlib-Diagramm als PNG, matplotlib erst beim ersten Diagramm importieren
+    return macro_chart_png(prot, fat, carb)
+
+def render_recipe_card(r, key_prefix, portions=None): #Zeigt Titel, Bild, Kalorien, Makronährstoffe und Zutaten/Anleitung im Expander an; portions kommt vom Optimierer
 
     #Titel und Bild aus API
     title    = r.get("label", "–")
@@ -96,14 +92,18 @@ def render_recipe_card(r, key_prefix): #Zeigt Titel, Bild, Kalorien, Makronährs
     yield_n  = r.get("yield", 1) or 1
     per_serv = total_c / yield_n
     # Berechnet, wie viele Portionen nötig sind, um pro Mahlzeit kcal zu erreichen
-    portions = per_meal / per_serv if per_serv > 0 else None
+    planned  = portions is not None
+    if not planned:
+        portions = per_meal / per_serv if per_serv > 0 else None
 
     st.markdown(f"**{title}**")
     if image:
         st.image(image, use_container_width=True)
 
     # Ausgabe der Portionen oder Kalorien insgesamt
-    if portions:
+    if portions and planned:
+        st.markdown(f"Portionen: {portions:.2f} × {per_serv:.0f} kcal = {portions * per_serv:.0f} kcal")
+    elif portions:
         st.markdown(f"Portionen: {portions:.1f} × {per_serv:.0f} kcal = {per_meal} kcal")
     else:
         st.markdown(f"Kalorien gesamt: {total_c} kcal")
@@ -114,12 +114,11 @@ def render_recipe_card(r, key_prefix): #Zeigt Titel, Bild, Kalorien, Makronährs
     fat  = nut.get("FAT", {}).get("quantity", 0) / yield_n
     carb = nut.get("CHOCDF", {}).get("quantity", 0) / yield_n
 
-    # Erstellt Balkendiagramm mit Matplotlib, um nicht nur Altair zu nutzen (https://matplotlib.org)
-    fig, ax = plt.subplots()
-    ax.bar(["Protein","Fat","Carbs"], [prot, fat, carb])
-    ax.set_ylabel("g pro Portion")
-    ax.set_title("Makros")
-    st.pyplot(fig)
+    # Balkendiagramm mit Matplotlib, einmal pro Rezept gezeichnet und als PNG gecacht
+    with perf.stage("macro_chart", cached=True) as s:
+        png = macro_chart(r.get("uri", title), prot, fat, carb)
+        st.image(png, use_container_width=True)
+        s.set(bytes=len(png))
 
     # Zutaten und Rezepteanleitugn damit User weiss wie Gericht zubereiten
     with st.expander("Zutaten"):
@@ -143,13 +142,39 @@ for _, mtype in meals:
         # z.B. aus timestamp + Zufall, bleibt stabil bis zum Neuladen
         st.session_state[seed_key] = int(time.time()*1000) + random.randint(0, 999) #Speichert den Seed im Session-State + Nutzt den aktuellen Zeitstempel in Millisekunden + eine Zufallszahl
 
+# Alle drei Mahlzeittypen auf einmal laden (parallel, bzw. aus dem gemeinsamen Cache)
+with perf.stage("edamam_fetch", cached=True) as s:
+    all_hits = fetch_all_recipes(tuple(m for _, m in meals), sel_diets, sel_health)
+    s.set(items=sum(len(h) for h in all_hits.values()))
+
+# Optimierter Tagesplan: ein Rezept pro Mahlzeit mit Portionen, die Tagesbedarf an kcal, Kohlenhydraten und Protein treffen
+plan = None
+if optimize:
+    snack_carbs = sum(item.get("carbs", 0) for item in st.session_state.get("cart", []))
+    target = day_targets(total_cal, gewicht, snack_carbs)
+    with perf.stage("optimize_day"):
+        plan = optimize_day(all_hits, target, sel_diets, sel_health)
+    if plan is None:
+        st.warning("Für mindestens eine Mahlzeit gibt es keine passenden Rezepte – zeige Zufallsauswahl.")
+    else:
+        tot, tgt = plan["totals"], plan["target"]
+        c1, c2, c3 = st.columns(3)
+        c1.metric("kcal (Plan / Ziel)", f"{tot[0]:.0f} / {tgt[0]:.0f}")
+        c2.metric("Kohlenhydrate g", f"{tot[1]:.0f} / {tgt[1]:.0f}")
+        c3.metric("Protein g", f"{tot[2]:.0f} / {tgt[2]:.0f}")
+        plan_meals = {mtype: (r, portions) for mtype, r, portions in plan["meals"]}
+
 # Für jede Mahlzeit: Überschrift, Rezepte laden, Slider um mehrere Rezepte anzuzeigen und Visualisierung darzustellen
 #-----------
 for (label, mtype), col in zip(meals, cols):
     with col:
         st.subheader(f"{label} (~{per_meal} kcal)")
+        if plan is not None:
+            r, portions = plan_meals[mtype]
+            render_recipe_card(r, mtype, portions=portions)
+            continue
         seed_key = f"seed_{mtype}" # holt den individuellen Seed
-        recs = fetch_recipes(mtype, sel_diets, sel_health,seed=st.session_state[seed_key]) #holt Vorschläge aus Edamam API ansonsten wird Fehlermeldung angezeigt
+        recs = fetch_recipes(all_hits, mtype, seed=st.session_state[seed_key]) #holt Vorschläge aus Edamam API ansonsten wird Fehlermeldung angezeigt
         if not recs:
             st.info("Keine passenden Rezepte gefunden.") #Fehlermeldung falls keine Rezepte gefunden wurden
             continue
@@ -157,3 +182,6 @@ for (label, mtype), col in zip(meals, cols):
         idx = st.slider("Wähle Rezept", 1, len(recs), key=f"slider_{mtype}")
         r = recs[idx-1]
         render_recipe_card(r, mtype)
+
+perf.finish()
+warmup.start() #einmal pro Prozess, falls die Seite direkt aufgerufen wurde
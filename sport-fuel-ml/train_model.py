@@ -1,88 +1,356 @@
 #Module und Libraries -> requirements.txt
 import pandas as pd
+import numpy as np
 import os
+import sys
+import json
+import time
+import argparse
+import itertools
+import tempfile
 import joblib
+from joblib import Parallel, delayed
 from math import sqrt
 #Trainingsmodule für ML Learning Modelle. Quelle: scikit learn, https://scikit-learn.org/stable/#
-from sklearn.ensemble import RandomForestRegressor
+import sklearn
+from sklearn.ensemble import RandomForestRegressor, ExtraTreesRegressor, HistGradientBoostingRegressor
 from sklearn.preprocessing import OneHotEncoder
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import make_pipeline
-from sklearn.model_selection import train_test_split
+from sklearn.model_selection import KFold
 from sklearn.metrics import mean_squared_error
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))    #Repo-Root, damit das Paket sportfuel gefunden wird
+from sportfuel.calories import ACTIVITY_MAP, COMPACT_PATH, LOOKUP_PATH, MODEL_PATH    #gleiche Pfade wie Seite und Batch
+from sportfuel.catalog import load_catalog
+from sportfuel.compact import export_compact, load_compact
+from sportfuel.poly import ActivityPolyRegressor
+from sportfuel.lookup import LOOKUP_AXES, build_lookup
+
+CSV_PATH     = "sport-fuel-ml/exercise_dataset.csv"
+METRICS_PATH = "models/calorie_metrics.json"    #Sweep-Ergebnisse und gewählte Konfiguration
+
+#Standard-Auflösung des Trainingsrasters (entspricht range(55, 96, 5) und range(30, 151, 20))
+GEWICHT_RANGE = (55, 95, 5)    #Simulation von Sporteinheiten mit unterschiedlichen Gewichten (Start, Ende inkl., Schritt)
+DAUER_RANGE   = (30, 150, 20)  #Simutation von Sporteinheiten mit unterschiedlichen Dauern (Start, Ende inkl., Schritt)
+
+#Prüfdaten: im Trainingsraster ist Distanz = Dauer x Tempo, auf der Seite kommt die Distanz aber unabhängig davon aus
+#der GPX-Datei oder der Eingabe. Die Prüfpunkte decken deshalb den ganzen Eingabebereich der Seite (LOOKUP_AXES) ab,
+#mit zufälliger Distanz. Eine Konfiguration ist plausibel, wenn keine Vorhersage negativ ist und alle höchstens um
+#PLAUSIBLE_RATIO vom Zielwert abweichen; nur plausible Konfigurationen werden automatisch gewählt.
+HOLDOUT_ROWS   = 20_000
+PLAUSIBLE_RATIO = 3.0
+
+
 #CSV einlesen und verarbeiten. CSV-Datei von Fernando Fernandez, kaggle, https://www.kaggle.com/datasets/fmendes/fmendesdat263xdemos
-with open("sport-fuel-ml/exercise_dataset.csv", encoding="utf-8") as f:    #Lesen der Datei Zeile für Zeile und Trennung der Daten durch Komma.
-    lines = f.readlines()
-
-data = []
-for line in lines[1:]:    #Erste Zeile nicht relevant, danach Trennung jeder Zeile in Aktivität + Werte
-    parts = line.strip().split(',')
-    if len(parts) > 6:
-        activity = ",".join(parts[:-5]).strip()       #Fasst die Teile vor diesen 5 Zahlen zu einem String zusammen
-        try:
-            vals = list(map(float, parts[-5:]))
-            data.append([activity] + vals)
-        except ValueError:                            #Fahre auch bei Fehlern fort
-            continue
-#Erstellt DataFrame aus den verarbeiteten Daten
-raw = pd.DataFrame(data, columns=["Activity", "kcal_130lb", "kcal_155lb", "kcal_180lb", "kcal_205lb", "kcal_per_kg"])
-
-#Trainingsdaten erzeugen
-activities = raw["Activity"]
-kcal_per_kg = raw["kcal_per_kg"]
-
-gewicht_list = list(range(55, 96, 5))  #Simulation von Sporteinheiten mit unterschiedlichen Gewichten
-dauer_list = list(range(30, 151, 20))  #Simutation von Sporteinheiten mit unterschiedlichen Dauern
-
-records = []               #Jetzt wird jede Aktivität mit jedem Gewicht & jeder Dauer kombiniert
-for act, kcal_kg in zip(activities, kcal_per_kg):
-    for g in gewicht_list:
-        for d in dauer_list:
-            # Aktivitätsbasierter Verstärkungsfaktor wurde definiert um genauere Ergebnisse am Schluss zu erhalten mit Hilfe von OpenAI. (2025). ChatGPT 4o (Version vom 01.05.2025) [Large language model]. https://chat.openai.com/chat.
-            if "Running" in act:
-                faktor = 4.3
-                distanz = d * 0.1  # grob 10 km/h
-            elif "Cycling" in act:
-                faktor = 4.5
-                distanz = d * 0.25  # grob 15 km/h
-            elif "Swimming" in act:
-                faktor = 10.0
-                distanz = d * 0.05  # grob 3 km/h
-            else:
-                faktor = 1.0
-                distanz = d * 0.1
-
-            kcal = d * g * kcal_kg / 60 * faktor #Berechnung des geschätzten Kalorienverbrauchs
-            records.append({
-                "Activity": act,
-                "Gewicht": g,
-                "Dauer": d,
-                "Distanz": distanz,
-                "kcal": kcal
+#Blockweise mit pyarrow (sportfuel.catalog), Ergebnis als Parquet gecacht; verworfene Zeilen werden gemeldet statt übersprungen.
+def load_exercise_csv(path=CSV_PATH, cache=True):
+    df, rejected = load_catalog(path, cache=cache)
+    if len(rejected):
+        beispiele = ", ".join(str(n) for n in rejected["line"].head(5))
+        print(f"⚠️ {len(rejected):,} Zeilen in {path} nicht lesbar (Zeile {beispiele}{', ...' if len(rejected) > 5 else ''})",
+              file=sys.stderr)
+    return df
+
+
+#Erzeugt die Rasterwerte (Ende inklusive), z.B. grid_values(55, 95, 5) -> 55, 60, ..., 95
+def grid_values(start, stop, step):
+    return np.arange(start, stop + step / 2, step)
+
+
+# Aktivitätsbasierter Verstärkungsfaktor wurde definiert um genauere Ergebnisse am Schluss zu erhalten mit Hilfe von OpenAI. (2025). ChatGPT 4o (Version vom 01.05.2025) [Large language model]. https://chat.openai.com/chat.
+# Faktor und Tempo (km pro Minute) werden einmal pro Aktivität bestimmt, nicht mehr pro Trainingszeile.
+def activity_factors(activities):
+    acts     = pd.Series(np.asarray(activities, dtype=object)).astype(str)
+    running  = acts.str.contains("Running",  regex=False).to_numpy()
+    cycling  = acts.str.contains("Cycling",  regex=False).to_numpy()
+    swimming = acts.str.contains("Swimming", regex=False).to_numpy()
+    conds    = [running, cycling, swimming]                      #Reihenfolge wie if/elif: Running hat Vorrang
+    faktor   = np.select(conds, [4.3, 4.5, 10.0], default=1.0)
+    tempo    = np.select(conds, [0.1, 0.25, 0.05], default=0.1)  #grob 10 km/h, 15 km/h, 3 km/h, sonst 10 km/h
+    return faktor, tempo
+
+
+#Trainingsdaten erzeugen: jede Aktivität wird mit jedem Gewicht & jeder Dauer kombiniert (Aktivität x Gewicht x Dauer)
+def build_training_set(activities, kcal_per_kg, gewicht_list=None, dauer_list=None):
+    acts    = np.asarray(activities, dtype=object)
+    kcal_kg = np.asarray(kcal_per_kg, dtype=float)
+    g       = np.asarray(grid_values(*GEWICHT_RANGE) if gewicht_list is None else gewicht_list)
+    d       = np.asarray(grid_values(*DAUER_RANGE)   if dauer_list   is None else dauer_list)
+    faktor, tempo = activity_factors(acts)
+
+    #Indexraster in derselben Reihenfolge wie die früheren verschachtelten Schleifen
+    ia, ig, idd = np.meshgrid(np.arange(len(acts)), np.arange(len(g)), np.arange(len(d)), indexing="ij")
+    ia, ig, idd = ia.ravel(), ig.ravel(), idd.ravel()
+    G, D = g[ig], d[idd]
+
+    kcal = target_kcal(kcal_kg[ia], faktor[ia], G, D)    #Berechnung des geschätzten Kalorienverbrauchs als ein Array-Ausdruck
+    return pd.DataFrame({
+        "Activity": acts[ia],
+        "Gewicht":  G,
+        "Dauer":    D,
+        "Distanz":  D * tempo[ia],
+        "kcal":     kcal
+    })
+
+
+#Zielwert der Trainings- und Prüfdaten
+def target_kcal(kcal_per_kg, faktor, gewicht, dauer):
+    return dauer * gewicht * kcal_per_kg / 60 * faktor
+
+
+#Prüfdaten mit unabhängiger Distanz: Aktivität, Gewicht, Dauer und Distanz gleichverteilt über den Eingabebereich der Seite
+def build_holdout_set(activities, kcal_per_kg, n=HOLDOUT_ROWS, seed=0, axes=LOOKUP_AXES):
+    rng     = np.random.default_rng(seed)
+    acts    = np.asarray(activities, dtype=object)
+    kcal_kg = np.asarray(kcal_per_kg, dtype=float)
+    faktor, _ = activity_factors(acts)
+    ia   = rng.integers(0, len(acts), n)
+    cols = {c: rng.uniform(lo, hi, n) for c, (lo, hi, _) in axes.items()}
+    X = pd.DataFrame({"Activity": acts[ia], **{c: cols[c] for c in ["Gewicht", "Dauer", "Distanz"]}})
+    return X, pd.Series(target_kcal(kcal_kg[ia], faktor[ia], cols["Gewicht"], cols["Dauer"]), name="kcal")
+
+
+#RMSE und Plausibilität eines Modells auf den Prüfdaten
+def holdout_metrics(model, X_holdout, y_holdout, max_ratio=PLAUSIBLE_RATIO):
+    preds = np.asarray(model.predict(X_holdout), dtype=np.float64)
+    ratio = preds / np.asarray(y_holdout, dtype=np.float64)
+    return {
+        "holdout_rmse":      sqrt(mean_squared_error(y_holdout, preds)),
+        "holdout_min_kcal":  float(preds.min()),
+        "holdout_ratio_min": float(ratio.min()),
+        "holdout_ratio_max": float(ratio.max()),
+        "plausible":         bool(np.isfinite(preds).all() and preds.min() >= 0
+                                  and ratio.min() >= 1 / max_ratio and ratio.max() <= max_ratio),
+    }
+
+
+#Modellfamilien für den Sweep. Baum-Ensembles werden über Baumanzahl x Tiefe variiert (ein flaches Ensemble ist
+#einfach eine kleine Konfiguration davon), die Polynome pro Aktivität haben keine solchen Parameter.
+TREE_FAMILIES = {
+    "forest":      RandomForestRegressor,
+    "extra_trees": ExtraTreesRegressor,
+    "hist_gb":     HistGradientBoostingRegressor,
+}
+POLY_DEGREES = {"linear": 1, "poly": 2}
+FAMILIES = list(TREE_FAMILIES) + list(POLY_DEGREES)
+
+BATCH_ROWS = 10_000    #Zeilen für die Durchsatz-Messung (ganze Trainingspläne, Kalorien-Tabelle)
+
+
+#Modell einer Familie; Baum-Ensembles als Pipeline aus OneHotEncoder + Ensemble mit n_jobs=1,
+#parallelisiert wird über die Konfigurationen und Folds
+def make_model(family, n_estimators, max_depth, seed):
+    if family in POLY_DEGREES:
+        return ActivityPolyRegressor(degree=POLY_DEGREES[family])
+    #Verarbeitung der Eingabedaten Quelle: scikit learn, https://scikit-learn.org/stable/#
+    if family == "hist_gb":    #HistGradientBoosting braucht eine dichte Matrix
+        preprocessor = ColumnTransformer([
+            ("activity", OneHotEncoder(handle_unknown="error", sparse_output=False), ["Activity"])
+        ], remainder="passthrough", sparse_threshold=0)
+        estimator = HistGradientBoostingRegressor(max_iter=n_estimators, max_depth=max_depth,
+                                                  early_stopping=False, random_state=seed)
+    else:
+        preprocessor = ColumnTransformer([
+            ("activity", OneHotEncoder(handle_unknown="error"), ["Activity"])
+        ], remainder="passthrough")
+        estimator = TREE_FAMILIES[family](n_estimators=n_estimators, max_depth=max_depth, random_state=seed, n_jobs=1)
+    #Nun werden Verarbeitung und das Modell kombiniert
+    return make_pipeline(preprocessor, estimator)
+
+
+#Konfigurationen (Familie, Bäume, Tiefe) des Sweeps
+def sweep_configs(families, trees, depths):
+    configs = []
+    for family in families:
+        if family in POLY_DEGREES:
+            configs.append((family, None, None))
+        else:
+            configs.extend((family, n, d) for n, d in itertools.product(trees, depths))
+    return configs
+
+
+#Ein Fold einer Konfiguration (läuft in einem joblib-Prozess). Im ersten Fold wird das Modell zusätzlich als .npz
+#exportiert, damit Grösse und Latenz danach ohne Konkurrenz durch andere Worker gemessen werden können.
+#Neben dem RMSE auf dem Test-Fold wird jedes Fold-Modell auf den Prüfdaten mit unabhängiger Distanz bewertet.
+def fit_fold(X, y, train_idx, test_idx, family, n_estimators, max_depth, seed, holdout, export_path=None):
+    model = make_model(family, n_estimators, max_depth, seed)
+    t0 = time.perf_counter()
+    model.fit(X.iloc[train_idx], y.iloc[train_idx])    #trainiert das Modell
+    fit_s = time.perf_counter() - t0
+    preds = model.predict(X.iloc[test_idx])
+    rmse = sqrt(mean_squared_error(y.iloc[test_idx], preds))    #Bewertet das Modell mit RMSE
+    if export_path:
+        export_compact(model, export_path)
+    return fit_s, rmse, holdout_metrics(model, *holdout)
+
+
+#Latenz einer einzelnen Vorhersage (eine Zeile wie auf der Vor_Workout Seite) und Durchsatz für einen ganzen Block,
+#jeweils mit dem ausgelieferten npz-Predictor
+def predict_timings(path, X_one, X_batch, repeat=200):
+    predictor = load_compact(path, mmap=False)
+    predictor.predict(X_one)    #Aufwärmen
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        predictor.predict(X_one)
+        times.append(time.perf_counter() - t0)
+    t0 = time.perf_counter()
+    predictor.predict(X_batch)
+    rows_per_s = len(X_batch) / (time.perf_counter() - t0)
+    return np.percentile(times, 50) * 1e3, np.percentile(times, 95) * 1e3, rows_per_s
+
+
+#Kreuzvalidierter Sweep über Familie x Baumanzahl x Tiefe, alle (Konfiguration, Fold)-Paare parallel in joblib-Prozessen.
+#holdout = (X, y) aus build_holdout_set; eine Konfiguration ist nur plausibel, wenn es alle ihre Fold-Modelle sind.
+def sweep(X, y, families, trees, depths, holdout, folds=5, seed=42, n_jobs=-1):
+    configs = sweep_configs(families, trees, depths)
+    splits  = list(KFold(n_splits=folds, shuffle=True, random_state=seed).split(X))
+    X_one   = X.iloc[[0]]
+    X_batch = X.sample(min(BATCH_ROWS, len(X)), random_state=seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        exports = [os.path.join(tmp, f"config_{i}.npz") for i in range(len(configs))]
+        tasks = [delayed(fit_fold)(X, y, tr, te, family, n, d, seed, holdout, exports[i] if k == 0 else None)
+                 for i, (family, n, d) in enumerate(configs) for k, (tr, te) in enumerate(splits)]
+        out = Parallel(n_jobs=n_jobs, backend="loky")(tasks)
+
+        results = []
+        for i, (family, n, d) in enumerate(configs):
+            fold_out = out[i * folds:(i + 1) * folds]
+            checks   = [h for _, _, h in fold_out]
+            p50, p95, rows_per_s = predict_timings(exports[i], X_one, X_batch)
+            results.append({
+                "family":            family,
+                "n_estimators":      n,
+                "max_depth":         d,
+                "rmse":              float(np.mean([r for _, r, _ in fold_out])),
+                "rmse_std":          float(np.std([r for _, r, _ in fold_out])),
+                "holdout_rmse":      float(np.mean([h["holdout_rmse"] for h in checks])),
+                "holdout_min_kcal":  min(h["holdout_min_kcal"] for h in checks),
+                "holdout_ratio_min": min(h["holdout_ratio_min"] for h in checks),
+                "holdout_ratio_max": max(h["holdout_ratio_max"] for h in checks),
+                "plausible":         all(h["plausible"] for h in checks),
+                "fit_s":             float(np.mean([f for f, _, _ in fold_out])),
+                "predict_ms_p50":    float(p50),
+                "predict_ms_p95":    float(p95),
+                "rows_per_s":        float(rows_per_s),
+                "size_mb":           os.path.getsize(exports[i]) / 1e6,
             })
+    return results
+
+
+#Nur plausible Konfigurationen (Prüfdaten mit unabhängiger Distanz) kommen in Frage. Darunter die schnellste (p95), die
+#RMSE-Grenze (auf den Prüfdaten) und Latenz-Budget einhält. Ist keine genau genug, der niedrigste RMSE innerhalb des
+#Budgets; hält keine das Budget ein, die schnellste. Ist keine plausibel, wird nichts gewählt (ValueError).
+def choose(results, budget_ms, max_rmse):
+    plausible = [r for r in results if r["plausible"]]
+    if not plausible:
+        raise ValueError("Keine Konfiguration besteht die Prüfung mit unabhängiger Distanz "
+                         f"(negative Vorhersagen oder mehr als Faktor {PLAUSIBLE_RATIO:g} vom Zielwert)")
+    fits = [r for r in plausible if r["predict_ms_p95"] <= budget_ms]
+    good = [r for r in fits if r["holdout_rmse"] <= max_rmse]
+    if good:
+        return min(good, key=lambda r: r["predict_ms_p95"])
+    if fits:
+        return min(fits, key=lambda r: r["holdout_rmse"])
+    return min(plausible, key=lambda r: r["predict_ms_p95"])
+
+
+def print_results(results, best=None):
+    print(f"{'Familie':<13}{'Bäume':>6}{'Tiefe':>7}{'RMSE':>9}{'Prüf-RMSE':>11}{'Faktor':>15}{'plausibel':>11}"
+          f"{'Fit (s)':>9}{'p50 (ms)':>10}{'p95 (ms)':>10}{'Zeilen/s':>12}{'Grösse (MB)':>13}")
+    for r in results:
+        mark = "  <-" if r is best else ""
+        faktor = f"{r['holdout_ratio_min']:.2f}-{r['holdout_ratio_max']:.2f}"
+        print(f"{r['family']:<13}{str(r['n_estimators'] or '-'):>6}{str(r['max_depth'] or '-'):>7}{r['rmse']:>9.2f}"
+              f"{r['holdout_rmse']:>11.1f}{faktor:>15}{'ja' if r['plausible'] else 'nein':>11}"
+              f"{r['fit_s']:>9.2f}{r['predict_ms_p50']:>10.2f}{r['predict_ms_p95']:>10.2f}{r['rows_per_s']:>12,.0f}"
+              f"{r['size_mb']:>13.3f}{mark}")
+
+
+def parse_depth(value):
+    return None if value.lower() == "none" else int(value)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kalorien-Modell trainieren: kreuzvalidierter Sweep über Baumanzahl und Tiefe")
+    parser.add_argument("--csv", default=CSV_PATH, help="Aktivitäts-Katalog im Format von exercise_dataset.csv")
+    parser.add_argument("--no-cache", action="store_true", help="Katalog neu einlesen statt den Parquet-Cache zu nutzen")
+    parser.add_argument("--family", choices=FAMILIES, nargs="+", default=FAMILIES, help="Modellfamilien im Sweep")
+    parser.add_argument("--trees", type=int, nargs="+", default=[25, 50, 100], help="Baumanzahlen im Sweep")
+    parser.add_argument("--depths", type=parse_depth, nargs="+", default=[8, 14, None], help="Maximale Tiefen (none = unbegrenzt)")
+    parser.add_argument("--gewicht-step", type=float, default=GEWICHT_RANGE[2], help="Schrittweite des Gewichts-Rasters (kg)")
+    parser.add_argument("--dauer-step", type=float, default=DAUER_RANGE[2], help="Schrittweite des Dauer-Rasters (Min)")
+    parser.add_argument("--folds", type=int, default=5, help="Anzahl Folds der Kreuzvalidierung")
+    parser.add_argument("--budget-ms", type=float, default=5.0, help="Latenz-Budget pro Anfrage (p95, eine Zeile)")
+    parser.add_argument("--max-rmse", type=float, default=50.0, help="Grösster akzeptierter RMSE auf den Prüfdaten (kcal)")
+    parser.add_argument("--jobs", type=int, default=-1, help="joblib-Prozesse (-1 = alle Kerne)")
+    parser.add_argument("--seed", type=int, default=42, help="Zufalls-Seed für Folds und Modelle")
+    args = parser.parse_args(argv)
+
+    raw = load_exercise_csv(args.csv, cache=not args.no_cache)
+    unbekannt = sorted(set(ACTIVITY_MAP.values()) - set(raw["Activity"]))
+    if unbekannt:    #sonst lernt kein Modell die Aktivitäten, die die Seite abfragt
+        raise SystemExit(f"ACTIVITY_MAP verweist auf Aktivitäten, die nicht im Katalog stehen: {', '.join(unbekannt)}")
+    gewicht_range = GEWICHT_RANGE[:2] + (args.gewicht_step,)
+    dauer_range   = DAUER_RANGE[:2] + (args.dauer_step,)
+    df = build_training_set(raw["Activity"], raw["kcal_per_kg"],
+                            grid_values(*gewicht_range), grid_values(*dauer_range))
+    X = df[["Activity", "Gewicht", "Dauer", "Distanz"]] #Eingabedaten vorbereiten
+    y = df["kcal"]                  #Zielwert vorbereiten
+    holdout = build_holdout_set(raw["Activity"], raw["kcal_per_kg"], seed=args.seed)
+
+    t0 = time.perf_counter()
+    results = sweep(X, y, args.family, args.trees, args.depths, holdout, args.folds, args.seed, args.jobs)
+    sweep_s = time.perf_counter() - t0
+    try:
+        best = choose(results, args.budget_ms, args.max_rmse)
+    except ValueError as e:
+        print_results(results)
+        raise SystemExit(f"⚠️ {e}. Es werden keine Modelle geschrieben.")
+
+    print_results(results, best)
+    print(f"Sweep: {len(results)} Konfigurationen x {args.folds} Folds, {len(X)} Zeilen, {sweep_s:.1f} s")
+
+    #Gewählte Konfiguration auf allen Daten trainieren und erneut prüfen, bevor etwas geschrieben wird
+    model = make_model(best["family"], best["n_estimators"], best["max_depth"], args.seed)
+    model.fit(X, y)
+    final_check = holdout_metrics(model, *holdout)
+    if not final_check["plausible"]:
+        raise SystemExit(f"⚠️ Das auf allen Daten trainierte Modell besteht die Prüfung nicht: {final_check}")
+    print(f"Modell finito du bisch eh geile Siech = RMSE: {best['rmse']:.2f} kcal, "
+          f"Prüf-RMSE: {final_check['holdout_rmse']:.1f} kcal")    #Stellt dar, das das Modell fertig ist
+
+    #Modell speichern und .pkl Datei erstellen sowie komprimieren aufgrund grosser Datenmenge. Mit Hilfe von OpenAI. (2025). ChatGPT 4o (Version vom 01.05.2025) [Large language model]. https://chat.openai.com/chat.
+    os.makedirs("models", exist_ok=True)
+    joblib.dump(model, MODEL_PATH, compress=3)
+    print(f"🗃️ Modell gespeichert in {MODEL_PATH} (komprimiert)")
+    export_compact(model, COMPACT_PATH)
+    print(f"🗃️ Kompakter Export gespeichert in {COMPACT_PATH}")
+    build_lookup(model, LOOKUP_PATH)
+    print(f"🗃️ Kalorien-Tabelle gespeichert in {LOOKUP_PATH}")
+
+    manifest = {
+        "chosen":        best,
+        "budget_ms":     args.budget_ms,
+        "max_rmse":      args.max_rmse,
+        "holdout_rows":  len(holdout[0]),
+        "plausible_ratio": PLAUSIBLE_RATIO,
+        "final_check":   final_check,
+        "folds":         args.folds,
+        "seed":          args.seed,
+        "rows":          len(X),
+        "gewicht_range": list(gewicht_range),
+        "dauer_range":   list(dauer_range),
+        "sweep_s":       sweep_s,
+        "sklearn":       sklearn.__version__,
+        "results":       results,
+    }
+    with open(METRICS_PATH, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+    print(f"🗃️ Metriken gespeichert in {METRICS_PATH}")
+    return model
+
 
-# Modell trainieren
-df = pd.DataFrame(records)
-X = df[["Activity", "Gewicht", "Dauer", "Distanz"]] #Eingabedaten vorbereiten
-y = df["kcal"]                  #Zielwert vorbereiten
-
-#Verarbeitung der Eingabedaten Quelle: scikit learn, https://scikit-learn.org/stable/#
-preprocessor = ColumnTransformer([
-    ("activity", OneHotEncoder(handle_unknown="ignore"), ["Activity"])
-], remainder="passthrough")
-
-#Nun werden Verarbeitung und das Modell kombiniert
-model = make_pipeline(preprocessor, RandomForestRegressor(n_estimators=100, random_state=42))
-X_train, X_test, y_train, y_test = train_test_split(X, y, test_size=0.2, random_state=42)
-model.fit(X_train, y_train)    #trainiert das Modell
-
-#Modell evaluieren
-preds = model.predict(X_test)
-rmse = sqrt(mean_squared_error(y_test, preds))    #Bewertet das Modell mit RMSE
-print(f"Modell finito du bisch eh geile Siech = RMSE: {rmse:.2f} kcal")    #Stellt dar, das das Modell fertig ist
-
-#Modell speichern und .pkl Datei erstellen sowie komprimieren aufgrund grosser Datenmenge. Mit Hilfe von OpenAI. (2025). ChatGPT 4o (Version vom 01.05.2025) [Large language model]. https://chat.openai.com/chat.
-os.makedirs("models", exist_ok=True)
-joblib.dump(model, "models/calorie_predictor.pkl", compress=3)
-print("🗃️ Modell gespeichert in models/calorie_predictor.pkl (komprimiert)")
+if __name__ == "__main__":
+    main()
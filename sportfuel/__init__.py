@@ -0,0 +1 @@
+#Hilfsmodule für die Sport Fuel Guide Seiten (Home.py, pages/) und das Training in sport-fuel-ml/
@@ -0,0 +1,131 @@
+#Batch-Vorhersage für ganze Trainingspläne: liest (sportart, gewicht, dauer, distanz) aus CSV oder Parquet in Blöcken,
+#macht pro Block ein einziges model.predict und schreibt das Ergebnis Block für Block weg (Speicher bleibt flach).
+#Wie auf der Vor_Workout Seite kommt der Wert zuerst aus der Kalorien-Tabelle (Interpolation im Raster), nur Zeilen
+#ausserhalb des Rasters gehen ans Modell, unbekannte Sportarten und Modellfehler an die Fall-Back-Formel.
+#Aufruf: python -m sportfuel.batch plan.csv -o plan_kcal.csv [--chunksize 50000] [--model models/calorie_model.npz]
+#        [--no-lookup]
+import argparse
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from sportfuel.calories import (ACTIVITY_MAP, FALLBACK_FAKTOREN, LOOKUP_PATH,    #gleiche Tabelle und gleiches Modell wie die Seite
+                                load_calorie_lookup, load_calorie_model)
+
+INPUT_COLS  = ["sportart", "gewicht", "dauer", "distanz"]
+CHUNKSIZE   = 50_000
+
+
+#Gleiche Formel wie auf der Vor_Workout Seite, vektorisiert (NaN für unbekannte Sportarten)
+def fallback_kcal_array(sportart, gewicht, dauer):
+    faktor = pd.Series(sportart).map(FALLBACK_FAKTOREN).to_numpy(dtype=np.float64)
+    return faktor * np.asarray(gewicht, dtype=np.float64) * (np.asarray(dauer, dtype=np.float64) / 60)
+
+
+#Vorhersage für einen Block: Tabelle für alle Zeilen im Raster (lookup=None: ohne Tabelle), ein predict für die übrigen
+#Zeilen mit bekannter Sportart, sonst/bei Fehlern die Fall-Back-Formel
+def predict_frame(model, df, lookup=None):
+    df = df.rename(columns=str.lower)
+    missing = [c for c in INPUT_COLS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Fehlende Spalten: {', '.join(missing)}")
+
+    sportart = df["sportart"].astype(str).to_numpy()
+    kcal     = fallback_kcal_array(sportart, df["gewicht"], df["dauer"])
+    quelle   = np.full(len(df), "formel", dtype=object)
+
+    activity = pd.Series(sportart).map(ACTIVITY_MAP)
+    known    = activity.notna().to_numpy().copy()    #wird unten für Tabellen-Treffer gelöscht
+    if lookup is not None and known.any():
+        idx = np.flatnonzero(known)
+        tab = lookup.predict_arrays(activity[known].to_numpy(), df["gewicht"].to_numpy()[known],
+                                    df["dauer"].to_numpy()[known], df["distanz"].to_numpy()[known])
+        hit = np.isfinite(tab)    #NaN: ausserhalb des Rasters
+        kcal[idx[hit]]   = tab[hit]
+        quelle[idx[hit]] = "tabelle"
+        known[idx[hit]]  = False
+    if model is not None and known.any():
+        X = pd.DataFrame({
+            "Activity": activity[known].to_numpy(),
+            "Gewicht":  df["gewicht"].to_numpy()[known],
+            "Dauer":    df["dauer"].to_numpy()[known],
+            "Distanz":  df["distanz"].to_numpy()[known],
+        })
+        try:
+            pred = np.asarray(model.predict(X), dtype=np.float64)
+            ok   = np.isfinite(pred)
+            idx  = np.flatnonzero(known)[ok]
+            kcal[idx]   = np.maximum(pred[ok], 0.0)    #ältere Modelle können ausserhalb des Trainingsrasters negativ werden
+            quelle[idx] = "modell"
+        except Exception as e:    #wie auf der Seite: Modellfehler -> Formel für den ganzen Block
+            print(f"⚠️ Fehler beim Modell: {e}. Formel wird verwendet.", file=sys.stderr)
+
+    out = df.copy()
+    out["kcal"]   = kcal
+    out["quelle"] = quelle
+    return out
+
+
+#Liest CSV oder Parquet blockweise
+def iter_chunks(path, chunksize=CHUNKSIZE):
+    if path.endswith((".parquet", ".pq")):
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, chunksize=chunksize)
+
+
+def iter_predictions(path, model, chunksize=CHUNKSIZE, lookup=None):
+    for chunk in iter_chunks(path, chunksize):
+        yield predict_frame(model, chunk, lookup)
+
+
+#Streamt die Vorhersagen in eine CSV- oder Parquet-Datei und gibt die Anzahl Zeilen zurück
+def predict_file(in_path, out_path, model, chunksize=CHUNKSIZE, lookup=None):
+    n, writer = 0, None
+    try:
+        for i, out in enumerate(iter_predictions(in_path, model, chunksize, lookup)):
+            if out_path.endswith((".parquet", ".pq")):
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+                table = pa.Table.from_pandas(out, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(out_path, table.schema)
+                writer.write_table(table)
+            else:
+                out.to_csv(out_path, mode="w" if i == 0 else "a", header=(i == 0), index=False)
+            n += len(out)
+    finally:
+        if writer is not None:
+            writer.close()
+    return n
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Kalorien-Vorhersage für ganze Trainingspläne (CSV/Parquet)")
+    parser.add_argument("input", help="CSV oder Parquet mit den Spalten sportart, gewicht, dauer, distanz")
+    parser.add_argument("-o", "--output", required=True, help="Ziel-Datei (.csv oder .parquet)")
+    parser.add_argument("--model", default=None, help="Modell-Datei (.npz oder .pkl), Standard: wie die Seite")
+    parser.add_argument("--lookup", default=LOOKUP_PATH, help="Kalorien-Tabelle, Standard: wie die Seite")
+    parser.add_argument("--no-lookup", action="store_true", help="Tabelle nicht verwenden, nur Modell und Formel")
+    parser.add_argument("--chunksize", type=int, default=CHUNKSIZE, help="Zeilen pro Block")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    try:
+        model = load_calorie_model(args.model)
+    except Exception as e:
+        print(f"⚠️ Modell konnte nicht geladen werden: {e}. Formel wird verwendet.", file=sys.stderr)
+        model = None
+    lookup = None if args.no_lookup else load_calorie_lookup(args.lookup)
+    if lookup is None and not args.no_lookup:
+        print(f"⚠️ Keine plausible Kalorien-Tabelle unter {args.lookup}. Nur Modell und Formel.", file=sys.stderr)
+    n = predict_file(args.input, args.output, model, args.chunksize, lookup)
+    dt = time.perf_counter() - t0
+    print(f"{n:,} Einheiten in {dt:.1f} s geschätzt ({n / dt:,.0f} Zeilen/s) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+#Gemeinsame Konstanten für die Kalorienschätzung (Vor_Workout Seite, Training, Batch-Vorhersage)
+import os
+
+MODEL_PATH   = "models/calorie_predictor.pkl"
+COMPACT_PATH = "models/calorie_model.npz"    #kompakter Export aus train_model.py (ohne sklearn ladbar)
+LOOKUP_PATH  = "models/calorie_lookup.npz"   #vorberechnete Vorhersagen für die Aktivitäten aus ACTIVITY_MAP
+
+# Mapping der Sportart auf den ML-verständlichen Activity-String
+ACTIVITY_MAP = {
+    "Laufen": "Running, 6 mph (10 min mile)",
+    "Radfahren": "Cycling, 14-15.9 mph, vigorous",
+    "Schwimmen": "Swimming laps, freestyle, fast"
+}
+
+# Fall-Back-Formel, wenn das Modell nicht verfügbar ist: kcal pro kg Körpergewicht und Stunde
+FALLBACK_FAKTOREN = {"Laufen": 7, "Radfahren": 5, "Schwimmen": 6}
+
+
+def fallback_kcal(sportart, gewicht, dauer):
+    return FALLBACK_FAKTOREN[sportart] * gewicht * (dauer / 60)
+
+
+# Lädt das Kalorien-Modell für Seite und Batch-Vorhersage in derselben Reihenfolge: ohne Pfad zuerst der kompakte
+# Export (memmap, ohne sklearn), sonst das joblib-Pickle; mit Pfad je nach Dateiendung
+def load_calorie_model(path=None):
+    if path is None:
+        path = COMPACT_PATH if os.path.exists(COMPACT_PATH) else MODEL_PATH
+    if path.endswith(".npz"):
+        from sportfuel.compact import load_compact
+        return load_compact(path)
+    import joblib
+    return joblib.load(path)
+
+
+# Lädt die vorberechnete Kalorien-Tabelle für Seite und Batch-Vorhersage: None, falls sie noch nicht erzeugt wurde oder die
+# Plausibilitätsprüfung nicht besteht (z.B. eine alte Tabelle eines entgleisten Modells); dann rechnet das Modell
+def load_calorie_lookup(path=LOOKUP_PATH):
+    if not os.path.exists(path):
+        return None
+    from sportfuel.lookup import load_lookup
+    try:
+        return load_lookup(path).check()
+    except ValueError:
+        return None
+
+
+# Grundumsatz nach Harris-Benedict: Konstante und Faktoren für kg, cm und Jahre. Quelle: Wikipedia, https://de.wikipedia.org/wiki/Grundumsatz
+HARRIS_BENEDICT = {"Männlich": (66.47, 13.7, 5.0, 6.8), "Weiblich": (655.1, 9.6, 1.8, 4.7)}
+FLUID_L_PER_KG  = 0.035    # Flüssigkeitsbedarf pro kg und Tag. Quelle: Migros, https://impuls.migros.ch/de/ernaehrung/nahrungsmittel/getraenke/wasser-trinken
+
+
+def grundumsatz(gewicht, groesse, alter, geschlecht):
+    konstante, kg, cm, jahre = HARRIS_BENEDICT[geschlecht]
+    return konstante + (kg * gewicht) + (cm * groesse) - (jahre * alter)
+
+
+def fluessigkeit(gewicht):
+    return gewicht * FLUID_L_PER_KG
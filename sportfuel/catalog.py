@@ -0,0 +1,138 @@
+#Einlesen von Aktivitäts-Katalogen im Format von exercise_dataset.csv (Aktivität, kcal bei 130/155/180/205 lb, kcal pro kg).
+#Die Aktivität enthält oft unquotierte Kommas ("Cycling, mountain bike, bmx"), die fünf Zahlen am Zeilenende aber nie;
+#jede Zeile wird deshalb von rechts höchstens fünfmal getrennt. Das passiert blockweise in pyarrow (ohne Python-Schleife
+#pro Zeile), nur Zeilen mit Anführungszeichen am Anfang oder in einem Zahlenfeld gehen durch das csv-Modul. Zeilen, die sich nicht lesen lassen, werden mit
+#Zeilennummer zurückgegeben statt stillschweigend verworfen. Das Ergebnis wird optional als Parquet gecacht.
+import csv
+import hashlib
+import os
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pcsv
+import pyarrow.parquet as pq
+
+CACHE_DIR  = os.getenv("SPORTFUEL_CATALOG_CACHE", os.path.join(".cache", "catalog"))
+BLOCK_SIZE = 4 << 20    #Bytes pro Block, der Speicher bleibt auch bei grossen Katalogen flach
+COLUMNS    = ["Activity", "kcal_130lb", "kcal_155lb", "kcal_180lb", "kcal_205lb", "kcal_per_kg"]
+NUMBER     = r"^[-+]?(\d+\.?\d*|\.\d+)([eE][-+]?\d+)?$"
+
+SCHEMA   = pa.schema([("Activity", pa.string())] + [(c, pa.float64()) for c in COLUMNS[1:]])
+REJECTED = pa.schema([("line", pa.int64()), ("text", pa.string())])
+
+
+#Zeilen mit Anführungszeichen: csv-Modul für korrekt quotierte Kommas, unquotierte Kommas in der Aktivität wie oben
+def _parse_quoted(texts):
+    rows, bad = [], []
+    for i, text in enumerate(texts):
+        try:
+            fields = next(csv.reader([text]))
+            nums   = [float(v) for v in fields[-5:]]
+        except (ValueError, StopIteration, csv.Error):
+            bad.append(i)
+            continue
+        activity = ",".join(fields[:-5]).strip()
+        if len(fields) < 6 or not activity:
+            bad.append(i)
+            continue
+        rows.append((i, activity, nums))
+    return rows, bad
+
+
+#Zahlenspalte -> (float64, gültig). Der direkte Cast gelingt fast immer; nur wenn er scheitert, wird pro Zeile geprüft
+def _numbers(field):
+    try:
+        return pc.cast(field, pa.float64()), np.ones(len(field), dtype=bool)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        field = pc.utf8_trim_whitespace(field)
+        valid = pc.match_substring_regex(field, NUMBER)
+        return pc.cast(pc.if_else(valid, field, pa.scalar(None, pa.string())), pa.float64()), valid.to_numpy(zero_copy_only=False)
+
+
+#Ein Block Rohzeilen -> (gültige Zeilen als Tabelle, verworfene Zeilen mit Zeilennummer)
+def _parse_block(lines, first_line):
+    lines   = pc.utf8_trim_whitespace(lines)
+    numbers = np.arange(first_line, first_line + len(lines))
+    filled  = pc.greater(pc.utf8_length(lines), 0).to_numpy(zero_copy_only=False)    #Leerzeilen werden übersprungen
+    quoted  = pc.starts_with(lines, '"').to_numpy(zero_copy_only=False)    #quotierte Aktivität
+
+    fast   = np.flatnonzero(filled & ~quoted)
+    parts  = pc.split_pattern(lines.take(fast), ",", max_splits=5, reverse=True)
+    ok     = pc.equal(pc.list_value_length(parts), 6).to_numpy(zero_copy_only=False)
+    parts  = parts.filter(pa.array(ok))
+    activity = pc.utf8_trim_whitespace(pc.list_element(parts, 0))
+    valid    = pc.greater(pc.utf8_length(activity), 0).to_numpy(zero_copy_only=False)
+    columns  = [activity]
+    for i in range(1, 6):
+        values, ok_i = _numbers(pc.list_element(parts, i))
+        columns.append(values)
+        valid &= ok_i
+    ok[ok] = valid
+    keep   = pa.array(valid)
+    table  = pa.table([c.filter(keep) for c in columns], schema=SCHEMA)
+    position = fast[ok]
+    failed   = fast[~ok]
+    has_quote = pc.match_substring(lines.take(failed), '"').to_numpy(zero_copy_only=False)    #z.B. quotierte Zahlen
+    rejected = list(failed[~has_quote])
+
+    slow = np.sort(np.concatenate([np.flatnonzero(filled & quoted), failed[has_quote]]))
+    if len(slow):
+        rows, bad = _parse_quoted(lines.take(slow).to_pylist())
+        rejected += [slow[i] for i in bad]
+        if rows:
+            table = pa.concat_tables([table, pa.table([
+                pa.array([a for _, a, _ in rows], pa.string()),
+                *(pa.array([n[k] for _, _, n in rows], pa.float64()) for k in range(5)),
+            ], schema=SCHEMA)])
+            position = np.concatenate([position, slow[[i for i, _, _ in rows]]])
+            table    = table.take(pa.array(np.argsort(position, kind="stable")))    #Reihenfolge wie in der Datei
+    rejected = sorted(rejected)
+    bad_rows = pa.table([pa.array(numbers[rejected], pa.int64()), lines.take(pa.array(rejected, pa.int64()))],
+                        schema=REJECTED)
+    return table, bad_rows
+
+
+#Streamt die CSV in Blöcken (jede Zeile als ein String-Feld, getrennt wird erst in _parse_block)
+def iter_blocks(path, block_size=BLOCK_SIZE):
+    reader = pcsv.open_csv(
+        path,
+        read_options=pcsv.ReadOptions(column_names=["line"], skip_rows=1, block_size=block_size),
+        parse_options=pcsv.ParseOptions(delimiter="\x1f", quote_char=False, ignore_empty_lines=False),
+        convert_options=pcsv.ConvertOptions(column_types={"line": pa.string()}),
+    )
+    first_line = 2    #Zeile 1 ist die Kopfzeile
+    for batch in reader:
+        table, bad = _parse_block(batch.column(0), first_line)
+        first_line += batch.num_rows
+        yield table, bad
+
+
+def _cache_paths(path, cache_dir):
+    st  = os.stat(path)
+    key = hashlib.sha1(f"{os.path.abspath(path)}|{st.st_size}|{st.st_mtime_ns}".encode()).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    return os.path.join(cache_dir, f"{stem}-{key}.parquet"), os.path.join(cache_dir, f"{stem}-{key}.rejected.parquet")
+
+
+#Liest den Katalog; gibt (DataFrame mit COLUMNS, DataFrame der verworfenen Zeilen mit line/text) zurück.
+#Mit cache=True wird das Ergebnis pro Datei (Pfad, Grösse, Änderungszeit) als Parquet abgelegt und wiederverwendet.
+def load_catalog(path, cache=True, cache_dir=CACHE_DIR, block_size=BLOCK_SIZE):
+    if cache:
+        data_path, bad_path = _cache_paths(path, cache_dir)
+        if os.path.exists(data_path) and os.path.exists(bad_path):
+            return pq.read_table(data_path).to_pandas(), pq.read_table(bad_path).to_pandas()
+
+    tables, bads = [], []
+    for table, bad in iter_blocks(path, block_size):
+        tables.append(table)
+        bads.append(bad)
+    table = pa.concat_tables(tables) if tables else SCHEMA.empty_table()
+    bad   = pa.concat_tables(bads) if bads else REJECTED.empty_table()
+
+    if cache:
+        os.makedirs(cache_dir, exist_ok=True)
+        for t, target in ((table, data_path), (bad, bad_path)):
+            tmp = f"{target}.{os.getpid()}.tmp"    #erst vollständig schreiben, dann umbenennen (parallele Läufe)
+            pq.write_table(t, tmp)
+            os.replace(tmp, target)
+    return table.to_pandas(), bad.to_pandas()
@@ -0,0 +1,23 @@
+#Makronährstoff-Balkendiagramm für die Rezeptkarten auf der Meal Plan Seite als PNG. Die Seite cacht das Ergebnis pro
+#Rezept-URI, damit nicht bei jedem Rerun und für jede Karte eine neue Matplotlib-Figur entsteht; die Figur wird nach
+#dem Speichern sofort geschlossen, sonst sammeln sich Figuren in pyplot an (Speicher wächst im Worker-Prozess).
+import io
+import matplotlib
+matplotlib.use("Agg")    #ohne Fenster, wie in Streamlit
+import matplotlib.pyplot as plt
+
+DPI = 120
+
+
+# Erstellt Balkendiagramm mit Matplotlib, um nicht nur Altair zu nutzen (https://matplotlib.org)
+def macro_chart_png(prot, fat, carb, dpi=DPI):
+    fig, ax = plt.subplots()
+    try:
+        ax.bar(["Protein","Fat","Carbs"], [prot, fat, carb])
+        ax.set_ylabel("g pro Portion")
+        ax.set_title("Makros")
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=dpi, bbox_inches="tight")
+        return buf.getvalue()
+    finally:
+        plt.close(fig)
@@ -0,0 +1,27 @@
+#Kompakter, sklearn-freier Export des Kalorien-Modells (.npz) für alle Modellfamilien aus sport-fuel-ml/train_model.py.
+#Das Feld "kind" in der Datei entscheidet über den Predictor; ältere Exporte ohne "kind" sind Baum-Ensembles.
+import zipfile
+import numpy as np
+
+from sportfuel.forest import export_forest, load_forest
+from sportfuel.poly import ActivityPolyRegressor, load_poly
+
+
+def export_compact(model, path):
+    if isinstance(model, ActivityPolyRegressor):
+        model.save(path)
+    else:
+        export_forest(model, path)
+
+
+#Liefert ein Objekt mit predict(X) wie die sklearn-Pipeline (Bäume als memmap, Polynome vollständig geladen)
+def load_compact(path, mmap=True):
+    with zipfile.ZipFile(path) as zf:
+        has_kind = "kind.npy" in zf.namelist()
+    kind = "forest"
+    if has_kind:
+        with np.load(path) as data:
+            kind = str(data["kind"])
+    if kind == "poly":
+        return load_poly(path)
+    return load_forest(path, mmap=mmap)
@@ -0,0 +1,151 @@
+#Gemeinsamer Cache auf der Festplatte (SQLite) für API-Antworten. Anders als @st.cache_data überlebt er Neustarts und
+#wird von allen Worker-Prozessen auf derselben Maschine geteilt. Einträge laufen nach `ttl` Sekunden ab; wird `max_bytes`
+#überschritten, fliegen die am längsten nicht gelesenen Einträge raus (LRU).
+#Die Gesamtgrösse führt die Datenbank selbst mit (Tabelle cache_size, per Trigger aktualisiert, gilt für alle Prozesse),
+#set() muss also nicht die ganze Tabelle summieren. Treffer schreiben nichts: die Lesezeitpunkte werden im Prozess
+#gesammelt und höchstens alle `touch_interval` Sekunden in einer Transaktion geschrieben, spätestens vor einer Eviction.
+import json
+import os
+import sqlite3
+import threading
+import time
+
+DEFAULT_PATH   = os.getenv("SPORTFUEL_CACHE_DB", os.path.join(".cache", "sportfuel_cache.sqlite"))
+TOUCH_INTERVAL = 30.0    #Sekunden zwischen zwei Schreibvorgängen der gesammelten Lesezeitpunkte
+
+SCHEMA = [
+    """CREATE TABLE IF NOT EXISTS cache (
+           key TEXT PRIMARY KEY, value BLOB NOT NULL,
+           expires REAL NOT NULL, accessed REAL NOT NULL, size INTEGER NOT NULL)""",
+    "CREATE INDEX IF NOT EXISTS cache_accessed ON cache(accessed)",
+    "CREATE INDEX IF NOT EXISTS cache_expires ON cache(expires)",
+    "CREATE TABLE IF NOT EXISTS cache_size (id INTEGER PRIMARY KEY CHECK (id = 0), total INTEGER NOT NULL)",
+    "INSERT OR IGNORE INTO cache_size (id, total) SELECT 0, COALESCE(SUM(size), 0) FROM cache",    #bestehende Caches
+    """CREATE TRIGGER IF NOT EXISTS cache_size_insert AFTER INSERT ON cache
+       BEGIN UPDATE cache_size SET total = total + NEW.size WHERE id = 0; END""",
+    """CREATE TRIGGER IF NOT EXISTS cache_size_delete AFTER DELETE ON cache
+       BEGIN UPDATE cache_size SET total = total - OLD.size WHERE id = 0; END""",
+    """CREATE TRIGGER IF NOT EXISTS cache_size_update AFTER UPDATE OF size ON cache
+       BEGIN UPDATE cache_size SET total = total + NEW.size - OLD.size WHERE id = 0; END""",
+]
+
+
+class DiskCache:
+    def __init__(self, path=DEFAULT_PATH, max_bytes=64 * 1024 * 1024, touch_interval=TOUCH_INTERVAL):
+        self.path      = path
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+        self._local    = threading.local()    #eine Verbindung pro Thread (Streamlit: ein Thread pro Session)
+        self._lock     = threading.Lock()
+        self._touched  = {}                   #Schlüssel -> letzter Lesezeitpunkt, noch nicht geschrieben
+        self._flushed  = time.time()
+        self.hits      = 0
+        self.misses    = 0
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        con = self._conn()
+        con.execute("BEGIN IMMEDIATE")    #Summe und Trigger zusammen anlegen, falls ein anderer Prozess gleichzeitig schreibt
+        try:
+            for statement in SCHEMA:
+                con.execute(statement)
+            con.execute("COMMIT")
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+
+    def _conn(self):
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            con.execute("PRAGMA journal_mode=WAL")    #Leser blockieren Schreiber anderer Prozesse nicht
+            con.execute("PRAGMA synchronous=NORMAL")
+            self._local.con = con
+        return con
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    #Gibt den gespeicherten JSON-Wert zurück oder `default`, wenn der Schlüssel fehlt oder abgelaufen ist
+    def get(self, key, default=None):
+        now = time.time()
+        con = self._conn()
+        row = con.execute("SELECT value FROM cache WHERE key = ? AND expires > ?", (key, now)).fetchone()
+        if row is None:
+            self._count(False)
+            return default
+        with self._lock:
+            self.hits += 1
+            self._touched[key] = now
+            due = now - self._flushed >= self.touch_interval
+        if due:
+            self._flush_touched(con)
+        return json.loads(row[0])
+
+    #Schreibt die gesammelten Lesezeitpunkte in einer Transaktion. Gelingt das nicht (Datenbank gesperrt), gehen sie
+    #verloren; sie bestimmen nur die Reihenfolge der Eviction.
+    def _flush_touched(self, con):
+        with self._lock:
+            touched, self._touched = self._touched, {}
+            self._flushed = time.time()
+        if not touched:
+            return
+        try:
+            con.execute("BEGIN IMMEDIATE")
+            con.executemany("UPDATE cache SET accessed = MAX(accessed, ?) WHERE key = ?",
+                            [(t, key) for key, t in touched.items()])
+            con.execute("COMMIT")
+        except sqlite3.OperationalError:
+            if con.in_transaction:
+                con.execute("ROLLBACK")
+
+    def set(self, key, value, ttl):
+        data = json.dumps(value, separators=(",", ":")).encode("utf-8")
+        now = time.time()
+        con = self._conn()
+        #UPSERT statt INSERT OR REPLACE: REPLACE löst den Lösch-Trigger nicht aus, die Gesamtgrösse würde falsch
+        con.execute("""INSERT INTO cache (key, value, expires, accessed, size) VALUES (?, ?, ?, ?, ?)
+                       ON CONFLICT(key) DO UPDATE SET value = excluded.value, expires = excluded.expires,
+                                                      accessed = excluded.accessed, size = excluded.size""",
+                    (key, data, now + ttl, now, len(data)))
+        self._evict(con, now)
+
+    def _total(self, con):
+        return con.execute("SELECT total FROM cache_size WHERE id = 0").fetchone()[0]
+
+    #Nur wenn max_bytes überschritten ist: abgelaufene Einträge löschen, dann nach LRU kürzen, bis die Gesamtgrösse
+    #wieder darunter liegt. Vorher werden die gesammelten Lesezeitpunkte geschrieben, damit die Reihenfolge stimmt.
+    def _evict(self, con, now):
+        if self._total(con) <= self.max_bytes:
+            return
+        self._flush_touched(con)
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            con.execute("DELETE FROM cache WHERE expires <= ?", (now,))
+            excess = self._total(con) - self.max_bytes
+            if excess > 0:
+                for key, size in con.execute("SELECT key, size FROM cache ORDER BY accessed").fetchall():
+                    con.execute("DELETE FROM cache WHERE key = ?", (key,))
+                    excess -= size
+                    if excess <= 0:
+                        break
+            con.execute("COMMIT")
+        except Exception:
+            con.execute("ROLLBACK")
+            raise
+
+    def clear(self):
+        with self._lock:
+            self._touched = {}
+        self._conn().execute("DELETE FROM cache")
+
+    #Trefferquote und Füllstand für die Anzeige auf den Seiten
+    def stats(self):
+        con = self._conn()
+        n = con.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        total = self.hits + self.misses
+        return {"hits": self.hits, "misses": self.misses, "hit_rate": self.hits / total if total else 0.0,
+                "entries": n, "bytes": self._total(con)}
@@ -0,0 +1,92 @@
+#Client für die Edamam Recipe Search API v2 (Meal Plan Seite). Die rohen Treffer werden pro (mealType, diet, health)
+#im gemeinsamen DiskCache abgelegt, damit neue Sessions und andere Worker sie ohne API-Aufruf bekommen; das zufällige
+#Mischen pro Session passiert erst danach (pick_recipes). Quelle: https://developer.edamam.com/edamam-docs-recipe-api
+import os
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sportfuel.fdc import make_session
+
+EDAMAM_BASE_URL = os.getenv("EDAMAM_BASE_URL", "https://api.edamam.com/api/recipes/v2")
+RECIPES_TTL     = 3600         #wie bisher @st.cache_data(ttl=3600), jetzt aber für alle Sessions gemeinsam
+TIMEOUT         = 5
+
+# Ordnet jedem Mahlzeittyp, die Edamam-API erwartet, eine Liste von Labels zu, damit verschiedene Ergebnisse kommen
+DISH_TYPES = {
+    "Breakfast": ["Cereals","Pancake","Bread","Main course"],
+    "Lunch":     ["Main course","Salad","Sandwiches","Side dish","Soup"],
+    "Dinner":    ["Main course","Side dish","Soup"]
+}
+FIELDS = ["uri", "label", "image", "yield","ingredientLines", "calories", "totalNutrients", "instructions",
+          "dietLabels", "healthLabels"]
+
+
+#Mischt die Treffer mit dem Seed der Session und kürzt auf max_results (die gecachte Liste bleibt unverändert)
+def pick_recipes(hits, seed, max_results=5):
+    hits = list(hits)
+    random.Random(seed).shuffle(hits)
+    return hits[:max_results]
+
+
+class EdamamClient:
+    def __init__(self, app_id, app_key, user_id, base_url=EDAMAM_BASE_URL, cache=None, session=None, timeout=TIMEOUT):
+        self.app_id   = app_id
+        self.app_key  = app_key
+        self.user_id  = user_id
+        self.base_url = base_url
+        self.cache    = cache
+        self.session  = session or make_session()
+        self.timeout  = timeout
+        self._lock    = threading.Lock()
+        self.requests = 0
+        self.http_time = 0.0
+
+    # Parameter für Anfrage aufbauen basierend auf ID, Key, Essenstyp, Diät- und Ernährungspräferenzen
+    def _params(self, meal_type, diets, healths):
+        params = {"type": "public", "app_id": self.app_id, "app_key": self.app_key, "mealType": meal_type}
+        if diets:
+            params["diet"] = list(diets)
+        if healths:
+            params["health"] = list(healths)
+        if meal_type in DISH_TYPES:
+            params["dishType"] = DISH_TYPES[meal_type]
+        params["field"] = FIELDS
+        return params
+
+    def _fetch(self, meal_type, diets, healths):
+        t0 = time.perf_counter()
+        r = self.session.get(self.base_url, params=self._params(meal_type, diets, healths),
+                             headers={"Edamam-Account-User": self.user_id}, timeout=self.timeout)
+        r.raise_for_status()
+        hits = [h["recipe"] for h in r.json().get("hits", [])]
+        with self._lock:
+            self.requests += 1
+            self.http_time += time.perf_counter() - t0
+        return hits
+
+    #Alle Treffer (ungemischt) für eine Kombination; die Reihenfolge der Auswahl in der Sidebar spielt keine Rolle
+    def fetch_hits(self, meal_type, diets=(), healths=()):
+        key = f"edamam:{meal_type}:{','.join(sorted(diets))}:{','.join(sorted(healths))}"
+        if self.cache is not None:
+            hit = self.cache.get(key)
+            if hit is not None:
+                return hit
+        hits = self._fetch(meal_type, diets, healths)
+        if self.cache is not None:
+            self.cache.set(key, hits, RECIPES_TTL)
+        return hits
+
+    #Treffer für mehrere Mahlzeittypen gleichzeitig (ein Thread pro Typ): {mealType: hits}
+    def fetch_all(self, meal_types, diets=(), healths=()):
+        meal_types = list(meal_types)
+        with ThreadPoolExecutor(max_workers=max(len(meal_types), 1)) as pool:
+            results = pool.map(lambda m: self.fetch_hits(m, diets, healths), meal_types)
+            return dict(zip(meal_types, results))
+
+    def stats(self):
+        out = self.cache.stats() if self.cache is not None else {"hits": 0, "misses": 0, "hit_rate": 0.0}
+        out["http_requests"] = self.requests
+        out["http_avg_ms"] = self.http_time / self.requests * 1e3 if self.requests else 0.0
+        return out
@@ -0,0 +1,140 @@
+#Client für die USDA FoodData Central API (Snack-Finder auf der Vor_Workout Seite). Alle Aufrufe laufen über eine
+#gepoolte requests.Session mit Timeouts und Retries; Antworten werden im gemeinsamen DiskCache abgelegt.
+#Quelle: U.S. Department of Agriculture, https://fdc.nal.usda.gov/api-guide
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+FDC_BASE_URL = os.getenv("FDC_BASE_URL", "https://api.nal.usda.gov/fdc/v1")
+SEARCH_TTL   = 24 * 3600         #Suchresultate: 1 Tag
+DETAILS_TTL  = 30 * 24 * 3600    #Nährwertdetails ändern sich kaum: 30 Tage
+TIMEOUT      = (3.05, 10)        #Verbindungsaufbau, Antwort (Sekunden)
+BULK_MAX     = 20                #FDC erlaubt höchstens 20 fdcIds pro /foods-Anfrage
+MAX_WORKERS  = 8                 #parallele Einzelabfragen, falls der Bulk-Endpunkt nicht antwortet
+
+
+#Session mit Connection-Pool und Retries bei Verbindungsfehlern, 429 und 5xx
+def make_session(retries=3, pool_size=16):
+    session = requests.Session()
+    retry = Retry(total=retries, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504),
+                  allowed_methods=("GET", "POST"))
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=retry)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+#Energie und Kohlenhydrate pro 100 g sowie Portionsgrösse in Gramm aus einer Detail-Antwort, gleiche Felder wie
+#sportfuel.food_db.FoodDB.search. Code erstellt mit Hilfe von: OpenAI. (2025). ChatGPT 4O (Version vom 29.04.2025) [Large language model]. https://chat.openai.com/chat.
+def snack_nutrients(details):
+    nut = {}
+    for n in details.get("foodNutrients", []):
+        if "nutrient" in n and isinstance(n["nutrient"], dict):
+            k = n["nutrient"].get("name"); v = n.get("amount", 0)
+        elif "nutrientName" in n:
+            k = n.get("nutrientName");     v = n.get("value", 0)
+        else:
+            continue
+        if k:
+            nut[k] = v or 0
+
+    servs = details.get("servings", {}).get("serving", [])
+    if isinstance(servs, dict): servs = [servs]
+    gs = next((s for s in servs if s.get("metricServingUnit") == "g"), servs[0] if servs else {}).get("metricServingAmount", 100)
+    return {
+        "fdcId":       details.get("fdcId"),
+        "description": details.get("description", "Unbekannt"),
+        "kcal_100g":   nut.get("Energy") or nut.get("Calories") or 0,
+        "carbs_100g":  nut.get("Carbohydrate, by difference", 0),
+        "serving_g":   float(gs),
+    }
+
+
+class FdcClient:
+    def __init__(self, api_key, base_url=FDC_BASE_URL, cache=None, session=None, timeout=TIMEOUT):
+        self.api_key  = api_key
+        self.base_url = base_url.rstrip("/")
+        self.cache    = cache
+        self.session  = session or make_session()
+        self.timeout  = timeout
+        self._lock    = threading.Lock()
+        self.requests = 0        #HTTP-Aufrufe (Cache-Fehlschläge)
+        self.http_time = 0.0     #Summe der HTTP-Latenzen in Sekunden
+
+    def _get_json(self, path, params):
+        t0 = time.perf_counter()
+        r = self.session.get(f"{self.base_url}{path}", params={"api_key": self.api_key, **params}, timeout=self.timeout)
+        r.raise_for_status()
+        data = r.json()
+        with self._lock:
+            self.requests += 1
+            self.http_time += time.perf_counter() - t0
+        return data
+
+    def _post_json(self, path, payload):
+        t0 = time.perf_counter()
+        r = self.session.post(f"{self.base_url}{path}", params={"api_key": self.api_key}, json=payload, timeout=self.timeout)
+        r.raise_for_status()
+        data = r.json()
+        with self._lock:
+            self.requests += 1
+            self.http_time += time.perf_counter() - t0
+        return data
+
+    def _cached(self, key, ttl, fetch):
+        if self.cache is not None:
+            hit = self.cache.get(key)
+            if hit is not None:
+                return hit
+        data = fetch()
+        if self.cache is not None:
+            self.cache.set(key, data, ttl)
+        return data
+
+    # Sucht Snacks anhand eines Stichworts und limit
+    def search_foods(self, q, limit=5):
+        key = f"fdc:search:{q.strip().lower()}:{limit}"
+        return self._cached(key, SEARCH_TTL, lambda: self._get_json(
+            "/foods/search", {"query": q, "pageSize": limit}).get("foods", []))
+
+    # Holt detaillierte Nährstoffdaten für ein Food-Item
+    def get_food_details(self, fid):
+        return self._cached(f"fdc:food:{fid}", DETAILS_TTL, lambda: self._get_json(f"/food/{fid}", {}))
+
+    #Details für viele Items auf einmal, in derselben Reihenfolge wie `fids`: zuerst aus dem Cache, der Rest über den
+    #Bulk-Endpunkt /foods (je 20 IDs pro Anfrage); was dort fehlt oder fehlschlägt, wird parallel einzeln geholt
+    def get_foods_details(self, fids):
+        fids = list(fids)
+        found = {}
+        if self.cache is not None:
+            for fid in fids:
+                hit = self.cache.get(f"fdc:food:{fid}")
+                if hit is not None:
+                    found[fid] = hit
+        missing = [fid for fid in dict.fromkeys(fids) if fid not in found]
+        for s in range(0, len(missing), BULK_MAX):
+            try:
+                for food in self._post_json("/foods", {"fdcIds": missing[s:s + BULK_MAX]}):
+                    found[food.get("fdcId")] = food
+            except (requests.RequestException, ValueError):
+                break
+        rest = [fid for fid in missing if fid not in found]
+        if rest:
+            with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(rest))) as pool:
+                for fid, food in zip(rest, pool.map(lambda f: self._get_json(f"/food/{f}", {}), rest)):
+                    found[fid] = food
+        if self.cache is not None:
+            for fid in missing:
+                self.cache.set(f"fdc:food:{fid}", found[fid], DETAILS_TTL)
+        return [found[fid] for fid in fids]
+
+    #Trefferquote des Caches und mittlere HTTP-Latenz
+    def stats(self):
+        out = self.cache.stats() if self.cache is not None else {"hits": 0, "misses": 0, "hit_rate": 0.0}
+        out["http_requests"] = self.requests
+        out["http_avg_ms"] = self.http_time / self.requests * 1e3 if self.requests else 0.0
+        return out
@@ -0,0 +1,160 @@
+#Spaltenweiser Parser für FIT-Dateien (Garmin & Co.): ein schlanker Durchlauf merkt sich nur Offset und Definition jeder
+#record-Nachricht, danach werden alle Nachrichten einer Definition auf einmal als NumPy-Strukturarray gelesen.
+#Es entstehen keine Objekte oder Dicts pro Datensatz (anders als bei fitparse). Protokoll: https://developer.garmin.com/fit/protocol/
+import struct
+import numpy as np
+
+from sportfuel.track import Track
+
+RECORD_MSG = 20                        #globale Nachrichtennummer "record"
+FIT_EPOCH  = 631065600                 #FIT-Zeit 0 = 1989-12-31 00:00 UTC, in Sekunden seit 1970
+SEMICIRCLE = 180.0 / 2 ** 31           #Umrechnung semicircles -> Grad
+
+#Feldnummer der record-Nachricht -> (Spalte, NumPy-Typ, Faktor, Offset, ungültiger Rohwert)
+RECORD_FIELDS = {
+    253: ("timestamp",         "u4", 1,          0,   0xFFFFFFFF),
+    0:   ("lat",               "i4", SEMICIRCLE, 0,   0x7FFFFFFF),
+    1:   ("lon",               "i4", SEMICIRCLE, 0,   0x7FFFFFFF),
+    2:   ("altitude",          "u2", 1 / 5,      500, 0xFFFF),
+    78:  ("enhanced_altitude", "u4", 1 / 5,      500, 0xFFFFFFFF),
+    3:   ("heart_rate",        "u1", 1,          0,   0xFF),
+    5:   ("distance",          "u4", 1 / 100,    0,   0xFFFFFFFF),
+    7:   ("power",             "u2", 1,          0,   0xFFFF),
+}
+COLUMNS = ["timestamp", "lat", "lon", "ele", "distance", "heart_rate", "power"]
+
+
+#Ergebnis: eine Spalte (float64, NaN = fehlt) pro Messgrösse, Zeit in Sekunden seit 1970
+class FitRecords:
+    def __init__(self, columns):
+        self.columns = columns
+
+    def __len__(self):
+        return len(self.columns["timestamp"])
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    #Dauer und Distanz aus Zeitstempeln bzw. dem Distanzfeld des Geräts (für Aufzeichnungen ohne GPS)
+    def duration(self):
+        t = self.columns["timestamp"]
+        t = t[~np.isnan(t)]
+        return float(t[-1] - t[0]) if len(t) > 1 else 0.0
+
+    def distance(self):
+        d = self.columns["distance"]
+        return float(np.nanmax(d)) if np.isfinite(d).any() else 0.0
+
+    #Track aus allen Punkten mit Position; Dauer, Distanz und Koordinaten dann genau wie beim GPX-Upload
+    def to_track(self):
+        c = self.columns
+        pos = np.isfinite(c["lat"]) & np.isfinite(c["lon"])
+        track = Track(c["lat"][pos], c["lon"][pos], c["ele"][pos], c["timestamp"][pos], [0])
+        if not len(track):    #Indoor-Aufzeichnung ohne GPS
+            track.duration  = self.duration()
+            track.length_3d = self.distance()
+        return track
+
+
+#Ein Durchlauf über alle Nachrichtenköpfe. Merkt sich für record-Nachrichten Offset, Definition und ggf. den
+#Zeitstempel aus einem komprimierten Kopf; alle anderen Nachrichten werden nur übersprungen.
+def _scan(buf):
+    defs, def_list = {}, []
+    rec_off, rec_def, rec_cts = [], [], []
+    pos, end_file = 0, len(buf)
+    last_ts = 0
+    while pos + 12 <= end_file:    #mehrere verkettete FIT-Dateien sind erlaubt
+        header_size = buf[pos]
+        data_size = struct.unpack_from("<I", buf, pos + 4)[0]
+        if buf[pos + 8:pos + 12] != b".FIT":
+            raise ValueError("Keine gültige FIT-Datei")
+        pos += header_size
+        end = pos + data_size
+        while pos < end:
+            h = buf[pos]
+            pos += 1
+            if h & 0x80:                               #komprimierter Zeitstempel-Kopf
+                d = defs[(h >> 5) & 0x3]
+                last_ts += ((h & 0x1F) - last_ts) & 0x1F
+                cts = last_ts
+            elif h & 0x40:                             #Definitionsnachricht
+                arch = "<" if buf[pos + 1] == 0 else ">"
+                global_num = struct.unpack_from(arch + "H", buf, pos + 2)[0]
+                n_fields = buf[pos + 4]
+                fields = [tuple(buf[pos + 5 + 3 * i:pos + 8 + 3 * i]) for i in range(n_fields)]
+                pos += 5 + 3 * n_fields
+                size = sum(f[1] for f in fields)
+                if h & 0x20:                           #Developer-Felder: nur Grösse berücksichtigen
+                    n_dev = buf[pos]
+                    size += sum(buf[pos + 2 + 3 * i] for i in range(n_dev))
+                    pos += 1 + 3 * n_dev
+                offsets = np.cumsum([0] + [f[1] for f in fields])
+                ts_off = next((int(o) for f, o in zip(fields, offsets) if f[0] == 253 and f[1] == 4), None)
+                d = {"id": len(def_list), "global": global_num, "arch": arch, "size": size,
+                     "fields": fields, "offsets": offsets, "ts_off": ts_off}
+                def_list.append(d)
+                defs[h & 0x0F] = d
+                continue
+            else:
+                d = defs[h & 0x0F]
+                cts = -1
+            if d["ts_off"] is not None:                #jede Nachricht mit Zeitstempel setzt die Referenz für komprimierte Köpfe
+                last_ts = struct.unpack_from(d["arch"] + "I", buf, pos + d["ts_off"])[0]
+            if d["global"] == RECORD_MSG:
+                rec_off.append(pos)
+                rec_def.append(d["id"])
+                rec_cts.append(cts)
+            pos += d["size"]
+        pos = end + 2                                  #CRC der Datei überspringen
+    return def_list, np.asarray(rec_off, dtype=np.int64), np.asarray(rec_def, dtype=np.int64), np.asarray(rec_cts, dtype=np.int64)
+
+
+#Liest eine FIT-Datei aus Bytes oder einem Datei-Objekt (z.B. Streamlit UploadedFile)
+def parse_fit(source):
+    if hasattr(source, "getbuffer"):
+        buf = source.getbuffer()
+    elif hasattr(source, "read"):
+        source.seek(0)
+        buf = source.read()
+    else:
+        buf = source
+    buf = memoryview(buf).cast("B")
+    def_list, rec_off, rec_def, rec_cts = _scan(buf)
+
+    raw = np.frombuffer(buf, dtype=np.uint8)
+    n = len(rec_off)
+    cols = {c: np.full(n, np.nan) for c in ["timestamp", "lat", "lon", "altitude", "enhanced_altitude",
+                                            "distance", "heart_rate", "power"]}
+    for d in def_list:
+        if d["global"] != RECORD_MSG:
+            continue
+        rows = np.flatnonzero(rec_def == d["id"])
+        if not len(rows):
+            continue
+        #alle Nachrichten dieser Definition als (k, size) Bytes und dann als Strukturarray lesen
+        names, formats, offsets = [], [], []
+        for (num, size, _), off in zip(d["fields"], d["offsets"]):
+            spec = RECORD_FIELDS.get(num)
+            if spec and np.dtype(spec[1]).itemsize == size:
+                names.append(spec[0])
+                formats.append(d["arch"] + spec[1])
+                offsets.append(int(off))
+        block = raw[rec_off[rows, None] + np.arange(d["size"])]
+        view = np.ascontiguousarray(block).view(np.dtype({"names": names, "formats": formats,
+                                                          "offsets": offsets, "itemsize": d["size"]}))[:, 0]
+        for name in names:
+            _, _, scale, offset, invalid = next(v for v in RECORD_FIELDS.values() if v[0] == name)
+            values = view[name]
+            cols[name][rows] = np.where(values == invalid, np.nan, values * scale - offset)
+
+    ts = np.where(rec_cts >= 0, rec_cts, cols["timestamp"])    #komprimierte Köpfe liefern den Zeitstempel separat
+    ele = np.where(np.isnan(cols["enhanced_altitude"]), cols["altitude"], cols["enhanced_altitude"])
+    return FitRecords({
+        "timestamp":  ts + FIT_EPOCH,
+        "lat":        cols["lat"],
+        "lon":        cols["lon"],
+        "ele":        ele,
+        "distance":   cols["distance"],
+        "heart_rate": cols["heart_rate"],
+        "power":      cols["power"],
+    })
@@ -0,0 +1,216 @@
+#Lokale Nährwert-Datenbank aus dem FDC-Bulk-Download (CSV, als Ordner oder ZIP). Der Import rechnet pro Lebensmittel
+#Energie und Kohlenhydrate pro 100 g sowie die Portionsgrösse in Gramm aus und legt einen FTS5-Volltextindex über die
+#Beschreibungen. Der Snack-Finder fragt zuerst hier ab: Suche in Millisekunden, ohne Netz und ohne API-Key.
+#Die Zeilen sind nach Länge der Beschreibung nummeriert (kurz = allgemein, z.B. "Bananas, raw" vor langen Markennamen);
+#die Suche liest deshalb nur die ersten `limit` Treffer in Rowid-Reihenfolge statt alle Treffer zu bewerten.
+#Quelle: U.S. Department of Agriculture, https://fdc.nal.usda.gov/download-datasets
+#Aufruf: python -m sportfuel.food_db FoodData_Central_csv_<datum>.zip [-o data/fdc_foods.sqlite]
+import argparse
+import io
+import os
+import re
+import sqlite3
+import threading
+import time
+import zipfile
+import pandas as pd
+
+DEFAULT_PATH = os.getenv("SPORTFUEL_FOOD_DB", os.path.join("data", "fdc_foods.sqlite"))
+CHUNKSIZE    = 200_000
+
+#nutrient_id im FDC-Schema: Energie in kcal (direkt bzw. nach Atwater) und Kohlenhydrate (by difference)
+ENERGY_IDS = (1008, 2047, 2048)
+CARB_ID    = 1005
+GRAM_UNITS = ("g", "grm")
+
+SCHEMA = """
+CREATE TABLE foods (
+    id          INTEGER PRIMARY KEY,    --Reihenfolge nach Länge der Beschreibung
+    fdc_id      INTEGER NOT NULL UNIQUE,
+    description TEXT NOT NULL,
+    data_type   TEXT,
+    kcal_100g   REAL NOT NULL,
+    carbs_100g  REAL NOT NULL,
+    serving_g   REAL NOT NULL
+);
+CREATE VIRTUAL TABLE foods_fts USING fts5(
+    description, content='foods', content_rowid='id', tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+);
+"""
+
+
+#CSV-Dateien des Bulk-Downloads finden (der ZIP enthält meist einen Unterordner mit Datum). Mit `with` verwenden:
+#der ZIP ist mehrere GB gross und bleibt sonst bis zur Garbage Collection offen.
+class _Source:
+    def __init__(self, path):
+        self.path = path
+        self.zip  = zipfile.ZipFile(path) if zipfile.is_zipfile(path) else None
+
+    def close(self):
+        if self.zip is not None:
+            self.zip.close()
+            self.zip = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _name(self, name):
+        if self.zip is None:
+            full = os.path.join(self.path, name)
+            return full if os.path.exists(full) else None
+        return next((m for m in self.zip.namelist() if os.path.basename(m) == name), None)
+
+    def size(self, name):
+        member = self._name(name)
+        if member is None:
+            return 0
+        return self.zip.getinfo(member).file_size if self.zip else os.path.getsize(member)
+
+    #Liest die Datei blockweise, nur mit den benötigten Spalten; fehlt sie, kommt nichts zurück
+    def chunks(self, name, usecols, dtype=None):
+        member = self._name(name)
+        if member is None:
+            return
+        f = io.TextIOWrapper(self.zip.open(member), encoding="utf-8") if self.zip else open(member, encoding="utf-8")
+        with f:
+            yield from pd.read_csv(f, usecols=usecols, dtype=dtype, chunksize=CHUNKSIZE)
+
+
+#Importiert den Bulk-Download nach `db_path` (wird neu geschrieben). Nur Lebensmittel mit Energieangabe werden
+#übernommen; `data_types` schränkt optional ein (z.B. ["branded_food", "foundation_food"]). Gibt die Anzahl zurück.
+def import_fdc(src_path, db_path=DEFAULT_PATH, data_types=None):
+    if os.path.dirname(db_path):
+        os.makedirs(os.path.dirname(db_path), exist_ok=True)
+    tmp_path = db_path + ".tmp"
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    con = sqlite3.connect(tmp_path, isolation_level=None)
+    con.execute("PRAGMA journal_mode=OFF")    #Import in eine frische Datei: kein Journal nötig
+    con.execute("PRAGMA synchronous=OFF")
+    con.executescript("""
+        CREATE TEMP TABLE food_raw (fdc_id INTEGER PRIMARY KEY, description TEXT, data_type TEXT);
+        CREATE TEMP TABLE nut_raw  (fdc_id INTEGER, nutrient_id INTEGER, amount REAL);
+        CREATE TEMP TABLE serv_raw (fdc_id INTEGER, prio INTEGER, grams REAL);
+    """)
+    with _Source(src_path) as src:
+        con.execute("BEGIN")    #alle Zeilen in einer Transaktion
+
+        for chunk in src.chunks("food.csv", ["fdc_id", "data_type", "description"]):
+            if data_types:
+                chunk = chunk[chunk["data_type"].isin(data_types)]
+            chunk = chunk.dropna(subset=["description"])
+            con.executemany("INSERT OR REPLACE INTO food_raw VALUES (?, ?, ?)",
+                            chunk[["fdc_id", "description", "data_type"]].itertuples(index=False, name=None))
+
+        #food_nutrient.csv ist die mit Abstand grösste Datei; es bleiben nur die drei Nährstoffe pro Lebensmittel
+        wanted = list(ENERGY_IDS) + [CARB_ID]
+        for chunk in src.chunks("food_nutrient.csv", ["fdc_id", "nutrient_id", "amount"],
+                                dtype={"fdc_id": "int64", "nutrient_id": "int32", "amount": "float64"}):
+            chunk = chunk[chunk["nutrient_id"].isin(wanted) & chunk["amount"].notna()]
+            con.executemany("INSERT INTO nut_raw VALUES (?, ?, ?)",
+                            chunk[["fdc_id", "nutrient_id", "amount"]].itertuples(index=False, name=None))
+
+        #Portionsgrösse: Markenprodukte haben serving_size in g (Vorrang), sonst die erste Portion aus food_portion.csv
+        for chunk in src.chunks("branded_food.csv", ["fdc_id", "serving_size", "serving_size_unit"]):
+            unit = chunk["serving_size_unit"].astype(str).str.strip().str.lower()
+            chunk = chunk[unit.isin(GRAM_UNITS) & (chunk["serving_size"] > 0)]
+            con.executemany("INSERT INTO serv_raw VALUES (?, 0, ?)",
+                            chunk[["fdc_id", "serving_size"]].itertuples(index=False, name=None))
+        for chunk in src.chunks("food_portion.csv", ["fdc_id", "seq_num", "gram_weight"]):
+            chunk = chunk[chunk["gram_weight"] > 0]
+            prio = 1 + chunk["seq_num"].fillna(0).astype("int64")
+            con.executemany("INSERT INTO serv_raw VALUES (?, ?, ?)",
+                            zip(chunk["fdc_id"].tolist(), prio.tolist(), chunk["gram_weight"].tolist()))
+
+        con.execute("COMMIT")
+    con.executescript(f"""
+        BEGIN;
+        CREATE INDEX temp.nut_raw_fdc ON nut_raw(fdc_id);
+        CREATE INDEX temp.serv_raw_fdc ON serv_raw(fdc_id, prio);
+        {SCHEMA}
+        INSERT INTO foods (fdc_id, description, data_type, kcal_100g, carbs_100g, serving_g)
+        SELECT f.fdc_id, f.description, f.data_type, n.kcal, COALESCE(n.carbs, 0),
+               COALESCE((SELECT s.grams FROM serv_raw s WHERE s.fdc_id = f.fdc_id ORDER BY s.prio LIMIT 1), 100)
+        FROM food_raw f
+        JOIN (SELECT fdc_id,
+                     COALESCE(MAX(CASE WHEN nutrient_id = {ENERGY_IDS[0]} THEN amount END),
+                              MAX(CASE WHEN nutrient_id = {ENERGY_IDS[1]} THEN amount END),
+                              MAX(CASE WHEN nutrient_id = {ENERGY_IDS[2]} THEN amount END)) AS kcal,
+                     MAX(CASE WHEN nutrient_id = {CARB_ID} THEN amount END) AS carbs
+              FROM nut_raw GROUP BY fdc_id) n USING (fdc_id)
+        WHERE n.kcal IS NOT NULL
+        ORDER BY length(f.description), f.fdc_id;
+        INSERT INTO foods_fts(foods_fts) VALUES ('rebuild');
+        INSERT INTO foods_fts(foods_fts) VALUES ('optimize');
+        DROP TABLE food_raw; DROP TABLE nut_raw; DROP TABLE serv_raw;
+        COMMIT;
+    """)
+    n = con.execute("SELECT COUNT(*) FROM foods").fetchone()[0]
+    con.execute("VACUUM")
+    con.close()
+    os.replace(tmp_path, db_path)
+    return n
+
+
+#Suchbegriff -> FTS5-Abfrage: jedes Wort als Präfix, alle Wörter müssen vorkommen ("energy ba" -> "energy"* "ba"*)
+def _fts_query(q):
+    return " ".join(f'"{t}"*' for t in re.findall(r"\w+", q.lower()))
+
+
+#Lesezugriff auf die importierte Datenbank; eine Verbindung pro Thread wie beim DiskCache
+class FoodDB:
+    def __init__(self, path=DEFAULT_PATH):
+        if not os.path.exists(path):
+            raise FileNotFoundError(path)
+        self.path   = path
+        self._local = threading.local()
+        self._len   = None
+
+    def _conn(self):
+        con = getattr(self._local, "con", None)
+        if con is None:
+            con = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True)
+            self._local.con = con
+        return con
+
+    def __len__(self):
+        if self._len is None:    #Datei ändert sich nur durch einen neuen Import
+            self._len = self._conn().execute("SELECT COUNT(*) FROM foods").fetchone()[0]
+        return self._len
+
+    #Die `limit` kürzesten Beschreibungen, die alle Suchwörter enthalten; gleiche Felder wie fdc.snack_nutrients.
+    #Kein BM25: das müsste jeden Treffer bewerten (bei "banana" zehntausende), so endet die Abfrage nach `limit` Zeilen.
+    def search(self, q, limit=5):
+        query = _fts_query(q)
+        if not query:
+            return []
+        rows = self._conn().execute("""
+            SELECT fdc_id, description, kcal_100g, carbs_100g, serving_g FROM foods
+            WHERE id IN (SELECT rowid FROM foods_fts WHERE foods_fts MATCH ? ORDER BY rowid LIMIT ?)
+            ORDER BY id""", (query, limit)).fetchall()
+        return [{"fdcId": r[0], "description": r[1], "kcal_100g": r[2], "carbs_100g": r[3], "serving_g": r[4]}
+                for r in rows]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="FDC-Bulk-Download (CSV) in die lokale Snack-Datenbank importieren")
+    parser.add_argument("source", help="ZIP oder entpackter Ordner des FoodData Central CSV-Downloads")
+    parser.add_argument("-o", "--output", default=DEFAULT_PATH, help=f"SQLite-Datei, Standard: {DEFAULT_PATH}")
+    parser.add_argument("--data-types", default=None,
+                        help="Komma-getrennt, z.B. branded_food,foundation_food,sr_legacy_food (Standard: alle)")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    data_types = args.data_types.split(",") if args.data_types else None
+    with _Source(args.source) as src:
+        mb = sum(src.size(f) for f in ("food.csv", "food_nutrient.csv", "branded_food.csv", "food_portion.csv")) / 1e6
+    n = import_fdc(args.source, args.output, data_types)
+    dt = time.perf_counter() - t0
+    print(f"{n:,} Lebensmittel in {dt:.1f} s importiert ({n / dt:,.0f}/s, {mb / dt:.0f} MB/s CSV) -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
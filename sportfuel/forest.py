@@ -0,0 +1,153 @@
+#Kompakter Export des Kalorien-Modells (RandomForest aus sport-fuel-ml/train_model.py) als flache Knoten-Arrays in einer .npz-Datei.
+#Die Vorhersage braucht kein sklearn; die Arrays werden direkt aus der unkomprimierten .npz gemappt (np.memmap),
+#so teilen sich alle Streamlit-Worker dieselben Speicherseiten statt hunderte Baum-Objekte zu entpacken.
+import struct
+import zipfile
+import numpy as np
+
+CHUNK_ROWS = 8192    #Zeilen pro Block bei grossen Batches, damit die (Zeilen x Bäume)-Arrays klein bleiben
+
+
+#Knoten-Arrays (links, rechts, Merkmal, Schwelle, Wert, Tiefe) je Baum; Blätter sind mit -1 bzw. is_leaf markiert.
+#RandomForest/ExtraTrees: Vorhersage = Mittel der Bäume. HistGradientBoosting: Baseline + Summe der Bäume; die Blattwerte
+#werden deshalb mit der Baumanzahl skaliert und um die Baseline verschoben, damit dasselbe Mittel das richtige Ergebnis gibt.
+def _tree_arrays(estimator):
+    if hasattr(estimator, "estimators_"):
+        for est in estimator.estimators_:
+            t = est.tree_
+            yield t.children_left, t.children_right, t.feature, t.threshold, t.value[:, 0, 0], t.max_depth
+        return
+    trees    = [p[0] for p in estimator._predictors]    #ein Prädiktor pro Iteration (Regression)
+    baseline = float(np.ravel(estimator._baseline_prediction)[0])
+    for p in trees:
+        n    = p.nodes
+        leaf = n["is_leaf"].astype(bool)
+        yield (np.where(leaf, -1, n["left"].astype(np.int64)), np.where(leaf, -1, n["right"].astype(np.int64)),
+               n["feature_idx"], n["num_threshold"],
+               n["value"] * len(trees) + baseline, int(n["depth"].max()))
+
+
+#Schreibt Pipeline(ColumnTransformer + Baum-Ensemble) als flache Arrays. Blätter zeigen auf sich selbst,
+#dadurch kann die Vorhersage alle Bäume gleichzeitig Schritt für Schritt absteigen ohne Sonderfälle.
+def export_forest(model, path):
+    preprocessor, forest = model[0], model[-1]
+    encoder    = preprocessor.named_transformers_["activity"]
+    categories = np.asarray(encoder.categories_[0]).astype(str)    #Vokabular des OneHotEncoders
+    cols_in    = list(preprocessor.feature_names_in_)
+    numeric    = [cols_in[c] if isinstance(c, (int, np.integer)) else c for c in preprocessor.transformers_[-1][2]]    #durchgereichte Spalten (remainder="passthrough")
+
+    lefts, rights, feats, thrs, vals, roots = [], [], [], [], [], []
+    offset, depth = 0, 0
+    for left, right, feature, threshold, value, max_depth in _tree_arrays(forest):
+        idx  = np.arange(len(left))
+        leaf = left == -1
+        lefts.append(np.where(leaf, idx, left) + offset)
+        rights.append(np.where(leaf, idx, right) + offset)
+        feats.append(np.where(leaf, 0, feature))
+        thrs.append(np.where(leaf, 0.0, threshold))
+        vals.append(value)
+        roots.append(offset)
+        offset += len(left)
+        depth   = max(depth, max_depth)
+
+    n_features = len(categories) + len(numeric)
+    np.savez(    #bewusst unkomprimiert, sonst ist kein memmap möglich
+        path,
+        kind="forest",
+        left=np.concatenate(lefts).astype(np.int32),
+        right=np.concatenate(rights).astype(np.int32),
+        feature=np.concatenate(feats).astype(np.min_scalar_type(n_features)),
+        threshold=np.concatenate(thrs).astype(np.float64),
+        value=np.concatenate(vals).astype(np.float64),
+        roots=np.asarray(roots, dtype=np.int32),
+        depth=np.int32(depth),
+        categories=categories,
+        numeric=np.asarray(numeric, dtype=str),
+    )
+
+
+#Öffnet die Arrays einer unkomprimierten .npz als memmap (np.load ignoriert mmap_mode bei .npz-Dateien)
+def _mmap_npz(path):
+    arrays = {}
+    with open(path, "rb") as f, zipfile.ZipFile(f) as zf:
+        for info in zf.infolist():
+            name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+            if info.compress_type != zipfile.ZIP_STORED:
+                with zf.open(info) as member:
+                    arrays[name] = np.lib.format.read_array(member)
+                continue
+            f.seek(info.header_offset)
+            header = f.read(30)    #lokaler ZIP-Header: Längen von Dateiname und Extra-Feld stehen in Byte 26-29
+            n_name, n_extra = struct.unpack("<HH", header[26:30])
+            f.seek(info.header_offset + 30 + n_name + n_extra)
+            version = np.lib.format.read_magic(f)
+            read_header = np.lib.format.read_array_header_1_0 if version == (1, 0) else np.lib.format.read_array_header_2_0
+            shape, fortran, dtype = read_header(f)
+            if dtype.hasobject or not shape:    #Skalare und Strings sind klein -> normal lesen
+                f.seek(info.header_offset + 30 + n_name + n_extra)
+                arrays[name] = np.lib.format.read_array(f)
+            else:
+                arrays[name] = np.memmap(f, dtype=dtype, mode="r", shape=shape,
+                                         order="F" if fortran else "C", offset=f.tell())
+    return arrays
+
+
+#Schlanker Ersatz für model.predict(X) der sklearn-Pipeline
+class ForestPredictor:
+    def __init__(self, arrays):
+        self.left       = np.asarray(arrays["left"])    #ndarray-Sicht auf die memmaps (ohne Kopie)
+        self.right      = np.asarray(arrays["right"])
+        self.feature    = np.asarray(arrays["feature"])
+        self.threshold  = np.asarray(arrays["threshold"])
+        self.value      = np.asarray(arrays["value"])
+        self.roots      = np.asarray(arrays["roots"])
+        self.depth      = int(arrays["depth"])
+        self.categories = [str(c) for c in arrays["categories"]]
+        self.numeric    = [str(c) for c in arrays["numeric"]]
+        self._codes     = {c: i for i, c in enumerate(self.categories)}
+
+    #Activity -> Index im Vokabular, Zahlen als float32 wie in sklearn. Unbekannte Aktivitäten ergeben einen ValueError
+    #(wie handle_unknown="error"), der Aufrufer fällt dann auf die Formel zurück
+    def _encode(self, X):
+        acts  = [str(a) for a in X["Activity"]]
+        unknown = sorted(set(acts) - self._codes.keys())
+        if unknown:
+            raise ValueError(f"Unbekannte Aktivität(en): {', '.join(unknown)}")
+        codes = np.fromiter((self._codes[a] for a in acts), dtype=np.int64, count=len(acts))
+        num   = np.column_stack([np.asarray(X[c], dtype=np.float64) for c in self.numeric]).astype(np.float32)
+        return codes, num
+
+    #Alle Bäume werden gleichzeitig abgestiegen; pro Schritt werden nur noch die Pfade bearbeitet, die nicht in einem Blatt sind
+    def _predict_block(self, codes, num):
+        n, n_trees = len(codes), len(self.roots)
+        n_cat = len(self.categories)
+        X = np.zeros((n, n_cat + num.shape[1]), dtype=np.float32)    #Merkmalsmatrix wie nach dem ColumnTransformer
+        known = np.flatnonzero(codes >= 0)
+        X[known, codes[known]] = 1.0
+        X[:, n_cat:] = num
+        X = X.ravel()
+        width  = n_cat + num.shape[1]
+        node   = np.tile(self.roots, n)
+        base   = np.repeat(np.arange(n) * width, n_trees)    #Zeilen-Offset in der flachen Merkmalsmatrix
+        active = np.flatnonzero(self.left[node] != node)
+        while active.size:
+            nd  = node[active]
+            x   = X[base[active] + self.feature[nd]]
+            nxt = np.where(x <= self.threshold[nd], self.left[nd], self.right[nd])
+            node[active] = nxt
+            active = active[self.left[nxt] != nxt]
+        return self.value[node].reshape(n, n_trees).mean(axis=1)
+
+    def predict(self, X):
+        codes, num = self._encode(X)
+        out = np.empty(len(codes), dtype=np.float64)
+        for s in range(0, len(codes), CHUNK_ROWS):
+            out[s:s + CHUNK_ROWS] = self._predict_block(codes[s:s + CHUNK_ROWS], num[s:s + CHUNK_ROWS])
+        return out
+
+
+def load_forest(path, mmap=True):
+    if mmap:
+        return ForestPredictor(_mmap_npz(path))
+    with np.load(path) as data:
+        return ForestPredictor({k: data[k] for k in data.files})
@@ -0,0 +1,104 @@
+#Fueling-Simulation für den Intake-Plan der Vor_Workout Seite, minutengenau und ohne Python-Schleife pro Minute.
+#Bedarf (kcal, Kohlenhydrate, Flüssigkeit) steigt linear über die Dauer; geplant wird eine Zufuhr bei jedem Ess- bzw.
+#Trink-Zeitpunkt, der Gesamtbedarf wird gleichmässig auf diese Zeitpunkte verteilt. Bis Minute t gab es t // Intervall
+#Zeitpunkte, die kumulative Zufuhr ist also geschlossen berechenbar - auch für viele Intervalle auf einmal (Zeile pro
+#Intervall), womit suggest_intervals alle Kombinationen der Seite bewertet.
+import numpy as np
+
+CARB_G_PER_KG_H   = 1.5                      #Kohlenhydratbedarf pro kg Körpergewicht und Stunde (wie bisher im Fueling-Chart)
+EAT_INTERVALS     = (15, 20, 30, 45, 60)     #Auswahl der Seite in Minuten
+DRINK_INTERVALS   = (10, 15, 20, 30)
+CARB_TOLERANCE_G  = 30.0                     #so weit darf die Zufuhr dem Bedarf hinterherlaufen, etwa ein Gel
+FLUID_TOLERANCE_L = 0.25                     #etwa ein grosser Schluck aus der Flasche
+
+
+#Minuten 0..Dauer (mindestens Minute 0)
+def minutes(dauer):
+    return np.arange(int(dauer) + 1)
+
+
+#Kumulative Zufuhr (Intervalle, Minuten), wenn `total` gleichmässig auf die Zeitpunkte alle `interval` Minuten verteilt wird
+def cumulative_intake(t, intervals, total):
+    intervals = np.asarray(intervals, dtype=np.int64).reshape(-1, 1)
+    count = t[-1] // intervals                          #Zeitpunkte in der ganzen Einheit
+    return total * (t // intervals) / np.maximum(count, 1)
+
+
+#Grösster Rückstand der Zufuhr gegenüber dem Bedarf pro Intervall
+def max_deficit(t, intervals, total):
+    demand = total * t / max(t[-1], 1)
+    return (demand - cumulative_intake(t, intervals, total)).max(axis=1)
+
+
+#Ess-/Trink-Zeitpunkte wie im Intake-Plan: (Minuten, isst, trinkt), Minuten aufsteigend
+def intake_events(dauer, eat_int, drink_int):
+    t = minutes(dauer)[1:]
+    eat, drink = t % eat_int == 0, t % drink_int == 0
+    keep = eat | drink
+    return t[keep], eat[keep], drink[keep]
+
+
+#Zufuhr pro Ess-Zeitpunkt (kcal) und pro Trink-Zeitpunkt (L), NaN wo nichts geplant ist
+def intake_amounts(dauer, cal_burn, fluid_loss, eat_int, drink_int):
+    t, eat, drink = intake_events(dauer, eat_int, drink_int)
+    kcal  = np.where(eat,   cal_burn   / max(eat.sum(),   1), np.nan)
+    fluid = np.where(drink, fluid_loss / max(drink.sum(), 1), np.nan)
+    return t, kcal, fluid
+
+
+#Ganze Einheit minutengenau: Bedarf und geplante Zufuhr kumulativ, dazu die Kohlenhydrate aus dem Warenkorb,
+#verteilt auf die Ess-Zeitpunkte (cart_carbs=None: kein Warenkorb). Kohlenhydrate brauchen nur Gewicht und Ess-Intervall;
+#kcal (cal_burn) und Flüssigkeit (fluid_loss + drink_int) sind optional, ohne sie bleiben die zugehörigen Felder None.
+class Simulation:
+    def __init__(self, dauer, gewicht, eat_int, cal_burn=None, fluid_loss=None, drink_int=None, cart_carbs=None):
+        if (fluid_loss is None) != (drink_int is None):
+            raise ValueError("fluid_loss und drink_int nur zusammen angeben")
+        self.t = t = minutes(dauer)
+        frac   = t / max(t[-1], 1)
+        carbs  = CARB_G_PER_KG_H * gewicht * t[-1] / 60
+        self.carbs_demand  = carbs * frac
+        self.carbs_planned = cumulative_intake(t, eat_int, carbs)[0]
+        self.carbs_cart    = None if cart_carbs is None else cumulative_intake(t, eat_int, cart_carbs)[0]
+        self.kcal_demand = self.kcal_planned = self.fluid_demand = self.fluid_planned = None
+        if cal_burn is not None:
+            self.kcal_demand  = cal_burn * frac
+            self.kcal_planned = cumulative_intake(t, eat_int, cal_burn)[0]
+        if fluid_loss is not None:
+            self.fluid_demand  = fluid_loss * frac
+            self.fluid_planned = cumulative_intake(t, drink_int, fluid_loss)[0]
+
+    #Grösster Rückstand gegenüber dem Bedarf (g Kohlenhydrate, L Flüssigkeit)
+    def max_carb_deficit(self):
+        return float((self.carbs_demand - self.carbs_planned).max())
+
+    def max_fluid_deficit(self):
+        if self.fluid_planned is None:
+            raise ValueError("Simulation ohne Trinkplan (fluid_loss, drink_int)")
+        return float((self.fluid_demand - self.fluid_planned).max())
+
+
+#Bewertet alle Kombinationen aus Ess- und Trink-Intervallen auf einmal. Gibt (eat_int, drink_int, Tabelle) zurück:
+#gewählt wird die Kombination mit den wenigsten Stopps, bei der Kohlenhydrate und Flüssigkeit nie mehr als die
+#Toleranz hinter dem Bedarf liegen; hält keine Kombination die Toleranz ein, die mit dem kleinsten Rückstand.
+def suggest_intervals(dauer, gewicht, fluid_loss, eat_ints=EAT_INTERVALS, drink_ints=DRINK_INTERVALS,
+                      carb_tol=CARB_TOLERANCE_G, fluid_tol=FLUID_TOLERANCE_L):
+    t = minutes(dauer)
+    eat_ints, drink_ints = np.asarray(eat_ints), np.asarray(drink_ints)
+    carb_def  = max_deficit(t, eat_ints, CARB_G_PER_KG_H * gewicht * t[-1] / 60)    #(E,)
+    fluid_def = max_deficit(t, drink_ints, fluid_loss)                               #(D,)
+
+    #Stopps = Minuten mit Essen oder Trinken (gemeinsame Zeitpunkte zählen einmal)
+    n_eat, n_drink = t[-1] // eat_ints, t[-1] // drink_ints
+    n_both = t[-1] // np.lcm.outer(eat_ints, drink_ints)
+    stops  = n_eat[:, None] + n_drink[None, :] - n_both                             #(E, D)
+
+    ok    = (carb_def[:, None] <= carb_tol) & (fluid_def[None, :] <= fluid_tol)
+    over  = np.maximum(carb_def[:, None] / carb_tol, fluid_def[None, :] / fluid_tol)
+    score = np.where(ok, stops + over, np.inf)    #Gleichstand bei den Stopps: kleinerer Rückstand gewinnt
+    if not ok.any():
+        score = over
+    i, j = np.unravel_index(np.argmin(score), score.shape)
+    table = {"eat_int": np.repeat(eat_ints, len(drink_ints)), "drink_int": np.tile(drink_ints, len(eat_ints)),
+             "stops": stops.ravel(), "carb_deficit_g": np.repeat(carb_def, len(drink_ints)),
+             "fluid_deficit_l": np.tile(fluid_def, len(eat_ints)), "ok": ok.ravel()}
+    return int(eat_ints[i]), int(drink_ints[j]), table
@@ -0,0 +1,124 @@
+#GPX-Export der hochgeladenen Route mit den Ess-/Trink-Zeitpunkten als Wegpunkte (<wpt>), damit Radcomputer sie
+#anzeigen. Die Datei wird erst beim Klick auf den Download-Button erzeugt, in Blöcken von CHUNK_POINTS Trackpunkten
+#geschrieben (kein XML-Baum, kein zweiter String der ganzen Datei) und pro Inhalt (Track-Hash, Intervalle, Modus,
+#Mengen) unter EXPORT_DIR abgelegt; weitere Klicks und andere Worker lesen nur noch die Datei. Aufräumen löscht die am
+#längsten nicht benutzten Dateien, nie die gerade erzeugte; read_export erzeugt eine Datei neu, die ein anderer Worker
+#zwischen Prüfen und Öffnen gelöscht hat. Nur das Schreiben ist blockweise: der Download selbst liest die fertige Datei
+#einmal ganz, Streamlit legt die Bytes in seinen Media-Speicher.
+import hashlib
+import os
+import threading
+import numpy as np
+
+from sportfuel.fueling import intake_amounts
+
+EXPORT_DIR   = os.getenv("SPORTFUEL_EXPORT_DIR", os.path.join(".cache", "gpx"))
+CHUNK_POINTS = 20_000
+MAX_FILES    = 64    #ältere Exporte werden gelöscht
+HEADER = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+          '<gpx version="1.1" creator="Sport Fuel Guide" xmlns="http://www.topografix.com/GPX/1/1">\n')
+
+
+def _escape(text):
+    return str(text).replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;")
+
+
+#Zeitstempel (Sekunden seit 1970, NaN = fehlt) als ISO-8601-Strings mit Millisekunden (Aufzeichnungen mit 10-20 Hz),
+#leer wo keine Zeit vorhanden ist
+def _iso_times(seconds):
+    out = np.full(len(seconds), "", dtype=object)
+    ok = np.isfinite(seconds)
+    if ok.any():
+        stamps = np.round(seconds[ok] * 1000).astype("datetime64[ms]")
+        out[ok] = [f"<time>{t}Z</time>" for t in np.datetime_as_string(stamps, unit="ms").tolist()]
+    return out
+
+
+#Ein Block Trackpunkte als GPX-Text
+def _trkpts(lat, lon, ele, seconds):
+    ele_s  = [f"<ele>{e:.1f}</ele>" if e == e else "" for e in ele.tolist()]    #e == e: nicht NaN
+    time_s = _iso_times(seconds)
+    return "".join(f'<trkpt lat="{a:.7f}" lon="{o:.7f}">{e}{t}</trkpt>\n'
+                   for a, o, e, t in zip(lat.tolist(), lon.tolist(), ele_s, time_s))
+
+
+#Wegpunkte für die Ess-/Trink-Zeitpunkte an ihrer interpolierten Position (wie die Marker auf der Karte)
+def intake_waypoints(track, dauer, cal_burn, fluid_loss, eat_int, drink_int, by="time"):
+    minutes, kcal, fluid = intake_amounts(dauer, cal_burn, fluid_loss, eat_int, drink_int)
+    if not len(minutes) or not len(track):
+        return ""
+    positions = track.positions_at(minutes.astype(float), by=by, dauer_min=dauer)
+    parts = []
+    for (lat, lon), t, k, f in zip(positions.tolist(), minutes.tolist(), kcal.tolist(), fluid.tolist()):
+        what = [label for label, amount in (("Essen", k), ("Trinken", f)) if amount == amount]
+        desc = ", ".join(s for s in (f"{k:.0f} kcal" if k == k else "", f"{f:.2f} L" if f == f else "") if s)
+        parts.append(f'<wpt lat="{lat:.7f}" lon="{lon:.7f}"><name>{" + ".join(what)} {t} min</name>'
+                     f'<desc>{_escape(desc)}</desc><sym>{"Food" if k == k else "Drinking Water"}</sym>'
+                     f'<type>{" + ".join(what)}</type></wpt>\n')
+    return "".join(parts)
+
+
+#GPX als Folge von Byte-Blöcken: Kopf, Wegpunkte, dann pro Segment die Trackpunkte in Blöcken
+def iter_gpx(track, waypoints="", name="Sport Fuel Route", chunk_points=CHUNK_POINTS):
+    yield (HEADER + waypoints + f"<trk><name>{_escape(name)}</name>\n").encode("utf-8")
+    lat, lon = track.coords[:, 0], track.coords[:, 1]
+    bounds = sorted(set(int(s) for s in track.seg_starts if 0 <= s < len(track)) | {0}) + [len(track)]
+    for s, e in zip(bounds[:-1], bounds[1:]):
+        if e <= s:
+            continue
+        yield b"<trkseg>\n"
+        for i in range(s, e, chunk_points):
+            j = min(i + chunk_points, e)
+            yield _trkpts(lat[i:j], lon[i:j], track.ele[i:j], track.time[i:j]).encode("utf-8")
+        yield b"</trkseg>\n"
+    yield b"</trk>\n</gpx>\n"
+
+
+#Schreibt die Blöcke in eine Datei (erst vollständig, dann umbenennen) und gibt den Pfad zurück
+def write_gpx(path, chunks):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"    #Sessions laufen in Threads, Worker in Prozessen
+    with open(tmp, "wb") as f:
+        for chunk in chunks:
+            f.write(chunk)
+    os.replace(tmp, path)
+    return path
+
+
+#Pfad der exportierten Datei für einen Schlüssel (z.B. Track-Hash und Intervalle); erzeugt sie nur, wenn sie fehlt
+def cached_export(key, track, waypoints_fn, export_dir=EXPORT_DIR, name="Sport Fuel Route"):
+    path = os.path.join(export_dir, hashlib.sha1(repr(key).encode()).hexdigest()[:20] + ".gpx")
+    try:
+        os.utime(path)    #zuletzt benutzt -> wird beim Aufräumen zuletzt gelöscht
+    except FileNotFoundError:
+        write_gpx(path, iter_gpx(track, waypoints_fn(), name))
+        _prune(export_dir, MAX_FILES, current=path)
+    return path
+
+
+#Inhalt der exportierten Datei (bytes) für st.download_button; die Datei wird sofort wieder geschlossen.
+#Löscht ein anderer Worker die Datei zwischen cached_export und open, wird sie neu erzeugt.
+def read_export(key, track, waypoints_fn, export_dir=EXPORT_DIR, name="Sport Fuel Route", attempts=3):
+    for attempt in range(attempts):
+        path = cached_export(key, track, waypoints_fn, export_dir, name)
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            if attempt == attempts - 1:
+                raise
+
+
+#Behält die `keep` zuletzt benutzten Exporte; `current` (gerade geschrieben) wird nie gelöscht
+def _prune(export_dir, keep, current=None):
+    files = [os.path.join(export_dir, f) for f in os.listdir(export_dir) if f.endswith(".gpx")]
+    if len(files) <= keep:
+        return
+    others = [f for f in files if f != current]
+    keep  -= len(files) - len(others)    #Platz für die aktuelle Datei
+    others.sort(key=lambda f: os.path.getmtime(f) if os.path.exists(f) else 0, reverse=True)
+    for f in others[max(keep, 0):]:
+        try:
+            os.remove(f)
+        except OSError:    #gleichzeitig von einem anderen Worker gelöscht
+            pass
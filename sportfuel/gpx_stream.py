@@ -0,0 +1,107 @@
+#Streaming-Parser für GPX-Uploads: liest die Trackpunkte stückweise direkt aus dem Byte-Puffer, ohne den ganzen
+#Upload als String zu dekodieren oder einen gpxpy-Objektbaum aufzubauen. Koordinaten, Höhe und Zeit landen blockweise
+#in NumPy-Arrays; Dauer und 3D-Länge berechnet sportfuel.track.Track wie gpxpy (get_duration, length_3d).
+import io
+import xml.etree.ElementTree as ET
+import numpy as np
+import pandas as pd
+
+from sportfuel.track import Track
+
+BLOCK     = 65_536     #Trackpunkte pro Block, danach werden die Python-Listen in Arrays umgewandelt
+READ_SIZE = 1 << 20    #Bytes pro Lesevorgang aus dem Upload
+
+
+#Tag ohne Namespace ("{http://www.topografix.com/GPX/1/1}trkpt" -> "trkpt"), gecacht da sich die Tags wiederholen
+def _local(tag, _cache={}):
+    name = _cache.get(tag)
+    if name is None:
+        name = _cache[tag] = tag[tag.rfind("}") + 1:]
+    return name
+
+
+#Zeitstempel eines Blocks in Sekunden seit 1970 umwandeln (NaN, wenn der Punkt keine Zeit hat)
+def _to_seconds(times):
+    ts   = pd.to_datetime(pd.Series(times, dtype=object), utc=True, format="ISO8601", errors="coerce")
+    secs = ts.to_numpy(dtype="datetime64[ns]").astype(np.int64) / 1e9
+    secs[ts.isna().to_numpy()] = np.nan
+    return secs
+
+
+#Parser-Ziel für XMLParser: bekommt nur start/data/end-Ereignisse, es wird kein Element-Baum aufgebaut
+class _GpxTarget:
+    def __init__(self):
+        self.lat_b, self.lon_b, self.ele_b, self.time_b = [], [], [], []    #fertige Blöcke (Arrays)
+        self.lat, self.lon, self.ele, self.times = [], [], [], []          #aktueller Block (Listen)
+        self.seg_starts = []
+        self.n      = 0
+        self.in_seg = False
+        self.in_pt  = False
+        self.field  = None    #"ele" oder "time", solange deren Text gelesen wird
+        self.text   = []
+
+    def start(self, tag, attrib):
+        name = _local(tag)
+        if name == "trkpt" and self.in_seg:
+            self.in_pt = True
+            self.lat.append(float(attrib["lat"]))
+            self.lon.append(float(attrib["lon"]))
+            self.ele.append(np.nan)
+            self.times.append(None)
+        elif name == "trkseg":
+            self.in_seg = True
+            self.seg_starts.append(self.n + len(self.lat))
+        elif self.in_pt and name in ("ele", "time"):
+            self.field = name
+            self.text  = []
+
+    def data(self, text):
+        if self.field:
+            self.text.append(text)
+
+    def end(self, tag):
+        name = _local(tag)
+        if self.field and name == self.field:
+            text = "".join(self.text).strip()
+            if text:
+                if name == "ele":
+                    self.ele[-1] = float(text)
+                else:
+                    self.times[-1] = text
+            self.field = None
+        elif name == "trkpt" and self.in_pt:
+            self.in_pt = False
+            if len(self.lat) >= BLOCK:
+                self.flush()
+        elif name == "trkseg":
+            self.in_seg = False
+
+    def flush(self):
+        self.n += len(self.lat)
+        self.lat_b.append(np.asarray(self.lat, dtype=np.float64))
+        self.lon_b.append(np.asarray(self.lon, dtype=np.float64))
+        self.ele_b.append(np.asarray(self.ele, dtype=np.float64))
+        self.time_b.append(_to_seconds(self.times))
+        self.lat, self.lon, self.ele, self.times = [], [], [], []
+
+    def close(self):
+        self.flush()
+        return Track(np.concatenate(self.lat_b), np.concatenate(self.lon_b), np.concatenate(self.ele_b),
+                     np.concatenate(self.time_b), self.seg_starts)
+
+
+#Liest GPX aus Bytes oder einem Datei-Objekt (z.B. Streamlit UploadedFile) in Stücken von READ_SIZE Bytes;
+#ausgewertet werden nur <trk>/<trkseg>/<trkpt> wie bisher auf der Seite
+def parse_gpx(source):
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        source = io.BytesIO(source)
+    elif hasattr(source, "seek"):
+        source.seek(0)
+
+    parser = ET.XMLParser(target=_GpxTarget())
+    while True:
+        chunk = source.read(READ_SIZE)
+        if not chunk:
+            break
+        parser.feed(chunk)
+    return parser.close()
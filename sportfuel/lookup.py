@@ -0,0 +1,104 @@
+#Vorberechnete Kalorien-Tabelle: Modellvorhersagen auf einem dichten Raster (Aktivität x Gewicht x Dauer x Distanz).
+#Die Vor_Workout Seite interpoliert darin multilinear statt bei jedem Rerun die sklearn-Pipeline aufzurufen;
+#ausserhalb des Rasters liefert die Tabelle NaN und die Seite fällt auf model.predict zurück.
+#Vor dem Speichern (und auf der Seite nach dem Laden) wird jede Zelle gegen die Fall-Back-Formel geprüft, damit ein
+#entgleistes Modell keine negativen oder explodierenden Werte in die Tabelle schreibt.
+import itertools
+import numpy as np
+import pandas as pd
+
+from sportfuel.calories import ACTIVITY_MAP, FALLBACK_FAKTOREN
+
+#Rasterachsen (Start, Ende inkl., Schritt) passend zu den Slidern auf Home.py und der manuellen Eingabe
+LOOKUP_AXES = {
+    "Gewicht": (40, 150, 5),
+    "Dauer":   (15, 300, 5),
+    "Distanz": (0, 100, 1),
+}
+#Grösste erlaubte Abweichung (Faktor) einer Zelle von der Fall-Back-Formel; Schwimmen liegt laut Katalog schon ca. 3.4x darüber
+MAX_FORMULA_RATIO = 5.0
+
+
+def _axis(start, stop, step):
+    return np.arange(start, stop + step / 2, step, dtype=np.float64)
+
+
+#Berechnet die Tabelle mit dem trainierten Modell (ein predict pro Aktivität) und speichert sie als .npz
+def build_lookup(model, path, activities=None, axes=LOOKUP_AXES):
+    activities = list(ACTIVITY_MAP.values()) if activities is None else list(activities)
+    grids = [_axis(*axes[c]) for c in axes]
+    mesh  = [m.ravel() for m in np.meshgrid(*grids, indexing="ij")]
+    table = np.empty((len(activities),) + tuple(len(g) for g in grids), dtype=np.float32)
+    for i, act in enumerate(activities):
+        X = pd.DataFrame({"Activity": act, **dict(zip(axes, mesh))})
+        table[i] = np.asarray(model.predict(X)).reshape(table.shape[1:])
+    check_table(table, activities, grids, list(axes))
+    np.savez(path, activities=np.asarray(activities, dtype=str), columns=np.asarray(list(axes), dtype=str),
+             table=table, **{f"axis_{c}": g for c, g in zip(axes, grids)})
+
+
+#Jede Zelle muss endlich und nicht negativ sein und für die Sportarten aus ACTIVITY_MAP höchstens MAX_FORMULA_RATIO
+#von fallback_kcal entfernt liegen. Wirft ValueError mit der ersten auffälligen Zelle und der Anzahl betroffener Zellen.
+def check_table(table, activities, grids, columns, max_ratio=MAX_FORMULA_RATIO):
+    sportarten = {a: s for s, a in ACTIVITY_MAP.items()}
+    mesh   = dict(zip(columns, np.meshgrid(*grids, indexing="ij")))
+    stunden_kg = mesh["Gewicht"] * mesh["Dauer"] / 60
+    for i, act in enumerate(activities):
+        kcal = np.asarray(table[i], dtype=np.float64)
+        bad  = ~np.isfinite(kcal) | (kcal < 0)
+        if str(act) in sportarten:
+            formel = FALLBACK_FAKTOREN[sportarten[str(act)]] * stunden_kg
+            bad |= (kcal > formel * max_ratio) | (kcal < formel / max_ratio)
+        if bad.any():
+            idx   = np.unravel_index(np.argmax(bad), bad.shape)
+            where = ", ".join(f"{c}={g[j]:g}" for c, g, j in zip(columns, grids, idx))
+            raise ValueError(f"Kalorien-Tabelle unplausibel für {act} ({where}): {kcal[idx]:.0f} kcal "
+                             f"({int(bad.sum()):,} Zellen ausserhalb des Bereichs)")
+
+
+class CalorieLookup:
+    def __init__(self, activities, columns, axes, table):
+        self.activities = {str(a): i for i, a in enumerate(activities)}
+        self.columns    = [str(c) for c in columns]
+        self.axes       = axes
+        self.table      = table
+
+    #Multilineare Interpolation für viele Punkte auf einmal; NaN für unbekannte Aktivität oder Werte ausserhalb des Rasters
+    def predict_arrays(self, activity, *values):
+        values = [np.atleast_1d(np.asarray(v, dtype=np.float64)) for v in values]
+        n      = max(len(v) for v in values)
+        acts   = np.broadcast_to(np.asarray(activity, dtype=object), (n,))
+        a_idx  = np.fromiter((self.activities.get(a, -1) for a in acts), dtype=np.int64, count=n)
+        inside = a_idx >= 0
+        lower, frac = [], []
+        for ax, x in zip(self.axes, values):
+            x = np.broadcast_to(x, (n,))
+            i = np.clip(np.searchsorted(ax, x, side="right") - 1, 0, len(ax) - 2)
+            lower.append(i)
+            frac.append((x - ax[i]) / (ax[i + 1] - ax[i]))
+            inside &= (x >= ax[0]) & (x <= ax[-1])
+        a_idx = np.where(inside, a_idx, 0)
+        out = np.zeros(n, dtype=np.float64)
+        for corner in itertools.product((0, 1), repeat=len(self.axes)):    #2^3 Eckpunkte der Rasterzelle
+            w   = np.ones(n)
+            idx = [a_idx]
+            for c, i, t in zip(corner, lower, frac):
+                w = w * (t if c else 1.0 - t)
+                idx.append(i + c)
+            out += w * self.table[tuple(idx)]
+        out[~inside] = np.nan
+        return out
+
+    def check(self, max_ratio=MAX_FORMULA_RATIO):
+        check_table(self.table, list(self.activities), self.axes, self.columns, max_ratio)
+        return self
+
+    #Gleiche Schnittstelle wie model.predict(X) für DataFrames mit Activity + Rasterspalten
+    def predict(self, X):
+        return self.predict_arrays(np.asarray(X["Activity"], dtype=object), *(X[c] for c in self.columns))
+
+
+def load_lookup(path):
+    with np.load(path) as data:
+        columns = [str(c) for c in data["columns"]]
+        return CalorieLookup(data["activities"], columns, [data[f"axis_{c}"] for c in columns], data["table"])
@@ -0,0 +1,139 @@
+#Tagesplan aus dem Rezept-Pool (Meal Plan Seite): wählt je ein Rezept für Frühstück, Mittag- und Abendessen und die
+#Portionenzahl so, dass Kalorien, Kohlenhydrate und Protein des Tages möglichst genau getroffen werden und jede Mahlzeit
+#etwa ein Drittel der Kalorien liefert.
+#
+#Vorgehen (vektorisiert, ohne Solver):
+#  1. Jedes Rezept wird auf ~1/3 des Tagesbedarfs skaliert; Rezepte mit fast gleichem Beitrag (Zelle der Breite `cell`
+#     relativ zum Ziel) sind austauschbar, pro Zelle bleibt nur eines. So bleiben auch bei tausenden Rezepten nur einige
+#     hundert Kandidaten pro Mahlzeit.
+#  2. Alle Kombinationen dieser Kandidaten werden blockweise mit NumPy bewertet, die besten `refine` behalten.
+#  3. Für diese wird die Portionenzahl pro Mahlzeit per kleinster Quadrate optimiert und auf PORTION_STEP gerundet.
+import numpy as np
+
+MEALS         = ["Breakfast", "Lunch", "Dinner"]
+PORTION_MIN   = 0.5
+PORTION_MAX   = 3.0
+PORTION_STEP  = 0.25
+WEIGHTS       = np.array([1.0, 0.5, 0.5])    #Gewicht der relativen Abweichung bei kcal, Kohlenhydraten, Protein
+BALANCE       = 0.25                         #Gewicht für "jede Mahlzeit ~1/3 der Kalorien"
+MAX_CANDIDATES = 200                         #Kandidaten pro Mahlzeit nach Schritt 1
+PROTEIN_G_PER_KG = 1.6                       #Tagesziele für Ausdauersportler (g pro kg Körpergewicht)
+CARBS_G_PER_KG   = 5.0
+
+
+#Tagesziel in kcal, g Kohlenhydrate, g Protein; bereits gegessene Snacks werden abgezogen
+def day_targets(total_cal, gewicht, snack_carbs=0.0):
+    return np.array([float(total_cal), max(CARBS_G_PER_KG * gewicht - snack_carbs, 0.0), PROTEIN_G_PER_KG * gewicht])
+
+
+#Prüft die Diät-/Ernährungslabels, falls das Rezept welche mitliefert (die API-Suche filtert bereits danach)
+def _has_labels(r, diets, healths):
+    for field, wanted in (("dietLabels", diets), ("healthLabels", healths)):
+        labels = r.get(field)
+        if wanted and labels is not None:
+            have = {l.lower() for l in labels}
+            if not all(w.lower() in have for w in wanted):
+                return False
+    return True
+
+
+#Nährwerte pro Portion als (n, 3) Array [kcal, Kohlenhydrate g, Protein g] plus die gültigen Rezepte
+def nutrient_matrix(recipes, diets=(), healths=()):
+    rows, kept = [], []
+    for r in recipes:
+        if not _has_labels(r, diets, healths):
+            continue
+        y = r.get("yield", 1) or 1
+        nut = r.get("totalNutrients", {})
+        kcal = (r.get("calories", 0) or 0) / y
+        if kcal <= 0:
+            continue
+        rows.append((kcal, nut.get("CHOCDF", {}).get("quantity", 0) / y, nut.get("PROCNT", {}).get("quantity", 0) / y))
+        kept.append(r)
+    return np.array(rows, dtype=np.float64).reshape(-1, 3), kept
+
+
+#Kosten für Portionen x (..., 3) und Nährwerte pro Portion per_serv (..., 3 Mahlzeiten, 3 Nährwerte), relativ zum Ziel
+def plan_cost(x, per_serv, target):
+    contrib = x[..., :, None] * per_serv / target                       #Beitrag jeder Mahlzeit, relativ
+    dev = contrib.sum(axis=-2) - 1
+    share = contrib[..., 0] - 1 / 3
+    return (WEIGHTS * dev ** 2).sum(axis=-1) + BALANCE * (share ** 2).sum(axis=-1)
+
+
+#Schritt 1: Beitrag bei ~1/3 des Tagesbedarfs, dann ein Rezept pro Zelle; Zellbreite wächst, bis höchstens max_candidates übrig sind
+def _candidates(per_serv, target, max_candidates, cell=0.01):
+    x = np.clip(target[0] / 3 / per_serv[:, 0], PORTION_MIN, PORTION_MAX)
+    rel = x[:, None] * per_serv / target
+    while True:
+        c = np.floor(rel / cell).astype(np.int64) + (1 << 19)          #Zellkoordinaten, zu einem Schlüssel zusammengefasst
+        _, first = np.unique((c[:, 0] << 40) | (c[:, 1] << 20) | c[:, 2], return_index=True)
+        if len(first) <= max_candidates:
+            return np.sort(first), rel[np.sort(first)]
+        cell *= 1.5
+
+
+#Schritt 3: Portionen per gewichteter kleinster Quadrate (3 Unbekannte), auf das Raster gerundet (alle 8 Rundungen geprüft)
+def _refine(per_serv, target):
+    k = len(per_serv)
+    a = per_serv / target                                                #(k, Mahlzeit, Nährwert)
+    w = np.sqrt(WEIGHTS)
+    A = np.concatenate([np.swapaxes(a * w, 1, 2),                        #(k, 3 Nährwerte, 3 Mahlzeiten)
+                        np.sqrt(BALANCE) * a[:, :, 0][:, None, :] * np.eye(3)], axis=1)
+    b = np.concatenate([w, np.full(3, np.sqrt(BALANCE) / 3)])
+    AtA = np.swapaxes(A, 1, 2) @ A
+    Atb = np.swapaxes(A, 1, 2) @ b
+    x = np.clip(np.linalg.solve(AtA + 1e-12 * np.eye(3), Atb[..., None])[..., 0], PORTION_MIN, PORTION_MAX)
+    lo = np.floor(x / PORTION_STEP) * PORTION_STEP
+    corners = np.array([[(c >> m) & 1 for m in range(3)] for c in range(8)])    #(8, 3)
+    xs = np.clip(lo[:, None, :] + corners * PORTION_STEP, PORTION_MIN, PORTION_MAX)
+    cost = plan_cost(xs, per_serv[:, None], target)
+    best = cost.argmin(axis=1)
+    return xs[np.arange(k), best], cost[np.arange(k), best]
+
+
+#Bester Tagesplan aus pools = {mealType: [Rezepte]}. Gibt {"meals": [(mealType, Rezept, Portionen)], "totals",
+#"target", "cost"} zurück oder None, wenn für eine Mahlzeit kein passendes Rezept da ist.
+def optimize_day(pools, target, diets=(), healths=(), meals=MEALS, max_candidates=MAX_CANDIDATES, refine=64, block=2_000_000):
+    target = np.asarray(target, dtype=np.float64)
+    target = np.where(target > 0, target, 1.0)
+    mats, recs, rel = [], [], []
+    for m in meals:
+        mat, kept = nutrient_matrix(pools.get(m, []), diets, healths)
+        if not len(kept):
+            return None
+        idx, r = _candidates(mat, target, max_candidates)
+        mats.append(mat[idx]); recs.append([kept[i] for i in idx]); rel.append(r)
+
+    #Schritt 2: alle Kombinationen bewerten (Frühstück x Mittag als Paare, Abendessen blockweise). Die quadratische
+    #Abweichung zerfällt in Paar-Term + Abendessen-Term + gemischten Term; letzterer ist ein Matrixprodukt (BLAS).
+    pair = (rel[0][:, None, :] + rel[1][None, :, :]).reshape(-1, 3) - 1
+    pair_cost = (WEIGHTS * pair ** 2).sum(axis=1) + BALANCE * ((rel[0][:, None, 0] - 1 / 3) ** 2
+                                                              + (rel[1][None, :, 0] - 1 / 3) ** 2).ravel()
+    din = rel[2]
+    din_cost = (WEIGHTS * din ** 2).sum(axis=1) + BALANCE * (din[:, 0] - 1 / 3) ** 2
+    cross = 2 * (pair * WEIGHTS)
+    step = max(1, block // len(pair))
+    best_cost, best_idx = np.empty(0), np.empty(0, dtype=np.int64)
+    for s in range(0, len(din), step):
+        cost = pair_cost[:, None] + din_cost[None, s:s + step] + cross @ din[s:s + step].T
+        flat = cost.ravel()
+        top = np.argpartition(flat, min(refine, len(flat) - 1))[:refine]
+        pi, di = np.divmod(top, cost.shape[1])
+        best_cost = np.concatenate([best_cost, flat[top]])
+        best_idx = np.concatenate([best_idx, pi * len(din) + s + di])
+        keep = np.argsort(best_cost)[:refine]
+        best_cost, best_idx = best_cost[keep], best_idx[keep]
+
+    pi, di = np.divmod(best_idx, len(rel[2]))
+    bi, li = np.divmod(pi, len(rel[1]))
+    per_serv = np.stack([mats[0][bi], mats[1][li], mats[2][di]], axis=1)    #(refine, 3 Mahlzeiten, 3 Nährwerte)
+    x, cost = _refine(per_serv, target)
+    j = int(cost.argmin())
+    choice = (bi[j], li[j], di[j])
+    return {
+        "meals":  [(m, recs[i][choice[i]], float(x[j, i])) for i, m in enumerate(meals)],
+        "totals": (x[j][:, None] * per_serv[j]).sum(axis=0),
+        "target": target,
+        "cost":   float(cost[j]),
+    }
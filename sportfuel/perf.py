@@ -0,0 +1,194 @@
+#Zeitmessung pro Rerun für die Streamlit-Seiten: jede Seite startet mit start_rerun("<Seite>") und misst ihre Abschnitte
+#mit `with perf.stage("model_predict"):`. Pro Abschnitt werden Wandzeit, Cache-Treffer/-Fehlschlag und Nutzlastgrössen
+#festgehalten; am Ende schreibt finish() die Werte in ein Debug-Panel in der Sidebar, als JSON-Zeile und als Textdatei
+#im Prometheus-Format (pro Prozess eine Datei, z.B. für den textfile-Collector des node_exporters).
+#Eingeschaltet wird über die Umgebungsvariable SPORTFUEL_PERF ("1" = alles, sonst z.B. "sidebar,jsonl" oder "prom").
+#Ausgeschaltet liefert stage() sofort ein geteiltes Leer-Objekt zurück (ein Funktionsaufruf pro Abschnitt).
+#Cache-Treffer: gecachte Funktionen rufen in ihrem Rumpf mark_miss() auf. Läuft der Rumpf nicht, war es ein Treffer.
+import json
+import os
+import threading
+import time
+
+ALL_OUTPUTS = ("sidebar", "jsonl", "prom")
+_env        = os.getenv("SPORTFUEL_PERF", "").strip().lower()
+OUTPUTS     = ALL_OUTPUTS if _env in ("1", "true", "all") else tuple(o for o in _env.split(",") if o in ALL_OUTPUTS)
+PERF_DIR    = os.getenv("SPORTFUEL_PERF_DIR", os.path.join(".cache", "perf"))
+
+_local  = threading.local()    #Streamlit führt jede Session in einem eigenen Thread aus
+_lock   = threading.Lock()
+_totals = {}                   #(Seite, Abschnitt) -> [Anzahl, Sekunden, Treffer, Fehlschläge, Bytes], für die Prometheus-Datei
+
+
+class Stage:
+    __slots__ = ("name", "cached", "miss", "info", "seconds", "_rerun", "_t0")
+
+    def __init__(self, rerun, name, cached, info):
+        self.name    = name
+        self.cached  = cached
+        self.miss    = False
+        self.info    = info
+        self.seconds = 0.0
+        self._rerun  = rerun
+
+    def __enter__(self):
+        self._rerun._open.append(self)
+        self._t0 = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.seconds = time.perf_counter() - self._t0
+        self._rerun._open.pop()
+        self._rerun.stages.append(self)
+        return False
+
+    #Zusätzliche Werte, z.B. set(bytes=len(buf), points=n); "bytes" fliesst in die Prometheus-Summe ein
+    def set(self, **info):
+        self.info.update(info)
+
+    def record(self):
+        out = {"stage": self.name, "ms": round(self.seconds * 1e3, 3)}
+        if self.cached:
+            out["cache"] = "miss" if self.miss else "hit"
+        out.update(self.info)
+        return out
+
+
+class _NullStage:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def set(self, **info):
+        pass
+
+
+NULL_STAGE = _NullStage()
+
+
+class Rerun:
+    def __init__(self, page, outputs=OUTPUTS, out_dir=PERF_DIR):
+        self.page    = page
+        self.outputs = outputs
+        self.out_dir = out_dir
+        self.stages  = []
+        self._open   = []
+        self._t0     = time.perf_counter()
+        self.started = time.time()
+
+    def stage(self, name, cached=False, **info):
+        return Stage(self, name, cached, info)
+
+    def record(self):
+        return {"ts": round(self.started, 3), "page": self.page, "pid": os.getpid(),
+                "total_ms": round((time.perf_counter() - self._t0) * 1e3, 3),
+                "stages": [s.record() for s in self.stages]}
+
+    def finish(self):
+        rec = self.record()
+        with _lock:
+            for s in self.stages:
+                t = _totals.setdefault((self.page, s.name), [0, 0.0, 0, 0, 0])
+                t[0] += 1
+                t[1] += s.seconds
+                if s.cached:
+                    t[3 if s.miss else 2] += 1
+                t[4] += int(s.info.get("bytes", 0) or 0)
+        if "jsonl" in self.outputs or "prom" in self.outputs:
+            os.makedirs(self.out_dir, exist_ok=True)
+        if "jsonl" in self.outputs:
+            with open(os.path.join(self.out_dir, "reruns.jsonl"), "a", encoding="utf-8") as f:
+                f.write(json.dumps(rec) + "\n")
+        if "prom" in self.outputs:
+            write_prometheus(os.path.join(self.out_dir, f"sportfuel_{os.getpid()}.prom"))
+        if "sidebar" in self.outputs:
+            render_sidebar(rec)
+        return rec
+
+
+class _NullRerun:
+    def stage(self, name, cached=False, **info):
+        return NULL_STAGE
+
+    def finish(self):
+        return None
+
+
+NULL_RERUN = _NullRerun()
+
+
+def enabled():
+    return bool(OUTPUTS)
+
+
+#Beginnt die Messung eines Reruns im aktuellen Thread (Session); ohne SPORTFUEL_PERF ein Leer-Objekt
+def start_rerun(page):
+    rerun = Rerun(page) if OUTPUTS else NULL_RERUN
+    _local.rerun = rerun
+    return rerun
+
+
+def stage(name, cached=False, **info):
+    if not OUTPUTS:
+        return NULL_STAGE
+    rerun = getattr(_local, "rerun", None)
+    return NULL_STAGE if rerun is None else rerun.stage(name, cached, **info)
+
+
+#Im Rumpf gecachter Funktionen aufrufen: markiert den innersten offenen Abschnitt als Cache-Fehlschlag
+def mark_miss():
+    if not OUTPUTS:
+        return
+    rerun = getattr(_local, "rerun", None)
+    if rerun is not None and rerun is not NULL_RERUN and rerun._open:
+        rerun._open[-1].miss = True
+
+
+def finish():
+    rerun = getattr(_local, "rerun", None)
+    _local.rerun = None
+    return rerun.finish() if rerun is not None else None
+
+
+#Summen über alle Reruns dieses Prozesses im Prometheus-Textformat; erst vollständig schreiben, dann umbenennen
+def write_prometheus(path):
+    with _lock:
+        items = sorted(_totals.items())
+    lines = [
+        "# HELP sportfuel_stage_seconds Wandzeit der Abschnitte pro Rerun",
+        "# TYPE sportfuel_stage_seconds summary",
+    ]
+    pid = os.getpid()
+    for (page, name), (n, sec, _, _, _) in items:
+        labels = f'page="{page}",stage="{name}",pid="{pid}"'
+        lines.append(f"sportfuel_stage_seconds_sum{{{labels}}} {sec:.6f}")
+        lines.append(f"sportfuel_stage_seconds_count{{{labels}}} {n}")
+    lines += ["# HELP sportfuel_cache_total Cache-Treffer und -Fehlschläge pro Abschnitt", "# TYPE sportfuel_cache_total counter"]
+    for (page, name), (_, _, hits, misses, _) in items:
+        if hits or misses:
+            labels = f'page="{page}",stage="{name}",pid="{pid}"'
+            lines.append(f'sportfuel_cache_total{{{labels},result="hit"}} {hits}')
+            lines.append(f'sportfuel_cache_total{{{labels},result="miss"}} {misses}')
+    lines += ["# HELP sportfuel_payload_bytes_total Nutzlast pro Abschnitt (Uploads, Bilder, API-Antworten)",
+              "# TYPE sportfuel_payload_bytes_total counter"]
+    for (page, name), (_, _, _, _, nbytes) in items:
+        if nbytes:
+            lines.append(f'sportfuel_payload_bytes_total{{page="{page}",stage="{name}",pid="{pid}"}} {nbytes}')
+    tmp = f"{path}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+    os.replace(tmp, path)
+
+
+#Debug-Panel in der Sidebar: Abschnitte des aktuellen Reruns mit Zeit, Cache-Status und Zusatzwerten
+def render_sidebar(rec):
+    import streamlit as st
+    with st.sidebar.expander(f"⏱️ Rerun {rec['total_ms']:.0f} ms", expanded=False):
+        if rec["stages"]:
+            st.dataframe(rec["stages"], hide_index=True, use_container_width=True)
+        else:
+            st.caption("Keine Abschnitte gemessen.")
@@ -0,0 +1,64 @@
+#Leichtes Kalorien-Modell: pro Aktivität ein Polynom in (Gewicht, Dauer, Distanz), nur mit NumPy.
+#Die Trainingsdaten folgen kcal = Dauer * Gewicht * kcal_pro_kg / 60 * Faktor, ein Polynom 2. Grades (enthält Gewicht*Dauer)
+#trifft das pro Aktivität fast exakt; die Vorhersage ist ein Skalarprodukt statt eines Abstiegs durch hunderte Bäume.
+import itertools
+import numpy as np
+
+NUMERIC = ["Gewicht", "Dauer", "Distanz"]
+
+
+#Exponenten aller Monome bis zum gegebenen Grad, z.B. Grad 2 -> 1, G, D, s, G², G·D, ... (Zeilen x Spalten)
+def monomial_powers(degree, n_features=len(NUMERIC)):
+    rows = []
+    for d in range(degree + 1):
+        for combo in itertools.combinations_with_replacement(range(n_features), d):
+            rows.append(np.bincount(combo, minlength=n_features))
+    return np.asarray(rows, dtype=np.int64)
+
+
+#Gleiche Schnittstelle wie die sklearn-Pipeline (fit/predict auf dem DataFrame mit Activity + NUMERIC).
+#Unbekannte Aktivitäten ergeben einen ValueError (der Aufrufer fällt dann auf die Formel zurück), statt ein Polynom über
+#alle Aktivitäten zu verwenden; ausserhalb des Trainingsrasters kann ein Polynom negativ werden, daher wird bei 0 gekappt.
+class ActivityPolyRegressor:
+    def __init__(self, degree=2, categories=None, coef=None, powers=None):
+        self.degree     = degree
+        self.categories = [] if categories is None else [str(c) for c in categories]
+        self.coef       = coef      #Aktivitäten x Monome
+        self.powers     = monomial_powers(degree) if powers is None else np.asarray(powers)
+        self._codes     = {c: i for i, c in enumerate(self.categories)}
+
+    def _terms(self, X):
+        num = np.column_stack([np.asarray(X[c], dtype=np.float64) for c in NUMERIC])
+        return np.prod(num[:, None, :] ** self.powers[None, :, :], axis=2)
+
+    def fit(self, X, y):
+        cats, codes = np.unique(np.asarray(X["Activity"]).astype(str), return_inverse=True)
+        terms = self._terms(X)
+        y     = np.asarray(y, dtype=np.float64)
+        coef  = np.empty((len(cats), len(self.powers)))
+        order = np.argsort(codes, kind="stable")    #Zeilen nach Aktivität gruppieren, ein lstsq pro Gruppe
+        bounds = np.searchsorted(codes[order], np.arange(len(cats) + 1))
+        for i in range(len(cats)):
+            rows = order[bounds[i]:bounds[i + 1]]
+            coef[i] = np.linalg.lstsq(terms[rows], y[rows], rcond=None)[0]
+        self.categories = [str(c) for c in cats]
+        self._codes     = {c: i for i, c in enumerate(self.categories)}
+        self.coef       = coef
+        return self
+
+    def predict(self, X):
+        acts  = [str(a) for a in X["Activity"]]
+        unknown = sorted(set(acts) - self._codes.keys())
+        if unknown:
+            raise ValueError(f"Unbekannte Aktivität(en): {', '.join(unknown)}")
+        codes = np.fromiter((self._codes[a] for a in acts), dtype=np.int64, count=len(acts))
+        return np.maximum(np.einsum("nt,nt->n", self._terms(X), self.coef[codes]), 0.0)
+
+    def save(self, path):
+        np.savez(path, kind="poly", degree=np.int32(self.degree), categories=np.asarray(self.categories, dtype=str),
+                 coef=self.coef, powers=self.powers, numeric=np.asarray(NUMERIC, dtype=str))
+
+
+def load_poly(path):
+    with np.load(path) as data:
+        return ActivityPolyRegressor(int(data["degree"]), data["categories"], data["coef"], data["powers"])
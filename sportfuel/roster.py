@@ -0,0 +1,122 @@
+#Kader statt Einzelperson: Grundumsatz (Harris-Benedict) und Flüssigkeitsbedarf für ganze Teams aus CSV oder Parquet,
+#vektorisiert über alle Zeilen. Home.py lädt den Kader einmal pro Datei und legt die Tabelle in den Session-State;
+#Vor_Workout und Meal Plan wählen daraus per select_athlete() einen Athleten, ohne etwas neu zu berechnen.
+#Aufruf: python -m sportfuel.roster team.csv -o team_grundumsatz.csv
+import argparse
+import io
+import sys
+import time
+import numpy as np
+import pandas as pd
+
+from sportfuel.calories import fluessigkeit, grundumsatz
+
+INPUT_COLS = ["gewicht", "groesse", "alter", "geschlecht"]
+ALIASES    = {"weight": "gewicht", "height": "groesse", "grösse": "groesse", "größe": "groesse", "age": "alter",
+              "sex": "geschlecht", "gender": "geschlecht", "name": "athlet"}
+MALE       = {"m", "männlich", "maennlich", "male", "mann"}
+FEMALE     = {"w", "f", "weiblich", "female", "frau"}
+
+
+#Harris-Benedict (sportfuel.calories) für ganze Arrays, Formel je nach Geschlecht
+def grundumsatz_array(gewicht, groesse, alter, maennlich):
+    return np.where(maennlich, grundumsatz(gewicht, groesse, alter, "Männlich"), grundumsatz(gewicht, groesse, alter, "Weiblich"))
+
+
+#Liest CSV oder Parquet (Pfad oder Datei-Objekt, z.B. ein Streamlit-Upload); Format nach Dateiendung
+def read_roster(source, filename=None):
+    filename = filename or getattr(source, "name", None) or str(source)
+    if filename.lower().endswith((".parquet", ".pq")):
+        return pd.read_parquet(source)
+    return pd.read_csv(source)
+
+
+#Rohtabelle -> (Kader, verworfene Zeilen). Kader: athlet, gewicht, groesse, alter, geschlecht, grundumsatz, fluessigkeit.
+#Zeilen mit fehlenden/ungültigen Zahlen oder unbekanntem Geschlecht werden mit Zeilennummer (ab 1) zurückgegeben.
+def compute_roster(df):
+    df = df.rename(columns=lambda c: ALIASES.get(str(c).strip().lower(), str(c).strip().lower()))
+    missing = [c for c in INPUT_COLS if c not in df.columns]
+    if missing:
+        raise ValueError(f"Fehlende Spalten: {', '.join(missing)}")
+
+    gewicht = pd.to_numeric(df["gewicht"], errors="coerce").to_numpy(dtype=np.float64)
+    groesse = pd.to_numeric(df["groesse"], errors="coerce").to_numpy(dtype=np.float64)
+    alter   = pd.to_numeric(df["alter"],   errors="coerce").to_numpy(dtype=np.float64)
+    sex     = df["geschlecht"].astype(str).str.strip().str.lower()
+    male, female = sex.isin(MALE).to_numpy(), sex.isin(FEMALE).to_numpy()
+    ok = (male | female) & (gewicht > 0) & (groesse > 0) & (alter > 0)    #NaN-Vergleiche sind False
+
+    names = df["athlet"].astype(str).to_numpy() if "athlet" in df.columns else \
+        np.char.add("Athlet ", (np.arange(len(df)) + 1).astype(str))
+    roster = pd.DataFrame({
+        "athlet":      names[ok],
+        "gewicht":     gewicht[ok],
+        "groesse":     groesse[ok],
+        "alter":       alter[ok],
+        "geschlecht":  np.where(male[ok], "Männlich", "Weiblich"),
+        "grundumsatz": grundumsatz_array(gewicht[ok], groesse[ok], alter[ok], male[ok]),
+        "fluessigkeit": fluessigkeit(gewicht[ok]),
+    })
+    rejected = df[~ok].copy()
+    rejected.insert(0, "zeile", np.flatnonzero(~ok) + 1)
+    return roster, rejected.reset_index(drop=True)
+
+
+#Kader als CSV- oder Parquet-Bytes für den Download; beides über pyarrow (DataFrame.to_csv braucht für 100k Zeilen ~1 s)
+def export_roster(roster, fmt="csv"):
+    import pyarrow as pa
+    table = pa.Table.from_pandas(roster, preserve_index=False)
+    buf = io.BytesIO()
+    if fmt == "parquet":
+        import pyarrow.parquet as pq
+        pq.write_table(table, buf)
+    else:
+        import pyarrow.csv as pcsv
+        pcsv.write_csv(table, buf)
+    return buf.getvalue()
+
+
+#Werte eines Athleten (Zeile i) mit denselben Namen wie im Session-State von Home.py
+def athlete_values(roster, i):
+    row = roster.iloc[i]
+    return {"athlet": row["athlet"], "gewicht": float(row["gewicht"]), "groesse": float(row["groesse"]),
+            "alter": float(row["alter"]), "geschlecht": row["geschlecht"],
+            "grundumsatz": float(row["grundumsatz"]), "fluessigkeit": float(row["fluessigkeit"])}
+
+
+#Sidebar-Auswahl für Vor_Workout und Meal Plan: Athlet aus dem Kader (Session-State "roster", von Home.py) oder die
+#eigene Eingabe von Home. Die Wahl bleibt über die Seiten hinweg erhalten; gibt die Werte des Athleten oder None zurück.
+def select_athlete():
+    import streamlit as st
+    roster = st.session_state.get("roster")
+    if roster is None or not len(roster):
+        return None
+    options = [None] + list(range(len(roster)))
+    current = st.session_state.get("athlet_idx")
+    index   = current + 1 if current is not None and current < len(roster) else 0
+    names   = roster["athlet"].to_numpy()
+    choice  = st.sidebar.selectbox("Athlet aus dem Kader", options, index=index,
+                                   format_func=lambda i: "Eigene Eingabe (Home)" if i is None else names[i])
+    st.session_state.athlet_idx = choice
+    return None if choice is None else athlete_values(roster, choice)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grundumsatz und Flüssigkeitsbedarf für einen ganzen Kader (CSV/Parquet)")
+    parser.add_argument("input", help="CSV oder Parquet mit den Spalten gewicht, groesse, alter, geschlecht (optional athlet)")
+    parser.add_argument("-o", "--output", required=True, help="Ziel-Datei (.csv oder .parquet)")
+    args = parser.parse_args(argv)
+
+    t0 = time.perf_counter()
+    roster, rejected = compute_roster(read_roster(args.input))
+    fmt = "parquet" if args.output.lower().endswith((".parquet", ".pq")) else "csv"
+    with open(args.output, "wb") as f:
+        f.write(export_roster(roster, fmt))
+    dt = time.perf_counter() - t0
+    for _, row in rejected.head(20).iterrows():
+        print(f"⚠️ Zeile {row['zeile']} verworfen: {row.drop('zeile').to_dict()}", file=sys.stderr)
+    print(f"{len(roster):,} Athleten in {dt:.2f} s berechnet, {len(rejected):,} Zeilen verworfen -> {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+#Vereinfachung von Routen für die Folium-Karte (Douglas-Peucker, vektorisiert). Statt jeden Trackpunkt an den Browser
+#zu schicken, bleiben nur die Punkte, die mehr als `tolerance_m` Meter von der vereinfachten Linie abweichen.
+import numpy as np
+
+from sportfuel.track import EARTH_RADIUS
+
+
+#Lokale Projektion in Meter (equirektangulär um die Routenmitte), genau genug für Toleranzen von einigen Metern
+def to_meters(coords):
+    coords = np.asarray(coords, dtype=np.float64)
+    lat0 = np.radians(coords[:, 0].mean())
+    y = np.radians(coords[:, 0]) * EARTH_RADIUS
+    x = np.radians(coords[:, 1]) * EARTH_RADIUS * np.cos(lat0)
+    return x, y
+
+
+#Douglas-Peucker ebenenweise: pro Durchgang werden alle offenen Teilstücke gleichzeitig geprüft und in jedem Teilstück
+#der am weitesten entfernte Punkt ergänzt. Ergebnis ist pro Punkt die Toleranz, bis zu der er behalten wird
+#(inf für Anfang/Ende, -1 für Punkte unterhalb von min_tolerance_m). Daraus ergibt sich jede Toleranz oder jedes Punktbudget.
+def dp_importance(coords, min_tolerance_m=0.5):
+    n = len(coords)
+    imp = np.full(n, -1.0)
+    imp[[0, n - 1]] = np.inf
+    if n <= 2:
+        return imp
+    x, y = to_meters(coords)
+    idx = np.arange(n)
+    while True:
+        kept  = np.flatnonzero(imp >= 0)
+        seg   = np.minimum(np.searchsorted(kept, idx, side="right") - 1, len(kept) - 2)    #Teilstück jedes Punktes
+        a, b  = kept[seg], kept[seg + 1]
+        dx, dy = x[b] - x[a], y[b] - y[a]
+        px, py = x - x[a], y - y[a]
+        len2  = dx * dx + dy * dy
+        t     = np.clip(np.divide(px * dx + py * dy, len2, out=np.zeros(n), where=len2 > 0), 0, 1)
+        dist  = np.hypot(px - t * dx, py - t * dy)    #Abstand zum Teilstück (nicht zur unendlichen Geraden)
+        dist[kept] = 0
+        seg_max = np.maximum.reduceat(dist, kept[:-1])
+        split = seg_max > min_tolerance_m
+        if not split.any():
+            return imp
+        #erster Punkt mit maximalem Abstand in jedem zu teilenden Teilstück; seine Toleranz ist höchstens die des Teilstücks
+        cand = np.flatnonzero(split[seg] & (dist == seg_max[seg]))
+        _, first = np.unique(seg[cand], return_index=True)
+        p = cand[first]
+        imp[p] = np.minimum(seg_max[seg[p]], np.minimum(imp[a[p]], imp[b[p]]))
+
+
+#Indizes der Punkte, die Douglas-Peucker mit `tolerance_m` Metern behält (erster und letzter immer dabei)
+def douglas_peucker(coords, tolerance_m):
+    return np.flatnonzero(dp_importance(coords, tolerance_m) >= 0)
+
+
+#Höchstens `max_points` Punkte: die wichtigsten Punkte aus einem einzigen Douglas-Peucker-Durchlauf
+def simplify_to_budget(coords, max_points, tolerance_m=0.5):
+    imp = dp_importance(coords, tolerance_m)
+    kept = np.flatnonzero(imp >= 0)
+    if len(kept) <= max_points:
+        return kept
+    top = kept[np.argsort(-imp[kept], kind="stable")[:max(max_points, 2)]]
+    return np.sort(top)
+
+
+#Geometrie für die Karte: vereinfachte (n, 2) Koordinaten
+def simplify_route(coords, tolerance_m=5.0, max_points=None):
+    coords = np.asarray(coords, dtype=np.float64)
+    kept = douglas_peucker(coords, tolerance_m) if max_points is None else simplify_to_budget(coords, max_points, tolerance_m)
+    return coords[kept]
@@ -0,0 +1,92 @@
+#Gemeinsame Track-Struktur für GPX- und FIT-Uploads: Punkt-Arrays, Dauer und 3D-Länge wie gpxpy sowie ein
+#kumulativer Zeit- und Distanzindex, über den die Intake-Marker per np.searchsorted auf der Route platziert werden.
+import numpy as np
+
+EARTH_RADIUS = 6378.137 * 1000             #Meter (gleiche Konstanten wie gpxpy.geo)
+ONE_DEGREE   = EARTH_RADIUS * np.pi / 180  #Meter pro Breitengrad
+
+
+#Abstand aufeinanderfolgender Punkte wie gpxpy.geo.distance: Näherung für nahe Punkte (mit Höhe), Haversine für weit entfernte
+def point_distances(lat, lon, ele):
+    lat1, lat2 = lat[:-1], lat[1:]
+    lon1, lon2 = lon[:-1], lon[1:]
+    x  = lat2 - lat1
+    y  = (lon2 - lon1) * np.cos(np.radians(lat2))
+    d2 = np.sqrt(x * x + y * y) * ONE_DEGREE
+    de = ele[1:] - ele[:-1]
+    d  = np.where(np.isnan(de) | (de == 0), d2, np.sqrt(d2 ** 2 + np.nan_to_num(de) ** 2))
+    far = (np.abs(x) > .2) | (np.abs(lon2 - lon1) > .2)
+    if far.any():
+        p1, p2 = np.radians(lat2[far]), np.radians(lat1[far])
+        a = np.sin((p1 - p2) / 2) ** 2 + np.sin(np.radians(lon2[far] - lon1[far]) / 2) ** 2 * np.cos(p1) * np.cos(p2)
+        d[far] = 2 * EARTH_RADIUS * np.arcsin(np.sqrt(a))
+    return d
+
+
+#Ergebnis des Parsers: Punkt-Arrays plus die Kennzahlen, die die Vor_Workout Seite braucht
+class Track:
+    def __init__(self, lat, lon, ele, time, seg_starts):
+        self.coords     = np.column_stack([lat, lon])    #(n, 2) Breite/Länge für die Karte
+        self.ele        = ele                            #Höhe in m (NaN = fehlt)
+        self.time       = time                           #Sekunden seit 1970 (NaN = fehlt)
+        self.seg_starts = np.asarray(seg_starts, dtype=np.int64)
+
+        #Schrittweiten innerhalb der Segmente; Sprünge zwischen Segmenten zählen nicht
+        step = point_distances(lat, lon, ele) if len(lat) > 1 else np.zeros(0)
+        same_seg = np.ones(len(step), dtype=bool)
+        inner = self.seg_starts[(self.seg_starts > 0) & (self.seg_starts < len(lat))]
+        same_seg[inner - 1] = False
+        self.step_dist = np.where(same_seg, step, 0.0)
+        self.length_3d = float(self.step_dist.sum())       #Meter, wie gpx.length_3d()
+        self.duration  = self._duration()                   #Sekunden, wie gpx.get_duration() (None = keine Zeitdaten)
+
+        #Index für die Marker: kumulative Distanz (m) und verstrichene Zeit (s) seit dem ersten Punkt, beide aufsteigend
+        self.cum_dist = np.concatenate([[0.0], np.cumsum(self.step_dist)])
+        self.elapsed  = self._elapsed()
+
+    def __len__(self):
+        return len(self.coords)
+
+    #Pro Segment letzter minus erster Zeitstempel (gpxpy weicht bei fehlender Zeit auf den zweiten/vorletzten Punkt aus)
+    def _duration(self):
+        bounds = list(self.seg_starts) + [len(self.time)]
+        total = 0.0
+        for s, e in zip(bounds[:-1], bounds[1:]):
+            if e - s < 2:
+                continue
+            first = self.time[s] if not np.isnan(self.time[s]) else self.time[s + 1]
+            last  = self.time[e - 1] if not np.isnan(self.time[e - 1]) else self.time[e - 2]
+            if np.isnan(first) or np.isnan(last) or last < first:
+                return None
+            total += last - first
+        return total
+
+    #Verstrichene Zeit pro Punkt; fehlende Zeitstempel werden über den Index interpoliert. Ohne Zeitdaten wird
+    #eine gleichmässige Aufzeichnung über `duration` angenommen (wie die bisherige Platzierung).
+    def _elapsed(self):
+        n = len(self.time)
+        valid = np.flatnonzero(~np.isnan(self.time))
+        if len(valid) < 2:
+            return np.linspace(0.0, self.duration or 0.0, n)
+        t = np.interp(np.arange(n), valid, self.time[valid])
+        return np.maximum.accumulate(t - t[0])    #rückwärts springende Zeitstempel nicht zurücklaufen lassen
+
+    #Position (Breite, Länge) an beliebigen Werten einer aufsteigenden Achse (elapsed oder cum_dist), linear zwischen den Punkten
+    def _positions(self, axis, targets):
+        targets = np.clip(np.asarray(targets, dtype=np.float64), axis[0], axis[-1])
+        i = np.clip(np.searchsorted(axis, targets, side="right") - 1, 0, len(axis) - 2)
+        span = axis[i + 1] - axis[i]
+        frac = np.divide(targets - axis[i], span, out=np.zeros(len(targets)), where=span > 0)[:, None]
+        return self.coords[i] * (1 - frac) + self.coords[i + 1] * frac
+
+    #Marker-Positionen für Minuten seit Start: nach echter Zeit oder, bei by="distance", nach dem Anteil an der
+    #Gesamtdistanz bei gleichmässigem Tempo über `dauer_min`
+    def positions_at(self, minutes, by="time", dauer_min=None):
+        minutes = np.asarray(minutes, dtype=np.float64)
+        if len(self.coords) < 2:
+            return np.repeat(self.coords[:1], len(minutes), axis=0)
+        if by == "distance":
+            total_min = dauer_min or (self.elapsed[-1] / 60) or 1.0
+            return self._positions(self.cum_dist, minutes / total_min * self.cum_dist[-1])
+        return self._positions(self.elapsed, minutes * 60)
+
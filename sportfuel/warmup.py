@@ -0,0 +1,75 @@
+#Vorwärmen im Hintergrund: die Seiten importieren Karten- und Diagramm-Bibliotheken (folium, altair, matplotlib) erst dort,
+#wo sie gebraucht werden. Damit der erste Upload bzw. das erste Diagramm trotzdem nicht auf den Import wartet, lädt ein
+#Daemon-Thread diese Module und die Modell-Dateien einmal pro Prozess, nachdem die erste Seite gezeichnet ist.
+#Importiert die Seite ein Modul, das der Thread gerade lädt, wartet sie auf dessen Import (Python-Importsperre),
+#es wird also nichts doppelt geladen. Ausschalten mit SPORTFUEL_WARMUP=0.
+import importlib
+import os
+import threading
+import time
+
+from sportfuel.calories import COMPACT_PATH, LOOKUP_PATH
+
+ENABLED = os.getenv("SPORTFUEL_WARMUP", "1").strip().lower() not in ("0", "false", "no")
+DELAY_S = 0.5    #erst nach dem Rest des ersten Reruns beginnen, die Imports halten sonst das GIL gegen die Seite
+MODULES = (
+    "sportfuel.compact", "sportfuel.lookup",                  #Kalorienmodell (Vor_Workout)
+    "folium", "streamlit_folium",                             #Karte (Vor_Workout, nur mit Track)
+    "altair",                                                 #Fueling-Chart (Vor_Workout, nur mit Warenkorb)
+    "sportfuel.fdc",                                          #USDA-Client mit requests (Snack-Suche)
+    "matplotlib.pyplot", "sportfuel.charts",                  #Makro-Diagramme (Meal Plan)
+)
+
+TIMINGS  = {}                   #Modul bzw. Aufgabe -> Sekunden, für Benchmarks und Debugging
+FINISHED = threading.Event()
+_lock    = threading.Lock()
+_thread  = None
+
+
+#Modell-Dateien einmal öffnen (Seiten-Cache des Betriebssystems) und die erste Matplotlib-Figur zeichnen (Schriften)
+def _warm_models():
+    from sportfuel.compact import load_compact
+    from sportfuel.lookup import load_lookup
+    if os.path.exists(COMPACT_PATH):
+        load_compact(COMPACT_PATH)
+    if os.path.exists(LOOKUP_PATH):
+        load_lookup(LOOKUP_PATH)
+
+
+def _warm_charts():
+    from sportfuel.charts import macro_chart_png
+    macro_chart_png(1.0, 1.0, 1.0)
+
+
+TASKS = (("models", _warm_models), ("charts", _warm_charts))
+
+
+def _run(modules, tasks):
+    time.sleep(DELAY_S)
+    for name in modules:
+        t0 = time.perf_counter()
+        try:
+            importlib.import_module(name)
+        except Exception:    #fehlt ein optionales Paket, meldet es erst die Seite, die es braucht
+            continue
+        TIMINGS[name] = time.perf_counter() - t0
+    for name, task in tasks:
+        t0 = time.perf_counter()
+        try:
+            task()
+        except Exception:
+            continue
+        TIMINGS[name] = time.perf_counter() - t0
+    FINISHED.set()
+
+
+#Startet das Vorwärmen einmal pro Prozess (weitere Aufrufe tun nichts) und gibt den Thread zurück
+def start(modules=MODULES, tasks=TASKS):
+    global _thread
+    if not ENABLED:
+        return None
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_run, args=(modules, tasks), name="sportfuel-warmup", daemon=True)
+            _thread.start()
+    return _thread
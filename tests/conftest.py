@@ -0,0 +1,7 @@
+#Tests laufen aus dem Repo-Root (python -m pytest -q); die Stub-Server für die externen APIs liegen in benchmarks/
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
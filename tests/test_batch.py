@@ -0,0 +1,45 @@
+#Batch-Vorhersage: gleiche Reihenfolge wie estimate_calories auf der Vor_Workout Seite (Tabelle, Modell, Formel)
+import numpy as np
+import pandas as pd
+
+from sportfuel.batch import predict_file, predict_frame
+from sportfuel.calories import ACTIVITY_MAP, load_calorie_lookup, load_calorie_model
+
+
+#Einzelpfad wie auf der Seite, ohne Streamlit-Caches
+def page_estimate(lookup, model, sportart, gewicht, dauer, distanz):
+    if sportart not in ACTIVITY_MAP:    #gibt es auf der Seite nicht, die Formel kennt sie auch nicht
+        return np.nan, "formel"
+    activity = ACTIVITY_MAP[sportart]
+    cal_burn = lookup.predict_arrays(activity, gewicht, dauer, distanz)[0]
+    if not np.isnan(cal_burn):
+        return cal_burn, "tabelle"
+    X = pd.DataFrame([{"Activity": activity, "Gewicht": gewicht, "Dauer": dauer, "Distanz": distanz}])
+    return max(float(model.predict(X)[0]), 0.0), "modell"
+
+
+def make_plan():
+    return pd.DataFrame({
+        "sportart": ["Laufen", "Radfahren", "Schwimmen", "Laufen", "Radfahren", "Yoga"],
+        "gewicht":  [70, 82.5, 61, 70, 200, 70],
+        "dauer":    [60, 137, 45, 400, 90, 60],    #400 min und 200 kg liegen ausserhalb des Rasters
+        "distanz":  [10.0, 55.3, 2.5, 50.0, 30.0, 0.0],
+    })
+
+
+def test_batch_matches_page():
+    lookup, model = load_calorie_lookup(), load_calorie_model()
+    assert lookup is not None
+    plan = make_plan()
+    out  = predict_frame(model, plan, lookup)
+    assert out["quelle"].tolist() == ["tabelle", "tabelle", "tabelle", "modell", "modell", "formel"]
+    for row, kcal in zip(plan.itertuples(index=False), out["kcal"]):
+        ref, _ = page_estimate(lookup, model, row.sportart, row.gewicht, row.dauer, row.distanz)
+        assert np.isclose(kcal, ref, equal_nan=True)
+
+
+def test_predict_file_uses_lookup(tmp_path):
+    plan_path, out_path = str(tmp_path / "plan.csv"), str(tmp_path / "out.csv")
+    make_plan().to_csv(plan_path, index=False)
+    predict_file(plan_path, out_path, load_calorie_model(), chunksize=4, lookup=load_calorie_lookup())
+    assert pd.read_csv(out_path)["quelle"].tolist()[:3] == ["tabelle"] * 3
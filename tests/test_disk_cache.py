@@ -0,0 +1,94 @@
+#DiskCache: Ablauf (TTL), LRU-Eviction nach Grösse, mitgeführte Gesamtgrösse und gesammelte Lesezeitpunkte
+import json
+import time
+
+from sportfuel.disk_cache import DiskCache
+
+
+def entry_size(value):
+    return len(json.dumps(value, separators=(",", ":")))
+
+
+def table_size(cache):
+    return cache._conn().execute("SELECT COALESCE(SUM(size), 0) FROM cache").fetchone()[0]
+
+
+def test_ttl_expiry(tmp_path):
+    cache = DiskCache(str(tmp_path / "c.sqlite"))
+    cache.set("kurz", {"x": 1}, ttl=0.05)
+    cache.set("lang", {"x": 2}, ttl=60)
+    assert cache.get("kurz") == {"x": 1}
+    time.sleep(0.1)
+    assert cache.get("kurz") is None
+    assert cache.get("kurz", "fehlt") == "fehlt"
+    assert cache.get("lang") == {"x": 2}
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_lru_eviction_by_size(tmp_path):
+    value = {"daten": "x" * 100}
+    cache = DiskCache(str(tmp_path / "c.sqlite"), max_bytes=3 * entry_size(value))
+    for key in ("a", "b", "c"):
+        cache.set(key, value, ttl=60)
+        time.sleep(0.01)
+    assert cache.get("a") == value    #a ist jetzt zuletzt gelesen, noch nicht geschrieben (touch_interval)
+    time.sleep(0.01)
+    cache.set("d", value, ttl=60)     #zu gross -> Lesezeitpunkte schreiben, dann den ältesten (b) löschen
+    assert cache.get("b") is None
+    assert all(cache.get(k) == value for k in ("a", "c", "d"))
+    assert cache.stats()["entries"] == 3
+    assert cache.stats()["bytes"] <= cache.max_bytes
+
+
+def test_expired_entries_evicted_first(tmp_path):
+    value = {"daten": "x" * 100}
+    cache = DiskCache(str(tmp_path / "c.sqlite"), max_bytes=2 * entry_size(value))
+    cache.set("alt", value, ttl=0.01)
+    cache.set("b", value, ttl=60)
+    time.sleep(0.05)
+    cache.get("b")
+    cache.set("c", value, ttl=60)
+    assert cache.get("b") == value and cache.get("c") == value
+    assert cache.stats()["entries"] == 2
+
+
+def test_running_total_matches_table(tmp_path):
+    path = str(tmp_path / "c.sqlite")
+    cache = DiskCache(path, max_bytes=2000)
+    other = DiskCache(path, max_bytes=2000)    #zweiter Worker auf derselben Datei
+    for i in range(40):
+        (cache if i % 2 else other).set(f"k{i % 25}", {"i": i, "pad": "y" * (i * 7 % 90)}, ttl=60)
+    cache.set("k1", {"gross": "z" * 300}, ttl=60)    #Überschreiben ändert die Grösse
+    cache.clear()
+    cache.set("neu", [1, 2, 3], ttl=60)
+    assert cache.stats()["bytes"] == other.stats()["bytes"] == table_size(cache)
+    assert table_size(cache) <= 2000
+
+
+def test_existing_cache_gets_running_total(tmp_path):
+    path = str(tmp_path / "c.sqlite")
+    cache = DiskCache(path)
+    cache.set("a", {"x": 1}, ttl=60)
+    con = cache._conn()
+    con.execute("DROP TABLE cache_size")    #Zustand einer Datenbank von vor der mitgeführten Gesamtgrösse
+    for trigger in ("cache_size_insert", "cache_size_delete", "cache_size_update"):
+        con.execute(f"DROP TRIGGER {trigger}")
+    reopened = DiskCache(path)
+    assert reopened.stats()["bytes"] == table_size(reopened) > 0
+
+
+def test_hits_do_not_write_until_interval(tmp_path):
+    path = str(tmp_path / "c.sqlite")
+    cache = DiskCache(path, touch_interval=3600)
+    cache.set("a", {"x": 1}, ttl=60)
+    con = cache._conn()
+    before = con.total_changes
+    for _ in range(50):
+        assert cache.get("a") == {"x": 1}
+    assert con.total_changes == before    #Treffer lesen nur
+
+    cache.touch_interval = 0
+    t0 = time.time()
+    cache.get("a")
+    assert con.total_changes == before + 1    #ein UPDATE für alle gesammelten Lesezeitpunkte
+    assert con.execute("SELECT accessed FROM cache WHERE key = 'a'").fetchone()[0] >= t0
@@ -0,0 +1,69 @@
+#FdcClient gegen den lokalen FDC-Stub: Bulk-Abfrage /foods, Rückfall auf parallele Einzelabfragen, Cache-Zähler und TTL
+import time
+
+import pytest
+from stubs import start_fdc_stub
+
+from sportfuel import fdc
+from sportfuel.disk_cache import DiskCache
+from sportfuel.fdc import BULK_MAX, FdcClient
+
+
+@pytest.fixture
+def stub():
+    server, url = start_fdc_stub()
+    yield server, url
+    server.shutdown()
+
+
+@pytest.fixture
+def client(stub, tmp_path):
+    _, url = stub
+    return FdcClient("test", base_url=url, cache=DiskCache(str(tmp_path / "cache.sqlite")))
+
+
+def test_bulk_foods_in_order(stub, client):
+    server, _ = stub
+    fids = list(range(1, 46)) + [3, 7]    #Duplikate werden nur einmal geholt
+    foods = client.get_foods_details(fids)
+    assert [f["fdcId"] for f in foods] == fids
+    assert server.calls == -(-45 // BULK_MAX)    #45 IDs -> 3 Bulk-Anfragen, keine Einzelabfragen
+    assert server.requests == server.calls
+
+    again = client.get_foods_details(fids)
+    assert again == foods
+    assert server.requests == server.calls    #alles aus dem Cache
+
+
+def test_bulk_fallback_to_thread_pool(stub, client):
+    server, _ = stub
+    server.bulk = False    #/foods antwortet mit 404
+    fids = list(range(100, 130))
+    foods = client.get_foods_details(fids)
+    assert [f["fdcId"] for f in foods] == fids
+    assert server.calls == 0
+    assert server.requests == 1 + len(fids)    #ein fehlgeschlagener Bulk-Aufruf, dann Einzelabfragen
+    assert client.requests == len(fids)
+
+
+def test_hit_miss_counters(stub, client):
+    server, _ = stub
+    client.search_foods("banana")
+    client.search_foods(" Banana ")    #gleicher Schlüssel
+    client.get_food_details(5)
+    client.get_foods_details([5, 6])
+    stats = client.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 3)
+    assert stats["http_requests"] == server.requests == 3
+    assert stats["entries"] == 3
+
+
+def test_search_ttl_expiry(stub, client, monkeypatch):
+    server, _ = stub
+    monkeypatch.setattr(fdc, "SEARCH_TTL", 0.05)
+    client.search_foods("gel")
+    client.search_foods("gel")
+    assert server.requests == 1
+    time.sleep(0.1)
+    client.search_foods("gel")
+    assert server.requests == 2
@@ -0,0 +1,62 @@
+#GPX-Export: Download als bytes (Datei wieder geschlossen), Zeiten mit Millisekunden, Aufräumen behält die gerade erzeugte Datei, gelöschte Dateien werden neu erzeugt
+import os
+import numpy as np
+
+from synthetic import make_gpx_bytes
+from sportfuel import gpx_export
+from sportfuel.gpx_export import read_export
+from sportfuel.gpx_stream import parse_gpx
+
+
+def make_track():
+    return parse_gpx(make_gpx_bytes(500, seed=1, segments=2))
+
+
+def test_read_export_returns_bytes(tmp_path):
+    track = make_track()
+    calls = []
+
+    def waypoints():
+        calls.append(1)
+        return ""
+
+    data = read_export(("a",), track, waypoints, export_dir=str(tmp_path))
+    assert read_export(("a",), track, waypoints, export_dir=str(tmp_path)) == data
+    assert len(calls) == 1    #zweiter Klick liest nur die Datei
+    assert len(parse_gpx(data)) == len(track)
+
+
+def test_subsecond_times_round_trip(tmp_path):
+    track = parse_gpx(make_gpx_bytes(100, seed=3, segments=2, interval=0.05))    #20 Hz, 4.95 s
+    back  = parse_gpx(read_export(("20hz",), track, lambda: "", export_dir=str(tmp_path)))
+    assert np.allclose(back.time, track.time, rtol=0, atol=1e-3)
+    assert np.all(np.diff(back.time) > 0)    #keine wiederholten Zeitstempel
+    assert np.allclose(back.coords, track.coords, rtol=0, atol=1e-7)
+    assert np.allclose(back.ele, track.ele, rtol=0, atol=0.05)
+
+
+def test_prune_keeps_current(tmp_path):
+    paths = [str(tmp_path / f"{i}.gpx") for i in range(4)]
+    for i, path in enumerate(paths):
+        open(path, "wb").close()
+        os.utime(path, (i + 10, i + 10))
+    os.utime(paths[0], (0, 0))    #gerade geschrieben, aber ältester mtime (z.B. Uhr eines anderen Workers)
+    gpx_export._prune(str(tmp_path), 2, current=paths[0])
+    assert sorted(os.listdir(tmp_path)) == ["0.gpx", "3.gpx"]
+
+
+def test_read_export_regenerates_deleted_file(tmp_path, monkeypatch):
+    track = make_track()
+    real_cached = gpx_export.cached_export
+    deleted = []
+
+    def cached_then_deleted(*args, **kwargs):    #anderer Worker räumt zwischen cached_export und open auf
+        path = real_cached(*args, **kwargs)
+        if not deleted:
+            os.remove(path)
+            deleted.append(path)
+        return path
+
+    monkeypatch.setattr(gpx_export, "cached_export", cached_then_deleted)
+    assert len(parse_gpx(read_export(("b",), track, lambda: "", export_dir=str(tmp_path)))) == len(track)
+    assert deleted